@@ -0,0 +1,13 @@
+# SPDX-FileCopyrightText: 2026 spdx contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+from beartype.typing import List, Tuple
+
+# the number of chunks per worker into which the lists of elements are split for the process pools
+CHUNKS_PER_WORKER = 4
+
+
+def get_chunk_ranges(number_of_elements: int, workers: int) -> List[Tuple[int, int]]:
+    # a few chunks per worker balance the load if some elements are more expensive to process than others
+    chunk_size = max(1, -(-number_of_elements // (workers * CHUNKS_PER_WORKER)))
+    return [(start, min(start + chunk_size, number_of_elements)) for start in range(0, number_of_elements, chunk_size)]
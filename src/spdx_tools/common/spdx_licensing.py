@@ -1,7 +1,22 @@
 # SPDX-FileCopyrightText: 2023 spdx contributors
 #
 # SPDX-License-Identifier: Apache-2.0
-from license_expression import get_spdx_licensing
+from functools import lru_cache
+
+from license_expression import LicenseExpression, get_spdx_licensing
 
 # this getter takes quite long so we only call it once in this singleton module
 spdx_licensing = get_spdx_licensing()
+
+LICENSE_EXPRESSION_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=LICENSE_EXPRESSION_CACHE_SIZE)
+def parse_license_expression_str(license_expression: str) -> LicenseExpression:
+    """
+    Parses the license expression with spdx_licensing and keeps the result in an LRU cache that is shared by all
+    parsers of the process. The same expression strings occur in many packages, files and snippets and across
+    documents, so each of them is only parsed once and all elements with this expression share one LicenseExpression
+    object. Expressions that can't be parsed are not cached, the ExpressionError is raised on each call.
+    """
+    return spdx_licensing.parse(license_expression)
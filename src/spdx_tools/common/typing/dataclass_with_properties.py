@@ -1,23 +1,50 @@
 # SPDX-FileCopyrightText: 2022 spdx contributors
 #
 # SPDX-License-Identifier: Apache-2.0
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 
 from beartype import beartype
 from beartype.roar import BeartypeCallHintParamViolation
 
 
-def dataclass_with_properties(cls):
+def dataclass_with_properties(cls=None, *, slots: bool = False):
     """Decorator to generate a dataclass with properties out of the class' value:type list.
-    Their getters and setters will be subjected to the @typechecked decorator to ensure type conformity."""
-    data_cls = dataclass(cls)
-    for field_name, field_type in data_cls.__annotations__.items():
-        set_field = make_setter(field_name, field_type)
-        get_field = make_getter(field_name, field_type)
+    Their getters and setters will be subjected to the @typechecked decorator to ensure type conformity.
+    With slots=True, the values are stored in __slots__ instead of an instance __dict__, which considerably reduces
+    the memory footprint of classes with many instances. Instances of such classes can't have additional attributes.
+    """
 
-        setattr(data_cls, field_name, property(get_field, set_field))
+    def wrap(cls):
+        data_cls = dataclass(cls)
+        if slots:
+            data_cls = add_slots(data_cls)
+        for field_name, field_type in data_cls.__annotations__.items():
+            set_field = make_setter(field_name, field_type)
+            get_field = make_getter(field_name, field_type)
 
-    return data_cls
+            setattr(data_cls, field_name, property(get_field, set_field))
+
+        return data_cls
+
+    if cls is None:
+        return wrap
+    return wrap(cls)
+
+
+def add_slots(data_cls):
+    """helper method to recreate the dataclass with a slot for the value of each property, as __slots__ has to be
+    defined when a class is created"""
+    class_dict = dict(data_cls.__dict__)
+    class_dict["__slots__"] = tuple(f"_{field.name}" for field in fields(data_cls))
+    # the default values are class attributes that will be replaced by the properties anyway
+    for field in fields(data_cls):
+        class_dict.pop(field.name, None)
+    class_dict.pop("__dict__", None)
+    class_dict.pop("__weakref__", None)
+
+    slotted_cls = type(data_cls)(data_cls.__name__, data_cls.__bases__, class_dict)
+    slotted_cls.__qualname__ = data_cls.__qualname__
+    return slotted_cls
 
 
 def make_setter(field_name, field_type):
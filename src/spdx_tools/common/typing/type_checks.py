@@ -1,12 +1,19 @@
 # SPDX-FileCopyrightText: 2023 spdx contributors
 #
 # SPDX-License-Identifier: Apache-2.0
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import fields
+from functools import lru_cache
+from itertools import repeat
+from types import UnionType
 
-from beartype.typing import Any, Dict
+from beartype.typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union, get_args, get_origin
 
 from spdx_tools.common.typing.constructor_type_errors import ConstructorTypeErrors
 
+_type_checks_enabled: ContextVar[bool] = ContextVar("type_checks_enabled", default=True)
+
 
 def check_types_and_set_values(instance_under_construction: Any, local_variables: Dict) -> None:
     """
@@ -17,10 +24,16 @@ def check_types_and_set_values(instance_under_construction: Any, local_variables
     return all type violations in one go.
     As an aside, defining constructors "manually" using this utility method helps avoid a nasty PyCharm bug:
     https://youtrack.jetbrains.com/issue/PY-34569
+    Inside of a type_checks_disabled() block, the values are set without any type checks.
     """
+    if not _type_checks_enabled.get():
+        for key, backing_attribute_name in _get_field_names(type(instance_under_construction)):
+            # bypass the property setters by setting the backing attributes directly
+            setattr(instance_under_construction, backing_attribute_name, local_variables.get(key))
+        return
+
     errors = []
-    for field in fields(instance_under_construction):
-        key = field.name
+    for key, _ in _get_field_names(type(instance_under_construction)):
         value = local_variables.get(key)
         try:
             setattr(instance_under_construction, key, value)
@@ -29,3 +42,93 @@ def check_types_and_set_values(instance_under_construction: Any, local_variables
             errors.append(error_message)
     if errors:
         raise ConstructorTypeErrors(errors)
+
+
+@contextmanager
+def type_checks_disabled() -> Iterator[None]:
+    """
+    Trusted construction path: objects constructed inside of this block skip the runtime type checks of their
+    fields, which make up most of the construction time. This is only safe if the types of all arguments are already
+    known to be correct; otherwise, call check_types() on the constructed objects afterwards.
+    The setters of the constructed objects are still type checked.
+    """
+    token = _type_checks_enabled.set(False)
+    try:
+        yield
+    finally:
+        _type_checks_enabled.reset(token)
+
+
+def check_types(instance: Any) -> None:
+    """
+    Checks the types of all field values of the given instance, e.g. after it has been constructed inside of a
+    type_checks_disabled() block, and raises a ConstructorTypeErrors instance with all type violations.
+    Values that pass a plain isinstance check against their field type are accepted right away, only the remaining
+    values go through the type-checked setters, which also produce the error messages.
+    """
+    errors = []
+    for field_name, fast_type_check in _get_fast_type_checks(type(instance)):
+        value = getattr(instance, f"_{field_name}")
+        if fast_type_check and fast_type_check(value):
+            continue
+        try:
+            setattr(instance, field_name, value)
+        except TypeError as err:
+            errors.append(err.args[0])
+    if errors:
+        raise ConstructorTypeErrors(errors)
+
+
+@lru_cache(maxsize=None)
+def _get_field_names(cls: type) -> List[Tuple[str, str]]:
+    # the names of the fields and of the attributes in which their properties store the values
+    return [(field.name, f"_{field.name}") for field in fields(cls)]
+
+
+@lru_cache(maxsize=None)
+def _get_fast_type_checks(cls: type) -> List[Tuple[str, Optional[Callable[[Any], bool]]]]:
+    return [(field.name, _get_fast_type_check(field.type)) for field in fields(cls)]
+
+
+def _get_fast_type_check(field_type: Any) -> Optional[Callable[[Any], bool]]:
+    """
+    Returns a function that accepts a value if it is an instance of the given type (a class, or unions, lists and
+    tuples of those), which is never more lenient than beartype. Returns None for types that are not supported.
+    """
+    classes = _get_classes(field_type)
+    if classes:
+        return lambda value: isinstance(value, classes)
+
+    origin = get_origin(field_type)
+    type_arguments = get_args(field_type)
+    item_type_checks = [_get_fast_type_check(type_argument) for type_argument in type_arguments]
+    if origin is None or None in item_type_checks:
+        return None
+
+    if origin in (Union, UnionType):
+        return lambda value: any(item_type_check(value) for item_type_check in item_type_checks)
+    if origin is list and len(type_arguments) == 1:
+        item_classes = _get_classes(type_arguments[0])
+        if item_classes:
+            return lambda value: isinstance(value, list) and all(map(isinstance, value, repeat(item_classes)))
+        item_type_check = item_type_checks[0]
+        return lambda value: isinstance(value, list) and all(map(item_type_check, value))
+    if origin is tuple:
+        return lambda value: (
+            isinstance(value, tuple)
+            and len(value) == len(item_type_checks)
+            and all(item_type_check(item) for item_type_check, item in zip(item_type_checks, value))
+        )
+    return None
+
+
+def _get_classes(field_type: Any) -> Optional[Tuple[type, ...]]:
+    # returns the classes of a type that is a plain class or a union of plain classes, so that a single isinstance
+    # call suffices to check a value
+    if isinstance(field_type, type) and not get_origin(field_type):
+        return (field_type,)
+    if get_origin(field_type) in (Union, UnionType):
+        type_arguments = get_args(field_type)
+        if all(isinstance(type_argument, type) and not get_origin(type_argument) for type_argument in type_arguments):
+            return type_arguments
+    return None
@@ -27,6 +27,7 @@ from spdx_tools.spdx.model import Document
 from spdx_tools.spdx.parser.error import SPDXParsingError
 from spdx_tools.spdx.parser.parse_anything import parse_file
 from spdx_tools.spdx.validation.document_validator import validate_full_spdx_document
+from spdx_tools.spdx.validation.license_expression_validator import get_invalid_symbols_and_parse_error
 from spdx_tools.spdx.validation.validation_message import ValidationMessage
 from spdx_tools.spdx.writer.tagvalue import tagvalue_writer
 from spdx_tools.spdx.writer.write_anything import write_file
@@ -47,6 +48,25 @@ from spdx_tools.spdx.writer.write_anything import write_file
     default=None,
 )
 @click.option("--novalidation", is_flag=True, help="Don't validate the provided document.")
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=1,
+    help="The number of processes used to validate the packages, files, snippets and relationships of the document.",
+)
+@click.option(
+    "--max-messages",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Stop the validation after this number of issues has been found.",
+)
+@click.option(
+    "--fail-fast",
+    is_flag=True,
+    default=False,
+    help="Stop the validation at the first issue found (same as --max-messages 1).",
+)
 @click.option(
     "--graph",
     is_flag=True,
@@ -55,7 +75,16 @@ from spdx_tools.spdx.writer.write_anything import write_file
     "The generated graph is saved to the file specified with --outfile. "
     "Note: You need to install the optional dependencies 'networkx' and 'pygraphviz' for this feature.",
 )
-def main(infile: str, outfile: str, version: str, novalidation: bool, graph: bool):
+def main(
+    infile: str,
+    outfile: str,
+    version: str,
+    novalidation: bool,
+    jobs: int,
+    max_messages: int,
+    fail_fast: bool,
+    graph: bool,
+):
     """
     CLI-tool for validating SPDX documents and converting between RDF, TAG-VALUE, JSON, YAML and XML formats.
     Formats are determined by the file endings.
@@ -72,7 +101,10 @@ def main(infile: str, outfile: str, version: str, novalidation: bool, graph: boo
                 logging.error(f"This tool only supports SPDX versions SPDX-2.2 and SPDX-2.3, but got: {version}")
                 sys.exit(1)
 
-            validation_messages: List[ValidationMessage] = validate_full_spdx_document(document, version)
+            validation_messages: List[ValidationMessage] = validate_full_spdx_document(
+                document, version, workers=jobs, max_messages=max_messages, fail_fast=fail_fast
+            )
+            logging.debug(f"License expression validation cache: {get_invalid_symbols_and_parse_error.cache_info()}")
             if validation_messages:
                 log_string = "\n".join(
                     ["The document is invalid. The following issues have been found:"]
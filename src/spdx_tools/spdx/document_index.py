@@ -0,0 +1,108 @@
+# SPDX-FileCopyrightText: 2026 spdx contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+from beartype.typing import Dict, List, Optional, Set, Type, Union
+
+from spdx_tools.spdx.model import Annotation, Document, File, Package, Relationship, RelationshipType, Snippet
+
+
+class DocumentIndex:
+    """
+    Lookup tables for a single document that are computed once in a single pass over its element, annotation and
+    relationship lists. All lookups are then performed in constant time (or in time proportional to the size of the
+    result), instead of rescanning the document's lists for every query.
+    The index is a snapshot: if the document is modified after the index has been built, a new index must be created.
+    """
+
+    document_spdx_id: str
+    elements_by_spdx_id: Dict[str, Union[Package, File, Snippet]]
+    element_types_by_spdx_id: Dict[str, Union[Type[Package], Type[File], Type[Snippet]]]
+    spdx_ids: Set[str]
+    file_spdx_ids: Set[str]
+    external_document_ref_ids: Set[str]
+    extracted_license_ids: Set[str]
+    annotations_by_spdx_id: Dict[str, List[Annotation]]
+    relationships_by_origin: Dict[str, List[Relationship]]
+    relationships_by_target: Dict[str, List[Relationship]]
+    relationships_by_type: Dict[RelationshipType, List[Relationship]]
+
+    def __init__(self, document: Document):
+        self.document_spdx_id = document.creation_info.spdx_id
+
+        # the order of insertion mirrors document_utils.get_contained_spdx_elements (later entries win) and
+        # spdx_element_utils.get_element_type_from_spdx_id (earlier entries win) for duplicated ids
+        self.elements_by_spdx_id = {}
+        self.element_types_by_spdx_id = {}
+        for element_type, elements in [
+            (Package, document.packages),
+            (File, document.files),
+            (Snippet, document.snippets),
+        ]:
+            for element in elements:
+                self.elements_by_spdx_id[element.spdx_id] = element
+                self.element_types_by_spdx_id.setdefault(element.spdx_id, element_type)
+
+        self.spdx_ids = {self.document_spdx_id}
+        self.spdx_ids.update(self.elements_by_spdx_id.keys())
+        self.file_spdx_ids = {file.spdx_id for file in document.files}
+        self.external_document_ref_ids = {
+            external_document_ref.document_ref_id
+            for external_document_ref in document.creation_info.external_document_refs
+        }
+        self.extracted_license_ids = {
+            extracted_licensing_info.license_id for extracted_licensing_info in document.extracted_licensing_info
+        }
+
+        self.annotations_by_spdx_id = {}
+        for annotation in document.annotations:
+            self.annotations_by_spdx_id.setdefault(annotation.spdx_id, []).append(annotation)
+
+        self.relationships_by_origin = {}
+        self.relationships_by_target = {}
+        self.relationships_by_type = {}
+        for relationship in document.relationships:
+            self.relationships_by_origin.setdefault(relationship.spdx_element_id, []).append(relationship)
+            # targets that are SpdxNone or SpdxNoAssertion do not reference an element and are not indexed
+            if isinstance(relationship.related_spdx_element_id, str):
+                self.relationships_by_target.setdefault(relationship.related_spdx_element_id, []).append(relationship)
+            self.relationships_by_type.setdefault(relationship.relationship_type, []).append(relationship)
+
+    def get_element(self, spdx_id: str) -> Union[Package, File, Snippet, None]:
+        if not isinstance(spdx_id, str):
+            return None
+        return self.elements_by_spdx_id.get(spdx_id)
+
+    def get_element_type(self, spdx_id: str) -> Optional[Union[Type[Package], Type[File], Type[Snippet]]]:
+        if not isinstance(spdx_id, str):
+            # relationship targets can be SpdxNone or SpdxNoAssertion, which are not hashable
+            return None
+        return self.element_types_by_spdx_id.get(spdx_id)
+
+    def contains_spdx_id(self, spdx_id: str) -> bool:
+        return spdx_id in self.spdx_ids
+
+    def contains_file_spdx_id(self, spdx_id: str) -> bool:
+        return spdx_id in self.file_spdx_ids
+
+    def contains_external_document_ref_id(self, external_document_ref_id: str) -> bool:
+        return external_document_ref_id in self.external_document_ref_ids
+
+    def contains_extracted_license_id(self, license_id: str) -> bool:
+        return license_id in self.extracted_license_ids
+
+    def get_annotations(self, spdx_id: str) -> List[Annotation]:
+        return self.annotations_by_spdx_id.get(spdx_id, [])
+
+    def filter_by_type_and_origin(self, relationship_type: RelationshipType, origin_id: str) -> List[Relationship]:
+        return [
+            relationship
+            for relationship in self.relationships_by_origin.get(origin_id, [])
+            if relationship.relationship_type == relationship_type
+        ]
+
+    def filter_by_type_and_target(self, relationship_type: RelationshipType, target_id: str) -> List[Relationship]:
+        return [
+            relationship
+            for relationship in self.relationships_by_target.get(target_id, [])
+            if relationship.relationship_type == relationship_type
+        ]
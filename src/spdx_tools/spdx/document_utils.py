@@ -1,11 +1,12 @@
 # SPDX-FileCopyrightText: 2022 spdx contributors
 #
 # SPDX-License-Identifier: Apache-2.0
-from copy import deepcopy
+from copy import copy
+from dataclasses import fields, is_dataclass
 
 from beartype.typing import Any, Dict, List, Union
 
-from spdx_tools.spdx.model import Document, File, Package, Snippet
+from spdx_tools.spdx.model import Document, File, Package, Snippet, SpdxNoAssertion, SpdxNone
 
 
 def get_contained_spdx_element_ids(document: Document) -> List[str]:
@@ -31,27 +32,67 @@ def get_contained_spdx_elements(document: Document) -> Dict[str, Union[Package,
 
 
 def create_document_without_duplicates(document: Document) -> Document:
-    document_without_duplicates = deepcopy(document)
-    for elements in [
-        [document_without_duplicates.creation_info],
-        document_without_duplicates.files,
-        document_without_duplicates.packages,
-        document_without_duplicates.snippets,
-        document_without_duplicates.extracted_licensing_info,
-    ]:
-        for element in elements:
-            for key, value in element.__dict__.items():
-                if isinstance(value, list):
-                    value_without_duplicates = create_list_without_duplicates(value)
-                    setattr(element, key, value_without_duplicates)
+    """
+    Returns a document in which the list fields of the creation info, files, packages, snippets and extracted
+    licensing info contain no duplicates. The given document is not modified. Only the elements that contain
+    duplicates are replaced by shallow copies with deduplicated lists, all other objects are shared between both
+    documents, so that no deep copy of the document is needed.
+    """
+    document_without_duplicates = copy(document)
+    document_without_duplicates.creation_info = _create_element_without_duplicates(document.creation_info)
+    for field_name in ["files", "packages", "snippets", "extracted_licensing_info"]:
+        elements = getattr(document, field_name)
+        elements_without_duplicates = [_create_element_without_duplicates(element) for element in elements]
+        if any(
+            element_without_duplicates is not element
+            for element_without_duplicates, element in zip(elements_without_duplicates, elements)
+        ):
+            setattr(document_without_duplicates, field_name, elements_without_duplicates)
 
     return document_without_duplicates
 
 
+def _create_element_without_duplicates(element: Any) -> Any:
+    element_without_duplicates = element
+    for field in fields(element):
+        value = getattr(element, field.name)
+        if isinstance(value, list) and len(value) > 1:
+            value_without_duplicates = create_list_without_duplicates(value)
+            if len(value_without_duplicates) < len(value):
+                if element_without_duplicates is element:
+                    element_without_duplicates = copy(element)
+                setattr(element_without_duplicates, field.name, value_without_duplicates)
+
+    return element_without_duplicates
+
+
 def create_list_without_duplicates(list_with_potential_duplicates: List[Any]) -> List[Any]:
     list_without_duplicates = []
+    keys = set()
+    unhashable_elements = []
     for element in list_with_potential_duplicates:
-        if element not in list_without_duplicates:
-            list_without_duplicates.append(element)
+        key = _get_hashable_key(element)
+        try:
+            if key in keys:
+                continue
+            keys.add(key)
+        except TypeError:
+            # values without a hash are compared one by one, as before
+            if element in unhashable_elements:
+                continue
+            unhashable_elements.append(element)
+        list_without_duplicates.append(element)
 
     return list_without_duplicates
+
+
+def _get_hashable_key(value: Any) -> Any:
+    # a key that is equal for two values if and only if the values are equal, as the model classes are dataclasses
+    # that are compared by the values of their fields and therefore have no hash
+    if is_dataclass(value):
+        return type(value), tuple(_get_hashable_key(getattr(value, field.name)) for field in fields(value))
+    if isinstance(value, list):
+        return list, tuple(_get_hashable_key(item) for item in value)
+    if isinstance(value, (SpdxNone, SpdxNoAssertion)):
+        return type(value)
+    return value
@@ -9,7 +9,7 @@ try:
     from networkx import DiGraph
 except ImportError:
     DiGraph = None
-from spdx_tools.spdx.document_utils import get_contained_spdx_elements
+from spdx_tools.spdx.document_index import DocumentIndex
 from spdx_tools.spdx.model import Document, Relationship
 
 
@@ -28,13 +28,12 @@ def generate_relationship_graph_from_spdx(document: Document) -> DiGraph:
     graph = DiGraph()
     graph.add_node(document.creation_info.spdx_id, element=document.creation_info)
 
-    contained_elements: Dict[str, Union[Package, File, Snippet]] = get_contained_spdx_elements(document)
+    document_index = DocumentIndex(document)
+    contained_elements: Dict[str, Union[Package, File, Snippet]] = document_index.elements_by_spdx_id
     contained_element_nodes = [(spdx_id, {"element": element}) for spdx_id, element in contained_elements.items()]
     graph.add_nodes_from(contained_element_nodes)
 
-    relationships_by_spdx_id: Dict[str, List[Relationship]] = dict()
-    for relationship in document.relationships:
-        relationships_by_spdx_id.setdefault(relationship.spdx_element_id, []).append(relationship)
+    relationships_by_spdx_id: Dict[str, List[Relationship]] = document_index.relationships_by_origin
 
     for spdx_id, relationships in relationships_by_spdx_id.items():
         if spdx_id not in graph.nodes():
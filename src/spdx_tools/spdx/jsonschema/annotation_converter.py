@@ -4,6 +4,7 @@
 from beartype.typing import Any, Type
 
 from spdx_tools.spdx.datetime_conversions import datetime_to_iso_string
+from spdx_tools.spdx.document_index import DocumentIndex
 from spdx_tools.spdx.jsonschema.annotation_properties import AnnotationProperty
 from spdx_tools.spdx.jsonschema.converter import TypedConverter
 from spdx_tools.spdx.jsonschema.json_property import JsonProperty
@@ -12,7 +13,11 @@ from spdx_tools.spdx.model import Annotation, Document
 
 class AnnotationConverter(TypedConverter[Annotation]):
     def _get_property_value(
-        self, annotation: Annotation, annotation_property: AnnotationProperty, document: Document | None = None
+        self,
+        annotation: Annotation,
+        annotation_property: AnnotationProperty,
+        document: Document | None = None,
+        document_index: DocumentIndex | None = None,
     ) -> Any:
         if annotation_property == AnnotationProperty.ANNOTATION_DATE:
             return datetime_to_iso_string(annotation.annotation_date)
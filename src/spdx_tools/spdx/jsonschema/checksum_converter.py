@@ -3,6 +3,7 @@
 # SPDX-License-Identifier: Apache-2.0
 from beartype.typing import Type
 
+from spdx_tools.spdx.document_index import DocumentIndex
 from spdx_tools.spdx.jsonschema.checksum_properties import ChecksumProperty
 from spdx_tools.spdx.jsonschema.converter import TypedConverter
 from spdx_tools.spdx.jsonschema.json_property import JsonProperty
@@ -17,7 +18,11 @@ class ChecksumConverter(TypedConverter[Checksum]):
         return ChecksumProperty
 
     def _get_property_value(
-        self, checksum: Checksum, checksum_property: ChecksumProperty, _document: Document | None = None
+        self,
+        checksum: Checksum,
+        checksum_property: ChecksumProperty,
+        _document: Document | None = None,
+        _document_index: DocumentIndex | None = None,
     ) -> str:
         if checksum_property == ChecksumProperty.ALGORITHM:
             return algorithm_to_json_string(checksum.algorithm)
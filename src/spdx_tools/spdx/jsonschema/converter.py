@@ -6,6 +6,7 @@ from abc import ABC, abstractmethod
 from beartype.typing import Any, Dict, Generic, Type, TypeVar
 
 from spdx_tools.spdx.casing_tools import snake_case_to_camel_case
+from spdx_tools.spdx.document_index import DocumentIndex
 from spdx_tools.spdx.jsonschema.json_property import JsonProperty
 from spdx_tools.spdx.model import Document
 
@@ -25,15 +26,22 @@ class TypedConverter(ABC, Generic[T]):
     json schema. The default implementation simply converts from snake case to camel case. Can be overridden in case
     of exceptions like "SPDXID".
     - convert: converts an instance of type T (one of the data model types) to a dictionary representation. In some
-    cases, the full document is required (see below). The logic should be generic for all types.
+    cases, the full document is required (see below). The logic should be generic for all types. A DocumentIndex of
+    the full document can be passed along to avoid rebuilding it for every converted element.
     - requires_full_document: indicates whether the full document is required for conversion. Returns False by
     default, can be overridden as needed for specific types.
     - _get_property_value: Retrieves the value of a specific json property from the data model instance. In some
-    cases, the full document is required.
+    cases, the full document (and its DocumentIndex) is required.
     """
 
     @abstractmethod
-    def _get_property_value(self, instance: T, json_property: JsonProperty, document: Document | None = None) -> Any:
+    def _get_property_value(
+        self,
+        instance: T,
+        json_property: JsonProperty,
+        document: Document | None = None,
+        document_index: DocumentIndex | None = None,
+    ) -> Any:
         raise NotImplementedError(MISSING_IMPLEMENTATION_MESSAGE)
 
     @abstractmethod
@@ -50,7 +58,9 @@ class TypedConverter(ABC, Generic[T]):
     def requires_full_document(self) -> bool:
         return False
 
-    def convert(self, instance: T, document: Document | None = None) -> Dict:
+    def convert(
+        self, instance: T, document: Document | None = None, document_index: DocumentIndex | None = None
+    ) -> Dict:
         if not isinstance(instance, self.get_data_model_type()):
             raise TypeError(
                 f"Converter of type {self.__class__} can only convert objects of type "
@@ -58,10 +68,12 @@ class TypedConverter(ABC, Generic[T]):
             )
         if self.requires_full_document() and not document:
             raise ValueError(f"Converter of type {self.__class__} requires the full document")
+        if self.requires_full_document() and not document_index:
+            document_index = DocumentIndex(document)
 
         result = {}
         for property_name in self.get_json_type():
-            property_value = self._get_property_value(instance, property_name, document)
+            property_value = self._get_property_value(instance, property_name, document, document_index)
             if property_value is None:
                 continue
             result[self.json_property_name(property_name)] = property_value
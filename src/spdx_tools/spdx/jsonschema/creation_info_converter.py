@@ -4,6 +4,7 @@
 from beartype.typing import Any, Type
 
 from spdx_tools.spdx.datetime_conversions import datetime_to_iso_string
+from spdx_tools.spdx.document_index import DocumentIndex
 from spdx_tools.spdx.jsonschema.converter import TypedConverter
 from spdx_tools.spdx.jsonschema.creation_info_properties import CreationInfoProperty
 from spdx_tools.spdx.jsonschema.json_property import JsonProperty
@@ -23,6 +24,7 @@ class CreationInfoConverter(TypedConverter[CreationInfo]):
         creation_info: CreationInfo,
         creation_info_property: CreationInfoProperty,
         _document: Document | None = None,
+        _document_index: DocumentIndex | None = None,
     ) -> Any:
         if creation_info_property == CreationInfoProperty.CREATED:
             return datetime_to_iso_string(creation_info.created)
@@ -1,9 +1,9 @@
 # SPDX-FileCopyrightText: 2022 spdx contributors
 #
 # SPDX-License-Identifier: Apache-2.0
-from beartype.typing import Any, Type
+from beartype.typing import Any, Dict, Type
 
-from spdx_tools.spdx.document_utils import get_contained_spdx_element_ids
+from spdx_tools.spdx.document_index import DocumentIndex
 from spdx_tools.spdx.jsonschema.annotation_converter import AnnotationConverter
 from spdx_tools.spdx.jsonschema.converter import TypedConverter
 from spdx_tools.spdx.jsonschema.creation_info_converter import CreationInfoConverter
@@ -44,21 +44,32 @@ class DocumentConverter(TypedConverter[Document]):
     def get_data_model_type(self) -> Type[Document]:
         return Document
 
+    def convert(
+        self, document: Document, _document: Document | None = None, document_index: DocumentIndex | None = None
+    ) -> Dict:
+        # the index is shared by the converters of all contained elements so that the document is only scanned once
+        if isinstance(document, Document) and not document_index:
+            document_index = DocumentIndex(document)
+        return super().convert(document, _document, document_index)
+
     def json_property_name(self, document_property: DocumentProperty) -> str:
         if document_property == DocumentProperty.SPDX_ID:
             return "SPDXID"
         return super().json_property_name(document_property)
 
     def _get_property_value(
-        self, document: Document, document_property: DocumentProperty, _document: Document | None = None
+        self,
+        document: Document,
+        document_property: DocumentProperty,
+        _document: Document | None = None,
+        document_index: DocumentIndex | None = None,
     ) -> Any:
         if document_property == DocumentProperty.SPDX_ID:
             return document.creation_info.spdx_id
         elif document_property == DocumentProperty.ANNOTATIONS:
             # annotations referencing files, packages or snippets will be added to those elements directly
-            element_ids = get_contained_spdx_element_ids(document)
             document_annotations = filter(
-                lambda annotation: annotation.spdx_id not in element_ids, document.annotations
+                lambda annotation: annotation.spdx_id not in document_index.elements_by_spdx_id, document.annotations
             )
             return [self.annotation_converter.convert(annotation) for annotation in document_annotations] or None
         elif document_property == DocumentProperty.COMMENT:
@@ -84,11 +95,15 @@ class DocumentConverter(TypedConverter[Document]):
         elif document_property == DocumentProperty.DOCUMENT_NAMESPACE:
             return document.creation_info.document_namespace
         elif document_property == DocumentProperty.PACKAGES:
-            return [self.package_converter.convert(package, document) for package in document.packages] or None
+            return [
+                self.package_converter.convert(package, document, document_index) for package in document.packages
+            ] or None
         elif document_property == DocumentProperty.FILES:
-            return [self.file_converter.convert(file, document) for file in document.files] or None
+            return [self.file_converter.convert(file, document, document_index) for file in document.files] or None
         elif document_property == DocumentProperty.SNIPPETS:
-            return [self.snippet_converter.convert(snippet, document) for snippet in document.snippets] or None
+            return [
+                self.snippet_converter.convert(snippet, document, document_index) for snippet in document.snippets
+            ] or None
         elif document_property == DocumentProperty.RELATIONSHIPS:
             return [
                 self.relationship_converter.convert(relationship) for relationship in document.relationships
@@ -3,6 +3,7 @@
 # SPDX-License-Identifier: Apache-2.0
 from beartype.typing import Any, Type
 
+from spdx_tools.spdx.document_index import DocumentIndex
 from spdx_tools.spdx.jsonschema.checksum_converter import ChecksumConverter
 from spdx_tools.spdx.jsonschema.converter import TypedConverter
 from spdx_tools.spdx.jsonschema.external_document_ref_properties import ExternalDocumentRefProperty
@@ -21,6 +22,7 @@ class ExternalDocumentRefConverter(TypedConverter[ExternalDocumentRef]):
         external_document_ref: ExternalDocumentRef,
         external_document_ref_property: ExternalDocumentRefProperty,
         _document: Document | None = None,
+        _document_index: DocumentIndex | None = None,
     ) -> Any:
         if external_document_ref_property == ExternalDocumentRefProperty.EXTERNAL_DOCUMENT_ID:
             return external_document_ref.document_ref_id
@@ -3,6 +3,7 @@
 # SPDX-License-Identifier: Apache-2.0
 from beartype.typing import Any, Type
 
+from spdx_tools.spdx.document_index import DocumentIndex
 from spdx_tools.spdx.jsonschema.converter import TypedConverter
 from spdx_tools.spdx.jsonschema.external_package_ref_properties import ExternalPackageRefProperty
 from spdx_tools.spdx.jsonschema.json_property import JsonProperty
@@ -15,6 +16,7 @@ class ExternalPackageRefConverter(TypedConverter[ExternalPackageRef]):
         external_ref: ExternalPackageRef,
         external_ref_property: ExternalPackageRefProperty,
         document: Document | None = None,
+        document_index: DocumentIndex | None = None,
     ) -> Any:
         if external_ref_property == ExternalPackageRefProperty.COMMENT:
             return external_ref.comment
@@ -3,6 +3,7 @@
 # SPDX-License-Identifier: Apache-2.0
 from beartype.typing import Any, Type
 
+from spdx_tools.spdx.document_index import DocumentIndex
 from spdx_tools.spdx.jsonschema.converter import TypedConverter
 from spdx_tools.spdx.jsonschema.extracted_licensing_info_properties import ExtractedLicensingInfoProperty
 from spdx_tools.spdx.jsonschema.json_property import JsonProperty
@@ -16,6 +17,7 @@ class ExtractedLicensingInfoConverter(TypedConverter[ExtractedLicensingInfo]):
         extracted_licensing_info: ExtractedLicensingInfo,
         extracted_licensing_info_property: ExtractedLicensingInfoProperty,
         document: Document | None = None,
+        document_index: DocumentIndex | None = None,
     ) -> Any:
         if extracted_licensing_info_property == ExtractedLicensingInfoProperty.COMMENT:
             return extracted_licensing_info.comment
@@ -3,6 +3,7 @@
 # SPDX-License-Identifier: Apache-2.0
 from beartype.typing import Any, Type
 
+from spdx_tools.spdx.document_index import DocumentIndex
 from spdx_tools.spdx.jsonschema.annotation_converter import AnnotationConverter
 from spdx_tools.spdx.jsonschema.checksum_converter import ChecksumConverter
 from spdx_tools.spdx.jsonschema.converter import TypedConverter
@@ -25,11 +26,17 @@ class FileConverter(TypedConverter[File]):
             return "SPDXID"
         return super().json_property_name(file_property)
 
-    def _get_property_value(self, file: Any, file_property: FileProperty, document: Document | None = None) -> Any:
+    def _get_property_value(
+        self,
+        file: Any,
+        file_property: FileProperty,
+        document: Document | None = None,
+        document_index: DocumentIndex | None = None,
+    ) -> Any:
         if file_property == FileProperty.SPDX_ID:
             return file.spdx_id
         elif file_property == FileProperty.ANNOTATIONS:
-            file_annotations = filter(lambda annotation: annotation.spdx_id == file.spdx_id, document.annotations)
+            file_annotations = document_index.get_annotations(file.spdx_id)
             return [self.annotation_converter.convert(annotation) for annotation in file_annotations] or None
         elif file_property == FileProperty.ARTIFACT_OFS:
             # Deprecated property, automatically converted during parsing
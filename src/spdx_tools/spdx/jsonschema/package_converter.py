@@ -4,6 +4,7 @@
 from beartype.typing import Any, Type
 
 from spdx_tools.spdx.datetime_conversions import datetime_to_iso_string
+from spdx_tools.spdx.document_index import DocumentIndex
 from spdx_tools.spdx.jsonschema.annotation_converter import AnnotationConverter
 from spdx_tools.spdx.jsonschema.checksum_converter import ChecksumConverter
 from spdx_tools.spdx.jsonschema.converter import TypedConverter
@@ -33,14 +34,16 @@ class PackageConverter(TypedConverter[Package]):
         return super().json_property_name(package_property)
 
     def _get_property_value(
-        self, package: Package, package_property: PackageProperty, document: Document | None = None
+        self,
+        package: Package,
+        package_property: PackageProperty,
+        document: Document | None = None,
+        document_index: DocumentIndex | None = None,
     ) -> Any:
         if package_property == PackageProperty.SPDX_ID:
             return package.spdx_id
         elif package_property == PackageProperty.ANNOTATIONS:
-            package_annotations = filter(
-                lambda annotation: annotation.spdx_id == package.spdx_id, document.annotations
-            )
+            package_annotations = document_index.get_annotations(package.spdx_id)
             return [
                 self.annotation_converter.convert(annotation, document) for annotation in package_annotations
             ] or None
@@ -3,6 +3,7 @@
 # SPDX-License-Identifier: Apache-2.0
 from beartype.typing import Any, Type
 
+from spdx_tools.spdx.document_index import DocumentIndex
 from spdx_tools.spdx.jsonschema.converter import TypedConverter
 from spdx_tools.spdx.jsonschema.json_property import JsonProperty
 from spdx_tools.spdx.jsonschema.package_verification_code_properties import PackageVerificationCodeProperty
@@ -15,6 +16,7 @@ class PackageVerificationCodeConverter(TypedConverter[PackageVerificationCode]):
         verification_code: PackageVerificationCode,
         verification_code_property: PackageVerificationCodeProperty,
         document: Document | None = None,
+        document_index: DocumentIndex | None = None,
     ) -> Any:
         if verification_code_property == PackageVerificationCodeProperty.PACKAGE_VERIFICATION_CODE_EXCLUDED_FILES:
             return verification_code.excluded_files or None
@@ -3,6 +3,7 @@
 # SPDX-License-Identifier: Apache-2.0
 from beartype.typing import Any, Type
 
+from spdx_tools.spdx.document_index import DocumentIndex
 from spdx_tools.spdx.jsonschema.converter import TypedConverter
 from spdx_tools.spdx.jsonschema.json_property import JsonProperty
 from spdx_tools.spdx.jsonschema.relationship_properties import RelationshipProperty
@@ -11,7 +12,11 @@ from spdx_tools.spdx.model import Document, Relationship
 
 class RelationshipConverter(TypedConverter[Relationship]):
     def _get_property_value(
-        self, relationship: Relationship, relationship_property: RelationshipProperty, document: Document | None = None
+        self,
+        relationship: Relationship,
+        relationship_property: RelationshipProperty,
+        document: Document | None = None,
+        document_index: DocumentIndex | None = None,
     ) -> Any:
         if relationship_property == RelationshipProperty.SPDX_ELEMENT_ID:
             return relationship.spdx_element_id
@@ -3,6 +3,7 @@
 # SPDX-License-Identifier: Apache-2.0
 from beartype.typing import Any, Dict, Tuple, Type
 
+from spdx_tools.spdx.document_index import DocumentIndex
 from spdx_tools.spdx.jsonschema.annotation_converter import AnnotationConverter
 from spdx_tools.spdx.jsonschema.converter import TypedConverter
 from spdx_tools.spdx.jsonschema.json_property import JsonProperty
@@ -23,14 +24,16 @@ class SnippetConverter(TypedConverter[Snippet]):
         return super().json_property_name(snippet_property)
 
     def _get_property_value(
-        self, snippet: Snippet, snippet_property: SnippetProperty, document: Document | None = None
+        self,
+        snippet: Snippet,
+        snippet_property: SnippetProperty,
+        document: Document | None = None,
+        document_index: DocumentIndex | None = None,
     ) -> Any:
         if snippet_property == SnippetProperty.SPDX_ID:
             return snippet.spdx_id
         elif snippet_property == SnippetProperty.ANNOTATIONS:
-            snippet_annotations = filter(
-                lambda annotation: annotation.spdx_id == snippet.spdx_id, document.annotations
-            )
+            snippet_annotations = document_index.get_annotations(snippet.spdx_id)
             return [self.annotation_converter.convert(annotation) for annotation in snippet_annotations] or None
         elif snippet_property == SnippetProperty.ATTRIBUTION_TEXTS:
             return snippet.attribution_texts or None
@@ -10,6 +10,7 @@ from spdx_tools.spdx.model.checksum import Checksum, ChecksumAlgorithm
 from spdx_tools.spdx.model.external_document_ref import ExternalDocumentRef
 from spdx_tools.spdx.model.extracted_licensing_info import ExtractedLicensingInfo
 from spdx_tools.spdx.model.file import File, FileType
+from spdx_tools.spdx.model.lazy_element_list import LazyElementList
 from spdx_tools.spdx.model.package import (
     ExternalPackageRef,
     ExternalPackageRefCategory,
@@ -18,5 +19,6 @@ from spdx_tools.spdx.model.package import (
     PackageVerificationCode,
 )
 from spdx_tools.spdx.model.relationship import Relationship, RelationshipType
+from spdx_tools.spdx.model.relationship_table import RelationshipTable
 from spdx_tools.spdx.model.snippet import Snippet
 from spdx_tools.spdx.model.document import CreationInfo, Document
@@ -15,7 +15,7 @@ class ActorType(Enum):
     TOOL = auto()
 
 
-@dataclass_with_properties
+@dataclass_with_properties(slots=True)
 class Actor:
     actor_type: ActorType
     name: str
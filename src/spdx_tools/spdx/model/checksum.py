@@ -27,7 +27,7 @@ class ChecksumAlgorithm(Enum):
     ADLER32 = auto()
 
 
-@dataclass_with_properties
+@dataclass_with_properties(slots=True)
 class Checksum:
     algorithm: ChecksumAlgorithm
     value: str
@@ -4,7 +4,7 @@
 from dataclasses import field
 from datetime import datetime
 
-from beartype.typing import List, Optional
+from beartype.typing import List, Optional, Union
 
 from spdx_tools.common.typing.dataclass_with_properties import dataclass_with_properties
 from spdx_tools.common.typing.type_checks import check_types_and_set_values
@@ -14,8 +14,10 @@ from spdx_tools.spdx.model import (
     ExternalDocumentRef,
     ExtractedLicensingInfo,
     File,
+    LazyElementList,
     Package,
     Relationship,
+    RelationshipTable,
     Snippet,
     Version,
 )
@@ -57,21 +59,21 @@ class CreationInfo:
 class Document:
     creation_info: CreationInfo
 
-    packages: List[Package] = field(default_factory=list)
-    files: List[File] = field(default_factory=list)
-    snippets: List[Snippet] = field(default_factory=list)
+    packages: Union[List[Package], LazyElementList] = field(default_factory=list)
+    files: Union[List[File], LazyElementList] = field(default_factory=list)
+    snippets: Union[List[Snippet], LazyElementList] = field(default_factory=list)
     annotations: List[Annotation] = field(default_factory=list)
-    relationships: List[Relationship] = field(default_factory=list)
+    relationships: Union[List[Relationship], RelationshipTable] = field(default_factory=list)
     extracted_licensing_info: List[ExtractedLicensingInfo] = field(default_factory=list)
 
     def __init__(
         self,
         creation_info: CreationInfo,
-        packages: List[Package] | None = None,
-        files: List[File] | None = None,
-        snippets: List[Snippet] | None = None,
+        packages: Union[List[Package], LazyElementList, None] = None,
+        files: Union[List[File], LazyElementList, None] = None,
+        snippets: Union[List[Snippet], LazyElementList, None] = None,
         annotations: List[Annotation] | None = None,
-        relationships: List[Relationship] | None = None,
+        relationships: Union[List[Relationship], RelationshipTable, None] = None,
         extracted_licensing_info: List[ExtractedLicensingInfo] | None = None,
     ):
         packages = [] if packages is None else packages
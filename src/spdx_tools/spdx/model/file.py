@@ -26,7 +26,7 @@ class FileType(Enum):
     OTHER = auto()
 
 
-@dataclass_with_properties
+@dataclass_with_properties(slots=True)
 class File:
     name: str
     spdx_id: str
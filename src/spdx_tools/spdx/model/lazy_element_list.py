@@ -0,0 +1,105 @@
+# SPDX-FileCopyrightText: 2026 spdx contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+from collections import OrderedDict
+from collections.abc import MutableSequence
+
+from beartype.typing import Any, Callable, Iterable, Iterator, List, Optional, Union
+
+
+class _ElementCell:
+    # one row of the list; the built elements are stored in the cells, so that rows with the same raw value, e.g.
+    # the dicts of YAML aliases, are built separately
+    __slots__ = ["raw_element", "element", "assigned"]
+
+    def __init__(self, raw_element: Any = None, element: Any = None, assigned: bool = False):
+        self.raw_element = raw_element
+        self.element = element
+        self.assigned = assigned
+
+
+class LazyElementList(MutableSequence):
+    """
+    List of the elements of a document that keeps the raw values the elements were parsed from, e.g. the dicts of a
+    JSON document, and builds each element only when it is accessed, so that reading a few elements of a large
+    document doesn't require building all of them. A document's packages, files and snippets can be given as a
+    LazyElementList instead of a list. Errors of the element construction, e.g. an SPDXParsingError, are raised on the
+    access of the invalid element.
+    By default, each element is built once and kept, so that changes to it are preserved. With cache_size, only that
+    many of the most recently accessed elements are kept and all others are built again on their next access; changes
+    to such an element are therefore only preserved if it is assigned to its index. Assigned and inserted elements are
+    always kept.
+    """
+
+    def __init__(
+        self, raw_elements: Iterable[Any], build_element: Callable[[Any], Any], cache_size: Optional[int] = None
+    ):
+        self._cells: List[_ElementCell] = [_ElementCell(raw_element) for raw_element in raw_elements]
+        self._build_element = build_element
+        self._cache_size = cache_size
+        # the cells whose element has been built, from the least to the most recently accessed
+        self._built_cells: OrderedDict = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._cells)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Any, List[Any]]:
+        if isinstance(index, slice):
+            return [self._get_element(cell) for cell in self._cells[index]]
+        return self._get_element(self._cells[index])
+
+    def __setitem__(self, index: Union[int, slice], element: Union[Any, Iterable[Any]]) -> None:
+        removed_cells = self._cells[index]
+        if isinstance(index, slice):
+            self._cells[index] = [_ElementCell(element=new_element, assigned=True) for new_element in element]
+        else:
+            self._cells[index] = _ElementCell(element=element, assigned=True)
+            removed_cells = [removed_cells]
+        self._forget(removed_cells)
+
+    def __delitem__(self, index: Union[int, slice]) -> None:
+        removed_cells = self._cells[index]
+        del self._cells[index]
+        self._forget(removed_cells if isinstance(index, slice) else [removed_cells])
+
+    def insert(self, index: int, element: Any) -> None:
+        self._cells.insert(index, _ElementCell(element=element, assigned=True))
+
+    def __iter__(self) -> Iterator[Any]:
+        for cell in list(self._cells):
+            yield self._get_element(cell)
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, (LazyElementList, list)):
+            return NotImplemented
+        return len(self) == len(other) and all(element == other_element for element, other_element in zip(self, other))
+
+    def __add__(self, other: Iterable[Any]) -> List[Any]:
+        return list(self) + list(other)
+
+    def __radd__(self, other: Iterable[Any]) -> List[Any]:
+        return list(other) + list(self)
+
+    def __repr__(self) -> str:
+        return f"LazyElementList({list(self)})"
+
+    def number_of_built_elements(self) -> int:
+        return len(self._built_cells)
+
+    def _get_element(self, cell: _ElementCell) -> Any:
+        if cell.assigned:
+            return cell.element
+        if cell in self._built_cells:
+            self._built_cells.move_to_end(cell)
+            return cell.element
+
+        cell.element = self._build_element(cell.raw_element)
+        self._built_cells[cell] = None
+        if self._cache_size is not None and len(self._built_cells) > self._cache_size:
+            evicted_cell, _ = self._built_cells.popitem(last=False)
+            evicted_cell.element = None
+        return cell.element
+
+    def _forget(self, cells: List[_ElementCell]) -> None:
+        for cell in cells:
+            self._built_cells.pop(cell, None)
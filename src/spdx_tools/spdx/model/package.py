@@ -69,7 +69,7 @@ class ExternalPackageRef:
         check_types_and_set_values(self, locals())
 
 
-@dataclass_with_properties
+@dataclass_with_properties(slots=True)
 class Package:
     spdx_id: str
     name: str
@@ -58,7 +58,7 @@ class RelationshipType(Enum):
     VARIANT_OF = auto()
 
 
-@dataclass_with_properties
+@dataclass_with_properties(slots=True)
 class Relationship:
     spdx_element_id: str
     relationship_type: RelationshipType
@@ -1,13 +1,13 @@
 # SPDX-FileCopyrightText: 2022 spdx contributors
 #
 # SPDX-License-Identifier: Apache-2.0
-from beartype.typing import List
+from beartype.typing import List, Union
 
-from spdx_tools.spdx.model import Document, Package, Relationship, RelationshipType
+from spdx_tools.spdx.model import Document, Package, Relationship, RelationshipTable, RelationshipType
 
 
 def find_package_contains_file_relationships(document: Document, package: Package) -> List[Relationship]:
-    file_ids_in_document = [file.spdx_id for file in document.files]
+    file_ids_in_document = {file.spdx_id for file in document.files}
     package_contains_relationships = filter_by_type_and_origin(
         document.relationships, RelationshipType.CONTAINS, package.spdx_id
     )
@@ -19,7 +19,7 @@ def find_package_contains_file_relationships(document: Document, package: Packag
 
 
 def find_file_contained_by_package_relationships(document: Document, package: Package) -> List[Relationship]:
-    file_ids_in_document = [file.spdx_id for file in document.files]
+    file_ids_in_document = {file.spdx_id for file in document.files}
     contained_by_package_relationships = filter_by_type_and_target(
         document.relationships, RelationshipType.CONTAINED_BY, package.spdx_id
     )
@@ -31,8 +31,10 @@ def find_file_contained_by_package_relationships(document: Document, package: Pa
 
 
 def filter_by_type_and_target(
-    relationships: List[Relationship], relationship_type: RelationshipType, target_id: str
+    relationships: Union[List[Relationship], RelationshipTable], relationship_type: RelationshipType, target_id: str
 ) -> List[Relationship]:
+    if isinstance(relationships, RelationshipTable):
+        return relationships.filter_by_type_and_target(relationship_type, target_id)
     return [
         relationship
         for relationship in relationships
@@ -41,8 +43,10 @@ def filter_by_type_and_target(
 
 
 def filter_by_type_and_origin(
-    relationships: List[Relationship], relationship_type: RelationshipType, origin_id: str
+    relationships: Union[List[Relationship], RelationshipTable], relationship_type: RelationshipType, origin_id: str
 ) -> List[Relationship]:
+    if isinstance(relationships, RelationshipTable):
+        return relationships.filter_by_type_and_origin(relationship_type, origin_id)
     return [
         relationship
         for relationship in relationships
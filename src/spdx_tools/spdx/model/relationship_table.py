@@ -0,0 +1,268 @@
+# SPDX-FileCopyrightText: 2026 spdx contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+from array import array
+from collections.abc import MutableSequence
+from dataclasses import fields
+
+from beartype.typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+
+from spdx_tools.common.typing.type_checks import type_checks_disabled
+from spdx_tools.spdx.model import SpdxNoAssertion, SpdxNone
+from spdx_tools.spdx.model.relationship import Relationship, RelationshipType
+
+# codes of the targets that are not an SPDX id, all other codes are indices into the pool of interned SPDX ids
+SPDX_NONE_CODE = -1
+SPDX_NO_ASSERTION_CODE = -2
+
+RELATIONSHIP_TYPES: List[RelationshipType] = list(RelationshipType)
+RELATIONSHIP_TYPE_CODES: Dict[RelationshipType, int] = {
+    relationship_type: code for code, relationship_type in enumerate(RELATIONSHIP_TYPES)
+}
+
+
+class _TableRelationship(Relationship):
+    """
+    A relationship read from a RelationshipTable, whose setters write the changed values back to its row. Once rows
+    have been assigned, inserted or deleted, the row might hold a different relationship, so that changing the values
+    raises an error instead.
+    """
+
+    __slots__ = ("_table", "_row", "_version")
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Relationship):
+            return NotImplemented
+        return _get_values(self) == _get_values(other)
+
+    def __repr__(self) -> str:
+        return repr(self._detach())
+
+    def __reduce__(self) -> Any:
+        # copies and pickles are plain relationships, which don't refer to the table
+        return Relationship, _get_values(self)
+
+    def _detach(self) -> Relationship:
+        with type_checks_disabled():
+            return Relationship(*_get_values(self))
+
+
+def _get_values(relationship: Relationship) -> tuple:
+    return (
+        relationship.spdx_element_id,
+        relationship.relationship_type,
+        relationship.related_spdx_element_id,
+        relationship.comment,
+    )
+
+
+def _make_write_back_property(field_name: str) -> property:
+    relationship_property: property = getattr(Relationship, field_name)
+
+    def set_field(relationship: _TableRelationship, value: Any) -> None:
+        relationship._table._check_version(relationship)
+        relationship_property.fset(relationship, value)
+        relationship._table._set_row(relationship._row, relationship)
+
+    return property(relationship_property.fget, set_field)
+
+
+for _field in fields(Relationship):
+    setattr(_TableRelationship, _field.name, _make_write_back_property(_field.name))
+
+
+class RelationshipTable(MutableSequence):
+    """
+    Columnar storage for a list of relationships, which are by far the most numerous objects of large documents.
+    Each SPDX id is stored once in a pool, the origins and targets of the relationships are integer arrays of indices
+    into that pool, the relationship types are an array of one-byte codes and comments are only stored for the
+    relationships that have one. A document's relationships can be given as a RelationshipTable instead of a list.
+    The table behaves like a list of Relationship objects, which are created from the columns on each access. Changes
+    to such an object are written back to its row, as long as no rows have been assigned, inserted or deleted since it
+    was read; afterwards, changing it raises a ValueError.
+    filter_by_type_and_origin() and filter_by_type_and_target() use indices of the rows by origin and target that are
+    built on their first use, so that each filter call only takes time proportional to the size of its result.
+    """
+
+    def __init__(self, relationships: Optional[Iterable[Relationship]] = None):
+        self._spdx_ids: List[str] = []
+        self._spdx_id_codes: Dict[str, int] = {}
+        # changed whenever rows are assigned, inserted or deleted, so that relationships read before can't be written
+        # back to a row that holds a different relationship by now
+        self._version = 0
+        self._set_rows([] if relationships is None else relationships)
+
+    def __len__(self) -> int:
+        return len(self._origins)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Relationship, List[Relationship]]:
+        if isinstance(index, slice):
+            return [self._get_relationship(row) for row in range(len(self))[index]]
+        return self._get_relationship(range(len(self))[index])
+
+    def __setitem__(self, index: Union[int, slice], relationship: Union[Relationship, Iterable[Relationship]]) -> None:
+        if isinstance(index, slice):
+            # slice assignments are rare, so the columns are rebuilt from a list with the assignment applied
+            relationships = list(self)
+            relationships[index] = relationship
+            self._set_rows(relationships)
+            return
+        self._check_type(relationship)
+        self._set_row(range(len(self))[index], relationship)
+        self._version += 1
+
+    def __delitem__(self, index: Union[int, slice]) -> None:
+        if isinstance(index, slice):
+            relationships = list(self)
+            del relationships[index]
+            self._set_rows(relationships)
+            return
+        row = range(len(self))[index]
+        del self._origins[row]
+        del self._types[row]
+        del self._targets[row]
+        self._comments = {
+            comment_row - 1 if comment_row > row else comment_row: comment
+            for comment_row, comment in self._comments.items()
+            if comment_row != row
+        }
+        self._invalidate_indices()
+        self._version += 1
+
+    def insert(self, index: int, relationship: Relationship) -> None:
+        self._check_type(relationship)
+        row = min(max(index + len(self) if index < 0 else index, 0), len(self))
+        if row < len(self):
+            self._comments = {
+                comment_row + 1 if comment_row >= row else comment_row: comment
+                for comment_row, comment in self._comments.items()
+            }
+        self._origins.insert(row, self._get_spdx_id_code(relationship.spdx_element_id))
+        self._types.insert(row, RELATIONSHIP_TYPE_CODES[relationship.relationship_type])
+        self._targets.insert(row, self._get_target_code(relationship.related_spdx_element_id))
+        if relationship.comment is not None:
+            self._comments[row] = relationship.comment
+        self._invalidate_indices()
+        self._version += 1
+
+    def __iter__(self) -> Iterator[Relationship]:
+        for row in range(len(self)):
+            yield self._get_relationship(row)
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, (RelationshipTable, list)):
+            return NotImplemented
+        return len(self) == len(other) and all(
+            relationship == other_relationship for relationship, other_relationship in zip(self, other)
+        )
+
+    def __add__(self, other: Iterable[Relationship]) -> "RelationshipTable":
+        table = RelationshipTable(self)
+        table.extend(other)
+        return table
+
+    def __repr__(self) -> str:
+        return f"RelationshipTable({list(self)})"
+
+    def filter_by_type_and_origin(self, relationship_type: RelationshipType, origin_id: str) -> List[Relationship]:
+        if self._rows_by_origin is None:
+            self._rows_by_origin = self._build_rows_by_code(self._origins)
+        return self._filter_by_type(self._rows_by_origin, relationship_type, origin_id)
+
+    def filter_by_type_and_target(self, relationship_type: RelationshipType, target_id: str) -> List[Relationship]:
+        if self._rows_by_target is None:
+            self._rows_by_target = self._build_rows_by_code(self._targets)
+        return self._filter_by_type(self._rows_by_target, relationship_type, target_id)
+
+    def _filter_by_type(
+        self, rows_by_code: Dict[int, List[int]], relationship_type: RelationshipType, spdx_id: str
+    ) -> List[Relationship]:
+        if not isinstance(spdx_id, str) or spdx_id not in self._spdx_id_codes:
+            return []
+        type_code = RELATIONSHIP_TYPE_CODES[relationship_type]
+        return [
+            self._get_relationship(row)
+            for row in rows_by_code.get(self._spdx_id_codes[spdx_id], [])
+            if self._types[row] == type_code
+        ]
+
+    @staticmethod
+    def _build_rows_by_code(codes: array) -> Dict[int, List[int]]:
+        rows_by_code: Dict[int, List[int]] = {}
+        for row, code in enumerate(codes):
+            rows_by_code.setdefault(code, []).append(row)
+        return rows_by_code
+
+    @staticmethod
+    def _check_type(relationship: Relationship) -> None:
+        if not isinstance(relationship, Relationship):
+            raise TypeError(f"RelationshipTable can only contain Relationship objects, but got: {relationship}")
+
+    def _set_rows(self, relationships: Iterable[Relationship]) -> None:
+        # the relationships are checked before the columns are replaced, so that a failed assignment keeps the rows
+        relationships = list(relationships)
+        for relationship in relationships:
+            self._check_type(relationship)
+        self._origins = array("i")
+        self._types = array("B")
+        self._targets = array("i")
+        self._comments: Dict[int, str] = {}
+        self._invalidate_indices()
+        self._version += 1
+        self.extend(relationships)
+
+    def _set_row(self, row: int, relationship: Relationship) -> None:
+        self._origins[row] = self._get_spdx_id_code(relationship.spdx_element_id)
+        self._types[row] = RELATIONSHIP_TYPE_CODES[relationship.relationship_type]
+        self._targets[row] = self._get_target_code(relationship.related_spdx_element_id)
+        self._comments.pop(row, None)
+        if relationship.comment is not None:
+            self._comments[row] = relationship.comment
+        self._invalidate_indices()
+
+    def _check_version(self, relationship: _TableRelationship) -> None:
+        if relationship._version != self._version:
+            raise ValueError(
+                "The relationship can't be changed, as the rows of its RelationshipTable have been changed since it "
+                "was read. Read it again or assign the changed relationship to its index instead."
+            )
+
+    def _invalidate_indices(self) -> None:
+        self._rows_by_origin = None
+        self._rows_by_target = None
+
+    def _get_relationship(self, row: int) -> Relationship:
+        # the values have been type checked when the relationship was added to the table
+        with type_checks_disabled():
+            relationship = _TableRelationship(
+                self._spdx_ids[self._origins[row]],
+                RELATIONSHIP_TYPES[self._types[row]],
+                self._get_target(self._targets[row]),
+                self._comments.get(row),
+            )
+        relationship._table = self
+        relationship._row = row
+        relationship._version = self._version
+        return relationship
+
+    def _get_spdx_id_code(self, spdx_id: str) -> int:
+        code = self._spdx_id_codes.get(spdx_id)
+        if code is None:
+            code = len(self._spdx_ids)
+            self._spdx_ids.append(spdx_id)
+            self._spdx_id_codes[spdx_id] = code
+        return code
+
+    def _get_target_code(self, target: Union[str, SpdxNone, SpdxNoAssertion]) -> int:
+        if isinstance(target, SpdxNone):
+            return SPDX_NONE_CODE
+        if isinstance(target, SpdxNoAssertion):
+            return SPDX_NO_ASSERTION_CODE
+        return self._get_spdx_id_code(target)
+
+    def _get_target(self, code: int) -> Union[str, SpdxNone, SpdxNoAssertion]:
+        if code == SPDX_NONE_CODE:
+            return SpdxNone()
+        if code == SPDX_NO_ASSERTION_CODE:
+            return SpdxNoAssertion()
+        return self._spdx_ids[code]
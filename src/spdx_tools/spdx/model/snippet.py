@@ -11,7 +11,7 @@ from spdx_tools.common.typing.type_checks import check_types_and_set_values
 from spdx_tools.spdx.model import SpdxNoAssertion, SpdxNone
 
 
-@dataclass_with_properties
+@dataclass_with_properties(slots=True)
 class Snippet:
     spdx_id: str
     file_spdx_id: str
@@ -0,0 +1,121 @@
+# SPDX-FileCopyrightText: 2026 spdx contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+import json
+
+from beartype.typing import Any, Callable, Iterator, List, Optional, TextIO, Tuple
+
+from spdx_tools.spdx.parser.error import SPDXParsingError
+
+WHITESPACE = " \t\n\r"
+NUMBER_CHARACTERS = "0123456789+-.eE"
+# the longest token that can be cut off at the end of a chunk, a surrogate pair escape like \ud83d\ude00
+MAX_TOKEN_LENGTH = 12
+
+
+class IncrementalJsonReader:
+    """
+    Reads a JSON document whose top level is an object in chunks, so that only a small part of the file is in memory
+    at once. The values of the top-level keys are decoded one at a time, and the items of selected top-level arrays
+    are decoded one by one, so that memory use is bounded by the size of the largest single item instead of the size
+    of the file.
+    """
+
+    def __init__(
+        self,
+        file: TextIO,
+        object_pairs_hook: Optional[Callable[[List[Tuple[str, Any]]], Any]] = None,
+        chunk_size: int = 1 << 16,
+    ):
+        self.file = file
+        self.decoder = json.JSONDecoder(object_pairs_hook=object_pairs_hook)
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.position = 0
+        self.end_of_file = False
+
+    def iter_top_level_items(self, array_keys: List[str]) -> Iterator[Tuple[str, Any]]:
+        """
+        Yields a (key, value) tuple for each key of the top-level object. For the keys in array_keys, whose values
+        have to be arrays, one (key, item) tuple is yielded per item of the array instead.
+        """
+        self._expect("{")
+        if self._peek() == "}":
+            self.position += 1
+            return
+        while True:
+            key = self._decode_value()
+            if not isinstance(key, str):
+                self._raise_error("Expected a key")
+            self._expect(":")
+            if key in array_keys:
+                yield from ((key, item) for item in self._iter_array_items())
+            else:
+                yield key, self._decode_value()
+            if self._expect(",", "}") == "}":
+                return
+
+    def _iter_array_items(self) -> Iterator[Any]:
+        self._expect("[")
+        if self._peek() == "]":
+            self.position += 1
+            return
+        while True:
+            yield self._decode_value()
+            if self._expect(",", "]") == "]":
+                return
+
+    def _decode_value(self) -> Any:
+        self._peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.position)
+            except json.JSONDecodeError as err:
+                if self.end_of_file or not self._is_cut_off(err):
+                    raise SPDXParsingError([f"Invalid JSON: {err}"])
+                self._read_chunk()
+                continue
+            # a value at the end of the buffer, or a number followed by an incomplete fraction or exponent, might
+            # continue in the next chunk
+            if not self.end_of_file and (
+                end == len(self.buffer) or isinstance(value, (int, float)) and self.buffer[end] in NUMBER_CHARACTERS
+            ):
+                self._read_chunk()
+                continue
+            self.position = end
+            return value
+
+    def _is_cut_off(self, err: json.JSONDecodeError) -> bool:
+        # an unterminated string is reported at its start but runs until the end of the buffer, all other errors
+        # caused by a value that continues in the next chunk are reported at the end of the buffer
+        return err.msg.startswith("Unterminated string") or err.pos >= len(self.buffer) - MAX_TOKEN_LENGTH
+
+    def _peek(self) -> str:
+        # skips whitespace and returns the next character without consuming it
+        while True:
+            while self.position < len(self.buffer) and self.buffer[self.position] in WHITESPACE:
+                self.position += 1
+            if self.position < len(self.buffer):
+                return self.buffer[self.position]
+            if self.end_of_file:
+                self._raise_error("Unexpected end of file")
+            self._read_chunk()
+
+    def _expect(self, *characters: str) -> str:
+        character = self._peek()
+        if character not in characters:
+            self._raise_error(f"Expected {' or '.join(characters)} but found {character}")
+        self.position += 1
+        return character
+
+    def _read_chunk(self) -> None:
+        # drop the part of the buffer that has already been decoded
+        self.buffer = self.buffer[self.position :]
+        self.position = 0
+        chunk = self.file.read(max(self.chunk_size, len(self.buffer)))
+        if not chunk:
+            self.end_of_file = True
+        self.buffer += chunk
+
+    def _raise_error(self, message: str) -> None:
+        raise SPDXParsingError([f"Invalid JSON: {message} near: {self.buffer[self.position : self.position + 40]!r}"])
@@ -3,10 +3,17 @@
 # SPDX-License-Identifier: Apache-2.0
 import json
 
-from beartype.typing import Any, Dict
+from beartype.typing import Any, Collection, Dict, Iterator, Optional, Union
 
-from spdx_tools.spdx.model import Document
+from spdx_tools.spdx.model import Document, File, Package, Relationship, Snippet
+from spdx_tools.spdx.parser.json.incremental_json_reader import IncrementalJsonReader
+from spdx_tools.spdx.parser.jsonlikedict.file_parser import FileParser
 from spdx_tools.spdx.parser.jsonlikedict.json_like_dict_parser import JsonLikeDictParser
+from spdx_tools.spdx.parser.jsonlikedict.package_parser import PackageParser
+from spdx_tools.spdx.parser.jsonlikedict.relationship_parser import RelationshipParser
+from spdx_tools.spdx.parser.jsonlikedict.snippet_parser import SnippetParser
+from spdx_tools.spdx.parser.parsing_handler import ParsingHandler
+from spdx_tools.spdx.parser.spdx_id_pool import SpdxIdPool
 
 # chars we don't want to see in SBOMs
 CONTROL_CHARS_MAP = {
@@ -28,8 +35,42 @@ def remove_json_control_chars_hook(pairs: list) -> dict:
     return {k: remove_control_chars_from_value(v) for k, v in pairs}
 
 
-def parse_from_file(file_name: str, encoding: str = "utf-8") -> Document:
+def parse_from_file(
+    file_name: str,
+    encoding: str = "utf-8",
+    handler: Optional[ParsingHandler] = None,
+    build_document: bool = True,
+    include: Optional[Collection[str]] = None,
+    exclude: Optional[Collection[str]] = None,
+    workers: int = 1,
+    lazy: bool = False,
+    cache_size: Optional[int] = None,
+) -> Optional[Document]:
     with open(file_name, encoding=encoding) as file:
         input_doc_as_dict: Dict = json.load(file, object_pairs_hook=remove_json_control_chars_hook)
 
-    return JsonLikeDictParser().parse(input_doc_as_dict)
+    return JsonLikeDictParser(handler, include, exclude, workers, lazy, cache_size).parse(
+        input_doc_as_dict, build_document
+    )
+
+
+def iter_elements(file_name: str, encoding: str = "utf-8") -> Iterator[Union[Package, File, Snippet, Relationship]]:
+    """
+    Yields the packages, files, snippets and relationships of a JSON document one at a time, in the order in which
+    they appear in the file. The file is read incrementally, so that only the element that is currently parsed is
+    kept in memory, which allows processing documents that are too large to be parsed as a whole. All other fields
+    of the document are skipped, which includes the relationships that are implied by documentDescribes and hasFiles.
+    Raises an SPDXParsingError for the first element that can't be parsed.
+    """
+    spdx_id_pool = SpdxIdPool()
+    parse_functions = {
+        "packages": PackageParser(spdx_id_pool).parse_package,
+        "files": FileParser(spdx_id_pool).parse_file,
+        "snippets": SnippetParser(spdx_id_pool).parse_snippet,
+        "relationships": RelationshipParser(spdx_id_pool).parse_relationship,
+    }
+    with open(file_name, encoding=encoding) as file:
+        reader = IncrementalJsonReader(file, object_pairs_hook=remove_json_control_chars_hook)
+        for key, value in reader.iter_top_level_items(list(parse_functions)):
+            if key in parse_functions:
+                yield parse_functions[key](value)
@@ -18,13 +18,16 @@ from spdx_tools.spdx.parser.parsing_functions import (
     construct_or_raise_parsing_error,
     raise_parsing_error_if_logger_has_messages,
 )
+from spdx_tools.spdx.parser.spdx_id_pool import SpdxIdPool
 
 
 class AnnotationParser:
     logger: Logger
     actor_parser: ActorParser
+    spdx_id_pool: SpdxIdPool
 
-    def __init__(self):
+    def __init__(self, spdx_id_pool: Optional[SpdxIdPool] = None):
+        self.spdx_id_pool = SpdxIdPool() if spdx_id_pool is None else spdx_id_pool
         self.logger = Logger()
         self.actor_parser = ActorParser()
 
@@ -62,7 +65,7 @@ class AnnotationParser:
 
     def parse_annotation(self, annotation_dict: Dict, spdx_id: Optional[str] = None) -> Annotation:
         logger = Logger()
-        spdx_id: Optional[str] = annotation_dict.get("SPDXID") or spdx_id
+        spdx_id: Optional[str] = self.spdx_id_pool.intern(annotation_dict.get("SPDXID") or spdx_id)
 
         annotation_type: Optional[AnnotationType] = parse_field_or_log_error(
             logger, annotation_dict.get("annotationType"), self.parse_annotation_type
@@ -115,7 +118,7 @@ class AnnotationParser:
         annotation = construct_or_raise_parsing_error(
             Annotation,
             dict(
-                spdx_id=spdx_id,
+                spdx_id=self.spdx_id_pool.intern(spdx_id),
                 annotation_type=annotation_type,
                 annotator=annotator,
                 annotation_date=annotation_date,
@@ -16,14 +16,17 @@ from spdx_tools.spdx.parser.parsing_functions import (
     construct_or_raise_parsing_error,
     raise_parsing_error_if_logger_has_messages,
 )
+from spdx_tools.spdx.parser.spdx_id_pool import SpdxIdPool
 
 
 class CreationInfoParser:
     logger: Logger
     actor_parser: ActorParser
     checksum_parser: ChecksumParser
+    spdx_id_pool: SpdxIdPool
 
-    def __init__(self):
+    def __init__(self, spdx_id_pool: Optional[SpdxIdPool] = None):
+        self.spdx_id_pool = SpdxIdPool() if spdx_id_pool is None else spdx_id_pool
         self.logger = Logger()
         self.actor_parser = ActorParser()
         self.checksum_parser = ChecksumParser()
@@ -31,7 +34,7 @@ class CreationInfoParser:
     def parse_creation_info(self, doc_dict: Dict) -> CreationInfo:
         logger = Logger()
         spdx_version: Optional[str] = doc_dict.get("spdxVersion")
-        spdx_id: Optional[str] = doc_dict.get("SPDXID")
+        spdx_id: Optional[str] = self.spdx_id_pool.intern(doc_dict.get("SPDXID"))
         name: Optional[str] = doc_dict.get("name")
         document_namespace: Optional[str] = doc_dict.get("documentNamespace")
         creation_info_dict: Optional[Dict] = doc_dict.get("creationInfo")
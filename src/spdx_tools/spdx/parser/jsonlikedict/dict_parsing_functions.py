@@ -1,12 +1,26 @@
 # SPDX-FileCopyrightText: 2022 spdx contributors
 #
 # SPDX-License-Identifier: Apache-2.0
-from beartype.typing import Any, Callable, Dict, List, Optional
+from beartype.typing import Any, Callable, Collection, Dict, List, Optional, Set
 
 from spdx_tools.spdx.model import SpdxNoAssertion, SpdxNone
 from spdx_tools.spdx.parser.error import SPDXParsingError
 from spdx_tools.spdx.parser.logger import Logger
 from spdx_tools.spdx.parser.parsing_functions import raise_parsing_error_if_logger_has_messages
+from spdx_tools.spdx.parser.projection import CHECKSUMS, LICENSE_FIELDS
+
+# the keys of the fields of packages, files and snippets that correspond to the sub-fields that can be excluded from
+# parsing
+EXCLUDABLE_KEYS = {
+    LICENSE_FIELDS: [
+        "licenseConcluded",
+        "licenseDeclared",
+        "licenseInfoFromFiles",
+        "licenseInfoInFiles",
+        "licenseInfoInSnippets",
+    ],
+    CHECKSUMS: ["checksums"],
+}
 
 
 def json_str_to_enum_name(json_str: str) -> str:
@@ -77,6 +91,16 @@ def parse_list_of_elements(list_of_elements: List[Dict], method_to_parse_element
     return parsed_elements
 
 
+def get_excluded_keys(excluded_fields: Collection[str]) -> Set[str]:
+    return {key for field, keys in EXCLUDABLE_KEYS.items() if field in excluded_fields for key in keys}
+
+
+def remove_excluded_keys(element_dict: Dict, excluded_keys: Collection[str]) -> Dict:
+    if not excluded_keys:
+        return element_dict
+    return {key: value for key, value in element_dict.items() if key not in excluded_keys}
+
+
 def delete_duplicates_from_list(list_with_potential_duplicates: List[Any]) -> List[Any]:
     list_without_duplicates = list(dict.fromkeys(list_with_potential_duplicates))
     return list_without_duplicates
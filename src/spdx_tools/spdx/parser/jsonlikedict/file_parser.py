@@ -1,14 +1,16 @@
 # SPDX-FileCopyrightText: 2022 spdx contributors
 #
 # SPDX-License-Identifier: Apache-2.0
-from beartype.typing import Dict, List, Optional, Union
+from beartype.typing import Collection, Dict, List, Optional, Set, Union
 from license_expression import LicenseExpression
 
 from spdx_tools.spdx.model import Checksum, File, FileType, SpdxNoAssertion, SpdxNone
 from spdx_tools.spdx.parser.jsonlikedict.checksum_parser import ChecksumParser
 from spdx_tools.spdx.parser.jsonlikedict.dict_parsing_functions import (
+    get_excluded_keys,
     parse_field_or_log_error,
     parse_field_or_no_assertion_or_none,
+    remove_excluded_keys,
 )
 from spdx_tools.spdx.parser.jsonlikedict.license_expression_parser import LicenseExpressionParser
 from spdx_tools.spdx.parser.logger import Logger
@@ -16,26 +18,36 @@ from spdx_tools.spdx.parser.parsing_functions import (
     construct_or_raise_parsing_error,
     raise_parsing_error_if_logger_has_messages,
 )
+from spdx_tools.spdx.parser.spdx_id_pool import SpdxIdPool
 
 
 class FileParser:
     logger: Logger
     checksum_parser: ChecksumParser
     license_expression_parser: LicenseExpressionParser
+    spdx_id_pool: SpdxIdPool
+    excluded_keys: Set[str]
 
-    def __init__(self):
+    def __init__(self, spdx_id_pool: Optional[SpdxIdPool] = None, excluded_fields: Collection[str] = ()):
+        self.spdx_id_pool = SpdxIdPool() if spdx_id_pool is None else spdx_id_pool
+        # the keys of the sub-fields that are excluded from parsing are removed before parsing the element
+        self.excluded_keys = get_excluded_keys(excluded_fields)
         self.logger = Logger()
         self.checksum_parser = ChecksumParser()
         self.license_expression_parser = LicenseExpressionParser()
 
     def parse_file(self, file_dict: Dict) -> Optional[File]:
+        file_dict = remove_excluded_keys(file_dict, self.excluded_keys)
         logger = Logger()
         name: Optional[str] = file_dict.get("fileName")
-        spdx_id: Optional[str] = file_dict.get("SPDXID")
+        spdx_id: Optional[str] = self.spdx_id_pool.intern(file_dict.get("SPDXID"))
         checksums_list: List[Dict] = file_dict.get("checksums")
         checksums: List[Checksum] = parse_field_or_log_error(
             logger, checksums_list, self.checksum_parser.parse_checksum, field_is_list=True
         )
+        if "checksums" in self.excluded_keys:
+            # checksums are required for files, so files whose checksums are not parsed get an empty list
+            checksums = []
 
         attribution_texts: List[str] = file_dict.get("attributionTexts", [])
         comment: Optional[str] = file_dict.get("comment")
@@ -1,13 +1,19 @@
 # SPDX-FileCopyrightText: 2022 spdx contributors
 #
 # SPDX-License-Identifier: Apache-2.0
-from beartype.typing import Dict
+from concurrent.futures import Future, ProcessPoolExecutor
 
-from spdx_tools.spdx.model import Document
+from beartype.typing import Any, Callable, Collection, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from spdx_tools.common.parallel import get_chunk_ranges
+from spdx_tools.spdx.model import Document, LazyElementList
 from spdx_tools.spdx.parser.error import SPDXParsingError
 from spdx_tools.spdx.parser.jsonlikedict.annotation_parser import AnnotationParser
 from spdx_tools.spdx.parser.jsonlikedict.creation_info_parser import CreationInfoParser
-from spdx_tools.spdx.parser.jsonlikedict.dict_parsing_functions import parse_list_of_elements
+from spdx_tools.spdx.parser.jsonlikedict.dict_parsing_functions import (
+    append_parsed_field_or_log_error,
+    parse_list_of_elements,
+)
 from spdx_tools.spdx.parser.jsonlikedict.extracted_licensing_info_parser import ExtractedLicensingInfoParser
 from spdx_tools.spdx.parser.jsonlikedict.file_parser import FileParser
 from spdx_tools.spdx.parser.jsonlikedict.package_parser import PackageParser
@@ -18,6 +24,9 @@ from spdx_tools.spdx.parser.parsing_functions import (
     construct_or_raise_parsing_error,
     raise_parsing_error_if_logger_has_messages,
 )
+from spdx_tools.spdx.parser.parsing_handler import ParsingHandler, notify_handler
+from spdx_tools.spdx.parser.projection import get_excluded_fields
+from spdx_tools.spdx.parser.spdx_id_pool import SpdxIdPool
 
 
 class JsonLikeDictParser:
@@ -29,64 +38,292 @@ class JsonLikeDictParser:
     extracted_licensing_info_parser: ExtractedLicensingInfoParser
     relationship_parser: RelationshipParser
     annotation_parser: AnnotationParser
+    spdx_id_pool: SpdxIdPool
+    handler: Optional[ParsingHandler]
+    excluded_fields: Set[str]
+    workers: int
+    lazy: bool
+    cache_size: Optional[int]
 
-    def __init__(self):
+    def __init__(
+        self,
+        handler: Optional[ParsingHandler] = None,
+        include: Optional[Collection[str]] = None,
+        exclude: Optional[Collection[str]] = None,
+        workers: int = 1,
+        lazy: bool = False,
+        cache_size: Optional[int] = None,
+    ):
+        """
+        include and exclude select the fields of the document that are parsed, see projection.get_excluded_fields().
+        If workers is greater than 1, the packages, files, snippets and relationships are parsed in chunks on a pool
+        of that many processes. The elements and error messages are in the same order as in the serial case, but the
+        SPDX ids are only shared between the elements of the same chunk.
+        If lazy is True, the packages, files and snippets of the document are LazyElementLists over their dicts, which
+        are only parsed when they are accessed, with a cache of cache_size elements. Errors in these elements are then
+        raised on their access instead of by parse(). The relationships are parsed as usual, as the relationships that
+        are implied by hasFiles depend on the dicts of the packages.
+        """
+        if lazy and handler is not None:
+            raise ValueError("A lazy parser can't notify a handler of the parsed elements.")
+        if lazy and workers > 1:
+            raise ValueError("A lazy parser can't parse the elements in parallel.")
         self.logger = Logger()
-        self.creation_info_parser = CreationInfoParser()
-        self.package_parser = PackageParser()
-        self.file_parser = FileParser()
-        self.snippet_parser = SnippetParser()
+        self.excluded_fields = get_excluded_fields(include, exclude)
+        # all sub-parsers intern the SPDX ids in the same pool, so that equal ids in the document share one object
+        self.spdx_id_pool = SpdxIdPool()
+        self.creation_info_parser = CreationInfoParser(self.spdx_id_pool)
+        self.package_parser = PackageParser(self.spdx_id_pool, self.excluded_fields)
+        self.file_parser = FileParser(self.spdx_id_pool, self.excluded_fields)
+        self.snippet_parser = SnippetParser(self.spdx_id_pool, self.excluded_fields)
         self.extracted_licensing_info_parser = ExtractedLicensingInfoParser()
-        self.relationship_parser = RelationshipParser()
-        self.annotation_parser = AnnotationParser()
+        self.relationship_parser = RelationshipParser(self.spdx_id_pool)
+        self.annotation_parser = AnnotationParser(self.spdx_id_pool)
+        self.handler = handler
+        self.workers = workers
+        self.lazy = lazy
+        self.cache_size = cache_size
+
+    def parse(self, json_like_dict: Dict, build_document: bool = True) -> Optional[Document]:
+        """
+        If the parser has a handler, each parsed element is passed to it as soon as it has been parsed. With
+        build_document=False, no Document is constructed and None is returned; the elements are then only passed to
+        the handler and not kept.
+        """
+        # the pool is kept per document
+        self.spdx_id_pool.clear()
+        if self.workers > 1:
+            return self._parse_in_parallel(json_like_dict, build_document)
+        return self._parse_fields(self._get_fields_to_parse(json_like_dict, build_document), build_document)
 
-    def parse(self, json_like_dict: Dict) -> Document:
+    def _get_fields_to_parse(
+        self, json_like_dict: Dict, build_document: bool
+    ) -> List[Tuple[str, Any, Callable[[Any], Any], bool]]:
         fields_to_parse = [
-            ("creation_info", json_like_dict, self.creation_info_parser.parse_creation_info, False),
+            (
+                "creation_info",
+                json_like_dict,
+                self._notify_handler(self.creation_info_parser.parse_creation_info),
+                False,
+            ),
             (
                 "packages",
                 json_like_dict.get("packages"),
-                lambda x: parse_list_of_elements(x, self.package_parser.parse_package, self.package_parser.logger),
+                lambda x: parse_list_of_elements(
+                    x, self._notify_handler(self.package_parser.parse_package), self.package_parser.logger
+                ),
                 True,
             ),
             (
                 "files",
                 json_like_dict.get("files"),
-                lambda x: parse_list_of_elements(x, self.file_parser.parse_file, self.file_parser.logger),
+                lambda x: parse_list_of_elements(
+                    x, self._notify_handler(self.file_parser.parse_file), self.file_parser.logger
+                ),
                 True,
             ),
-            ("annotations", json_like_dict, self.annotation_parser.parse_all_annotations, True),
+            ("annotations", json_like_dict, self._notify_handler(self.annotation_parser.parse_all_annotations), True),
             (
                 "snippets",
                 json_like_dict.get("snippets"),
-                lambda x: parse_list_of_elements(x, self.snippet_parser.parse_snippet, self.snippet_parser.logger),
+                lambda x: parse_list_of_elements(
+                    x, self._notify_handler(self.snippet_parser.parse_snippet), self.snippet_parser.logger
+                ),
+                True,
+            ),
+            (
+                "relationships",
+                json_like_dict,
+                self._notify_handler(self.relationship_parser.parse_all_relationships),
                 True,
             ),
-            ("relationships", json_like_dict, self.relationship_parser.parse_all_relationships, True),
             (
                 "extracted_licensing_info",
                 json_like_dict.get("hasExtractedLicensingInfos"),
                 lambda x: parse_list_of_elements(
                     x,
-                    self.extracted_licensing_info_parser.parse_extracted_licensing_info,
+                    self._notify_handler(self.extracted_licensing_info_parser.parse_extracted_licensing_info),
                     self.extracted_licensing_info_parser.logger,
                 ),
                 True,
             ),
         ]
+        if not build_document:
+            replaced_parsing_methods = {
+                "packages": lambda x: self._parse_and_discard(
+                    x, self.package_parser.parse_package, self.package_parser.logger
+                ),
+                "files": lambda x: self._parse_and_discard(x, self.file_parser.parse_file, self.file_parser.logger),
+                "snippets": lambda x: self._parse_and_discard(
+                    x, self.snippet_parser.parse_snippet, self.snippet_parser.logger
+                ),
+                "relationships": lambda x: self.relationship_parser.parse_all_relationships(
+                    x, handle_relationship=self._notify_handler_of_element
+                ),
+            }
+        elif self.lazy:
+            replaced_parsing_methods = {
+                "packages": lambda x: LazyElementList(x, self.package_parser.parse_package, self.cache_size),
+                "files": lambda x: LazyElementList(x, self.file_parser.parse_file, self.cache_size),
+                "snippets": lambda x: LazyElementList(x, self.snippet_parser.parse_snippet, self.cache_size),
+            }
+        else:
+            return fields_to_parse
+
+        return [
+            (argument_name, field, replaced_parsing_methods.get(argument_name, parsing_method), optional)
+            for argument_name, field, parsing_method, optional in fields_to_parse
+        ]
 
+    def _parse_fields(
+        self, fields_to_parse: List[Tuple[str, Any, Callable[[Any], Any], bool]], build_document: bool
+    ) -> Optional[Document]:
         parsed_fields = {}
 
         for argument_name, field, parsing_method, optional in fields_to_parse:
-            if optional and not field:
+            if (optional and not field) or argument_name in self.excluded_fields:
                 continue
             try:
-                parsed_fields[argument_name] = parsing_method(field)
+                parsed_value = parsing_method(field)
             except SPDXParsingError as err:
                 self.logger.extend(err.get_messages())
+                continue
+            # without a document, the parsed values have already been passed to the handler and are not kept
+            if build_document:
+                parsed_fields[argument_name] = parsed_value
 
         raise_parsing_error_if_logger_has_messages(self.logger)
 
+        if not build_document:
+            return None
+
         document = construct_or_raise_parsing_error(Document, parsed_fields)
 
         return document
+
+    def _parse_in_parallel(self, json_like_dict: Dict, build_document: bool) -> Optional[Document]:
+        element_dicts: Dict[str, List[Dict]] = {
+            list_name: json_like_dict.get(list_name) or []
+            for list_name in PARALLEL_LIST_NAMES
+            if list_name not in self.excluded_fields
+        }
+        executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_initialize_parsing_worker,
+            initargs=(self.excluded_fields,),
+        )
+        try:
+            # all chunks are submitted at once, so that the workers are busy while the results are collected; each
+            # task only receives its own chunk of the elements, so that no worker needs a copy of the whole document
+            futures_by_list_name: Dict[str, List[Future]] = {
+                list_name: [
+                    executor.submit(_parse_chunk, list_name, dicts[start:end])
+                    for start, end in get_chunk_ranges(len(dicts), self.workers)
+                ]
+                for list_name, dicts in element_dicts.items()
+            }
+            parse_in_parallel = {
+                list_name: self._collect_chunks_of(futures_by_list_name, list_name, build_document)
+                for list_name in ["packages", "files", "snippets"]
+            }
+            if build_document:
+                # the relationships are passed to the handler together with the implicit relationships
+                parse_in_parallel["relationships"] = self._notify_handler(
+                    lambda x: self.relationship_parser.parse_all_relationships(
+                        x, lambda _: self._iter_chunks(futures_by_list_name["relationships"])
+                    )
+                )
+            else:
+                parse_in_parallel["relationships"] = lambda x: self.relationship_parser.parse_all_relationships(
+                    x,
+                    lambda _: self._iter_chunks(futures_by_list_name["relationships"]),
+                    handle_relationship=self._notify_handler_of_element,
+                )
+            fields_to_parse = [
+                (argument_name, field, parse_in_parallel.get(argument_name, parsing_method), optional)
+                for argument_name, field, parsing_method, optional in self._get_fields_to_parse(
+                    json_like_dict, build_document
+                )
+            ]
+            return self._parse_fields(fields_to_parse, build_document)
+        finally:
+            executor.shutdown(cancel_futures=True)
+
+    def _collect_chunks_of(
+        self, futures_by_list_name: Dict[str, List[Future]], list_name: str, keep: bool
+    ) -> Callable[[Any], List[Any]]:
+        def collect_chunks(_: Any) -> List[Any]:
+            elements = []
+            for element in self._iter_chunks(futures_by_list_name[list_name]):
+                self._notify_handler_of_element(element)
+                if keep:
+                    elements.append(element)
+            return elements
+
+        return collect_chunks
+
+    @staticmethod
+    def _iter_chunks(futures: List[Future]) -> Iterator[Any]:
+        # the results are yielded in the order of the elements in the document, independent of completion order,
+        # and the messages of all chunks are raised together at the end like in parse_list_of_elements(); the futures
+        # are removed once their chunk has been consumed, so that they don't keep the elements
+        messages = []
+        while futures:
+            chunk_elements, chunk_messages = futures.pop(0).result()
+            yield from chunk_elements
+            messages.extend(chunk_messages)
+        if messages:
+            raise SPDXParsingError(messages)
+
+    def _parse_and_discard(
+        self, element_dicts: Iterable[Dict], parsing_method: Callable[[Dict], Any], logger: Logger
+    ) -> List[Any]:
+        # without a document, each element is passed to the handler as soon as it has been parsed and then dropped
+        for element_dict in element_dicts:
+            for element in append_parsed_field_or_log_error(logger, [], element_dict, parsing_method):
+                self._notify_handler_of_element(element)
+        raise_parsing_error_if_logger_has_messages(logger)
+        return []
+
+    def _notify_handler_of_element(self, element: Any) -> None:
+        notify_handler(self.handler, element)
+
+    def _notify_handler(self, parsing_method: Callable[[Any], Any]) -> Callable[[Any], Any]:
+        # wraps a parsing method, so that the handler is notified of its results, which are single elements or lists
+        if self.handler is None:
+            return parsing_method
+
+        def parse_and_notify_handler(value: Any) -> Any:
+            parsed_value = parsing_method(value)
+            for element in parsed_value if isinstance(parsed_value, list) else [parsed_value]:
+                notify_handler(self.handler, element)
+            return parsed_value
+
+        return parse_and_notify_handler
+
+
+# the lists of elements that are split into chunks when parsing in parallel
+PARALLEL_LIST_NAMES = ["packages", "files", "snippets", "relationships"]
+
+# each worker process creates its parsers once, so that tasks only need to pass their chunk of elements; the licensing
+# of the license expression parsers is loaded once per worker when the modules are imported
+_worker_parsing_methods: Dict[str, Callable[[Dict], Any]] = dict()
+
+
+def _initialize_parsing_worker(excluded_fields: Set[str]) -> None:
+    global _worker_parsing_methods
+    spdx_id_pool = SpdxIdPool()
+    _worker_parsing_methods = {
+        "packages": PackageParser(spdx_id_pool, excluded_fields).parse_package,
+        "files": FileParser(spdx_id_pool, excluded_fields).parse_file,
+        "snippets": SnippetParser(spdx_id_pool, excluded_fields).parse_snippet,
+        "relationships": RelationshipParser(spdx_id_pool).parse_relationship,
+    }
+
+
+def _parse_chunk(list_name: str, element_dicts: List[Dict]) -> Tuple[List[Any], List[str]]:
+    logger = Logger()
+    parsed_elements = []
+    for element_dict in element_dicts:
+        append_parsed_field_or_log_error(logger, parsed_elements, element_dict, _worker_parsing_methods[list_name])
+    return parsed_elements, logger.get_messages()
@@ -4,7 +4,7 @@
 from beartype.typing import Union
 from license_expression import ExpressionError, LicenseExpression
 
-from spdx_tools.common.spdx_licensing import spdx_licensing
+from spdx_tools.common.spdx_licensing import parse_license_expression_str, spdx_licensing
 from spdx_tools.spdx.model import SpdxNoAssertion, SpdxNone
 from spdx_tools.spdx.parser.error import SPDXParsingError
 
@@ -19,7 +19,10 @@ class LicenseExpressionParser:
                 return SpdxNone()
 
         try:
-            license_expression = spdx_licensing.parse(license_expression_str)
+            if isinstance(license_expression_str, str):
+                license_expression = parse_license_expression_str(license_expression_str)
+            else:
+                license_expression = spdx_licensing.parse(license_expression_str)
         except ExpressionError as err:
             err_msg = f'Error parsing LicenseExpression: "{license_expression_str}"'
             if err.args:
@@ -3,7 +3,7 @@
 # SPDX-License-Identifier: Apache-2.0
 from datetime import datetime
 
-from beartype.typing import Dict, List, Optional, Union
+from beartype.typing import Collection, Dict, List, Optional, Set, Union
 from license_expression import LicenseExpression
 
 from spdx_tools.spdx.datetime_conversions import datetime_from_str
@@ -22,10 +22,12 @@ from spdx_tools.spdx.parser.error import SPDXParsingError
 from spdx_tools.spdx.parser.jsonlikedict.checksum_parser import ChecksumParser
 from spdx_tools.spdx.parser.jsonlikedict.dict_parsing_functions import (
     append_parsed_field_or_log_error,
+    get_excluded_keys,
     json_str_to_enum_name,
     parse_field_or_log_error,
     parse_field_or_no_assertion,
     parse_field_or_no_assertion_or_none,
+    remove_excluded_keys,
 )
 from spdx_tools.spdx.parser.jsonlikedict.license_expression_parser import LicenseExpressionParser
 from spdx_tools.spdx.parser.logger import Logger
@@ -33,6 +35,7 @@ from spdx_tools.spdx.parser.parsing_functions import (
     construct_or_raise_parsing_error,
     raise_parsing_error_if_logger_has_messages,
 )
+from spdx_tools.spdx.parser.spdx_id_pool import SpdxIdPool
 
 
 class PackageParser:
@@ -40,17 +43,23 @@ class PackageParser:
     actor_parser: ActorParser
     checksum_parser: ChecksumParser
     license_expression_parser: LicenseExpressionParser
+    spdx_id_pool: SpdxIdPool
+    excluded_keys: Set[str]
 
-    def __init__(self):
+    def __init__(self, spdx_id_pool: Optional[SpdxIdPool] = None, excluded_fields: Collection[str] = ()):
+        self.spdx_id_pool = SpdxIdPool() if spdx_id_pool is None else spdx_id_pool
+        # the keys of the sub-fields that are excluded from parsing are removed before parsing the element
+        self.excluded_keys = get_excluded_keys(excluded_fields)
         self.actor_parser = ActorParser()
         self.checksum_parser = ChecksumParser()
         self.license_expression_parser = LicenseExpressionParser()
         self.logger = Logger()
 
     def parse_package(self, package_dict: Dict) -> Package:
+        package_dict = remove_excluded_keys(package_dict, self.excluded_keys)
         logger = Logger()
         name: Optional[str] = package_dict.get("name")
-        spdx_id: Optional[str] = package_dict.get("SPDXID")
+        spdx_id: Optional[str] = self.spdx_id_pool.intern(package_dict.get("SPDXID"))
         attribution_texts: List[str] = package_dict.get("attributionTexts", [])
 
         built_date: Optional[datetime] = parse_field_or_log_error(
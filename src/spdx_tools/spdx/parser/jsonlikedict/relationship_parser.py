@@ -1,12 +1,13 @@
 # SPDX-FileCopyrightText: 2022 spdx contributors
 #
 # SPDX-License-Identifier: Apache-2.0
-from beartype.typing import Dict, List, Optional
+from beartype.typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
 
 from spdx_tools.common.typing.constructor_type_errors import ConstructorTypeErrors
 from spdx_tools.spdx.model import Relationship, RelationshipType
 from spdx_tools.spdx.parser.error import SPDXParsingError
 from spdx_tools.spdx.parser.jsonlikedict.dict_parsing_functions import (
+    append_parsed_field_or_log_error,
     delete_duplicates_from_list,
     json_str_to_enum_name,
     parse_field_or_log_error,
@@ -15,54 +16,79 @@ from spdx_tools.spdx.parser.jsonlikedict.dict_parsing_functions import (
 from spdx_tools.spdx.parser.logger import Logger
 from spdx_tools.spdx.parser.parsing_functions import (
     construct_or_raise_parsing_error,
+    get_relationship_key,
     raise_parsing_error_if_logger_has_messages,
 )
+from spdx_tools.spdx.parser.spdx_id_pool import SpdxIdPool
 
 
 class RelationshipParser:
     logger: Logger
+    spdx_id_pool: SpdxIdPool
 
-    def __init__(self):
+    def __init__(self, spdx_id_pool: Optional[SpdxIdPool] = None):
+        self.spdx_id_pool = SpdxIdPool() if spdx_id_pool is None else spdx_id_pool
         self.logger = Logger()
 
-    def parse_all_relationships(self, input_doc_dict: Dict) -> List[Relationship]:
+    def parse_all_relationships(
+        self,
+        input_doc_dict: Dict,
+        parse_relationship_dicts: Optional[Callable[[List[Dict]], Iterable[Relationship]]] = None,
+        handle_relationship: Optional[Callable[[Relationship], None]] = None,
+    ) -> List[Relationship]:
+        """
+        parse_relationship_dicts replaces the parsing of the list of relationships, e.g. to parse them in parallel; it
+        may yield the valid relationships before it raises the SPDXParsingError of the invalid ones. The relationships
+        implied by documentDescribes and hasFiles are always added by this parser.
+        If handle_relationship is given, each relationship is passed to it instead of being returned, so that the
+        relationships are not kept; only their keys are kept to find the implied relationships that already exist.
+        """
         relationships = []
-        relationship_dicts: List[Dict] = input_doc_dict.get("relationships", [])
-        relationships.extend(
-            parse_field_or_log_error(self.logger, relationship_dicts, self.parse_relationship, [], True)
-        )
+        relationship_keys = set()
+
+        def add_relationships(new_relationships: Iterable[Relationship]) -> None:
+            for relationship in new_relationships:
+                relationship_keys.add(get_relationship_key(relationship))
+                if handle_relationship is None:
+                    relationships.append(relationship)
+                else:
+                    handle_relationship(relationship)
+
+        relationship_dicts: List[Dict] = input_doc_dict.get("relationships") or []
+        if parse_relationship_dicts is None:
+            for relationship_dict in relationship_dicts:
+                add_relationships(
+                    append_parsed_field_or_log_error(self.logger, [], relationship_dict, self.parse_relationship)
+                )
+        elif relationship_dicts:
+            try:
+                add_relationships(parse_relationship_dicts(relationship_dicts))
+            except SPDXParsingError as err:
+                self.logger.extend(err.get_messages())
 
         document_describes: List[str] = delete_duplicates_from_list(input_doc_dict.get("documentDescribes", []))
-        doc_spdx_id: Optional[str] = input_doc_dict.get("SPDXID")
+        doc_spdx_id: Optional[str] = self.spdx_id_pool.intern(input_doc_dict.get("SPDXID"))
 
-        existing_relationships_without_comments: List[Relationship] = self.get_all_relationships_without_comments(
-            relationships
-        )
-        relationships.extend(
+        add_relationships(
             parse_field_or_log_error(
                 self.logger,
                 document_describes,
                 lambda x: self.parse_document_describes(
                     doc_spdx_id=doc_spdx_id,
                     described_spdx_ids=x,
-                    existing_relationships=existing_relationships_without_comments,
+                    existing_relationship_keys=relationship_keys,
                 ),
                 [],
             )
         )
 
+        # the implied relationships only need the dicts of the packages, not the parsed packages
         package_dicts: List[Dict] = input_doc_dict.get("packages", [])
-        existing_relationships_without_comments: List[Relationship] = self.get_all_relationships_without_comments(
-            relationships
-        )
-
-        relationships.extend(
+        add_relationships(
             parse_field_or_log_error(
                 self.logger,
                 package_dicts,
-                lambda x: self.parse_has_files(
-                    package_dicts=x, existing_relationships=existing_relationships_without_comments
-                ),
+                lambda x: self.parse_has_files(package_dicts=x, existing_relationship_keys=relationship_keys),
                 [],
             )
         )
@@ -80,9 +106,9 @@ class RelationshipParser:
 
     def parse_relationship(self, relationship_dict: Dict) -> Relationship:
         logger = Logger()
-        spdx_element_id: Optional[str] = relationship_dict.get("spdxElementId")
-        related_spdx_element: Optional[str] = parse_field_or_no_assertion_or_none(
-            relationship_dict.get("relatedSpdxElement")
+        spdx_element_id: Optional[str] = self.spdx_id_pool.intern(relationship_dict.get("spdxElementId"))
+        related_spdx_element: Optional[str] = self.spdx_id_pool.intern(
+            parse_field_or_no_assertion_or_none(relationship_dict.get("relatedSpdxElement"))
         )
         relationship_type: Optional[RelationshipType] = parse_field_or_log_error(
             logger, relationship_dict.get("relationshipType"), self.parse_relationship_type
@@ -110,34 +136,44 @@ class RelationshipParser:
         return relationship_type
 
     def parse_document_describes(
-        self, doc_spdx_id: str, described_spdx_ids: List[str], existing_relationships: List[Relationship]
+        self,
+        doc_spdx_id: str,
+        described_spdx_ids: List[str],
+        existing_relationships: Optional[List[Relationship]] = None,
+        existing_relationship_keys: Optional[Set[Tuple[Any, ...]]] = None,
     ) -> List[Relationship]:
         logger = Logger()
         describes_relationships = []
+        if existing_relationship_keys is None:
+            existing_relationship_keys = self.get_relationship_keys(existing_relationships or [])
         for spdx_id in described_spdx_ids:
             try:
                 describes_relationship = Relationship(
                     spdx_element_id=doc_spdx_id,
                     relationship_type=RelationshipType.DESCRIBES,
-                    related_spdx_element_id=spdx_id,
+                    related_spdx_element_id=self.spdx_id_pool.intern(spdx_id),
                 )
             except ConstructorTypeErrors as err:
                 logger.append(err.get_messages())
                 continue
-            if not self.check_if_relationship_exists(describes_relationship, existing_relationships):
+            if not self.check_if_relationship_exists(describes_relationship, existing_relationship_keys):
                 describes_relationships.append(describes_relationship)
         raise_parsing_error_if_logger_has_messages(logger, "document describes relationships")
 
         return describes_relationships
 
     def parse_has_files(
-        self, package_dicts: List[Dict], existing_relationships: List[Relationship]
+        self,
+        package_dicts: List[Dict],
+        existing_relationships: Optional[List[Relationship]] = None,
+        existing_relationship_keys: Optional[Set[Tuple[Any, ...]]] = None,
     ) -> List[Relationship]:
-        # assume existing relationships are stripped of comments
         logger = Logger()
         contains_relationships = []
+        if existing_relationship_keys is None:
+            existing_relationship_keys = self.get_relationship_keys(existing_relationships or [])
         for package in package_dicts:
-            package_spdx_id: Optional[str] = package.get("SPDXID")
+            package_spdx_id: Optional[str] = self.spdx_id_pool.intern(package.get("SPDXID"))
             contained_files: List[str] = delete_duplicates_from_list(package.get("hasFiles", []))
             if not contained_files:
                 continue
@@ -146,50 +182,36 @@ class RelationshipParser:
                     contains_relationship = Relationship(
                         spdx_element_id=package_spdx_id,
                         relationship_type=RelationshipType.CONTAINS,
-                        related_spdx_element_id=file_spdx_id,
+                        related_spdx_element_id=self.spdx_id_pool.intern(file_spdx_id),
                     )
                 except ConstructorTypeErrors as err:
                     logger.append(err.get_messages())
                     continue
-                if not self.check_if_relationship_exists(
-                    relationship=contains_relationship, existing_relationships=existing_relationships
-                ):
+                if not self.check_if_relationship_exists(contains_relationship, existing_relationship_keys):
                     contains_relationships.append(contains_relationship)
         raise_parsing_error_if_logger_has_messages(logger, "package contains relationships")
 
         return contains_relationships
 
     def check_if_relationship_exists(
-        self, relationship: Relationship, existing_relationships: List[Relationship]
+        self, relationship: Relationship, existing_relationship_keys: Set[Tuple[Any, ...]]
     ) -> bool:
-        # assume existing relationships are stripped of comments
-        if relationship in existing_relationships:
+        # the keys ignore comments, so a relationship also exists if it only differs in its comment
+        if get_relationship_key(relationship) in existing_relationship_keys:
             return True
-        relationship_inverted: Relationship = self.invert_relationship(relationship)
-        if relationship_inverted in existing_relationships:
+        inverted_relationship_key = (
+            relationship.related_spdx_element_id,
+            self.invert_relationship_types[relationship.relationship_type],
+            relationship.spdx_element_id,
+        )
+        if inverted_relationship_key in existing_relationship_keys:
             return True
 
         return False
 
     @staticmethod
-    def get_all_relationships_without_comments(existing_relationships: List[Relationship]) -> List[Relationship]:
-        relationships_without_comments = [
-            Relationship(
-                relationship_type=relationship.relationship_type,
-                related_spdx_element_id=relationship.related_spdx_element_id,
-                spdx_element_id=relationship.spdx_element_id,
-            )
-            for relationship in existing_relationships
-        ]
-        return relationships_without_comments
-
-    def invert_relationship(self, relationship: Relationship) -> Relationship:
-        return Relationship(
-            related_spdx_element_id=relationship.spdx_element_id,
-            spdx_element_id=relationship.related_spdx_element_id,
-            relationship_type=self.invert_relationship_types[relationship.relationship_type],
-            comment=relationship.comment,
-        )
+    def get_relationship_keys(relationships: List[Relationship]) -> Set[Tuple[Any, ...]]:
+        return {get_relationship_key(relationship) for relationship in relationships}
 
     invert_relationship_types = {
         RelationshipType.DESCRIBES: RelationshipType.DESCRIBED_BY,
@@ -3,18 +3,21 @@
 # SPDX-License-Identifier: Apache-2.0
 from enum import Enum, auto
 
-from beartype.typing import Dict, List, Optional, Tuple, Union
+from beartype.typing import Collection, Dict, List, Optional, Set, Tuple, Union
 from license_expression import LicenseExpression
 
 from spdx_tools.spdx.model import Snippet, SpdxNoAssertion, SpdxNone
 from spdx_tools.spdx.parser.error import SPDXParsingError
 from spdx_tools.spdx.parser.jsonlikedict.dict_parsing_functions import (
+    get_excluded_keys,
     parse_field_or_log_error,
     parse_field_or_no_assertion_or_none,
+    remove_excluded_keys,
 )
 from spdx_tools.spdx.parser.jsonlikedict.license_expression_parser import LicenseExpressionParser
 from spdx_tools.spdx.parser.logger import Logger
 from spdx_tools.spdx.parser.parsing_functions import construct_or_raise_parsing_error
+from spdx_tools.spdx.parser.spdx_id_pool import SpdxIdPool
 
 
 class RangeType(Enum):
@@ -25,15 +28,21 @@ class RangeType(Enum):
 class SnippetParser:
     logger: Logger
     license_expression_parser = LicenseExpressionParser
+    spdx_id_pool: SpdxIdPool
+    excluded_keys: Set[str]
 
-    def __init__(self):
+    def __init__(self, spdx_id_pool: Optional[SpdxIdPool] = None, excluded_fields: Collection[str] = ()):
+        self.spdx_id_pool = SpdxIdPool() if spdx_id_pool is None else spdx_id_pool
+        # the keys of the sub-fields that are excluded from parsing are removed before parsing the element
+        self.excluded_keys = get_excluded_keys(excluded_fields)
         self.logger = Logger()
         self.license_expression_parser = LicenseExpressionParser()
 
     def parse_snippet(self, snippet_dict: Dict) -> Snippet:
+        snippet_dict = remove_excluded_keys(snippet_dict, self.excluded_keys)
         logger = Logger()
-        spdx_id: Optional[str] = snippet_dict.get("SPDXID")
-        file_spdx_id: Optional[str] = snippet_dict.get("snippetFromFile")
+        spdx_id: Optional[str] = self.spdx_id_pool.intern(snippet_dict.get("SPDXID"))
+        file_spdx_id: Optional[str] = self.spdx_id_pool.intern(snippet_dict.get("snippetFromFile"))
         name: Optional[str] = snippet_dict.get("name")
 
         ranges: Dict = parse_field_or_log_error(logger, snippet_dict.get("ranges", []), self.parse_ranges, default={})
@@ -11,16 +11,34 @@
 # limitations under the License.
 import logging
 
+from beartype.typing import Collection, Optional
+
 from spdx_tools.spdx.formats import FileFormat, file_name_to_format
 from spdx_tools.spdx.model import Document
 from spdx_tools.spdx.parser.json import json_parser
+from spdx_tools.spdx.parser.parsing_handler import ParsingHandler
 from spdx_tools.spdx.parser.rdf import rdf_parser
 from spdx_tools.spdx.parser.tagvalue import tagvalue_parser
 from spdx_tools.spdx.parser.xml import xml_parser
 from spdx_tools.spdx.parser.yaml import yaml_parser
 
 
-def parse_file(file_name: str, encoding: str = "utf-8") -> Document:
+def parse_file(
+    file_name: str,
+    encoding: str = "utf-8",
+    handler: Optional[ParsingHandler] = None,
+    build_document: bool = True,
+    include: Optional[Collection[str]] = None,
+    exclude: Optional[Collection[str]] = None,
+) -> Optional[Document]:
+    """
+    Parses the file into a Document; its format is determined by the file ending. If a handler is given, each parsed
+    element is passed to the corresponding hook of the handler as soon as it has been parsed. With
+    build_document=False, the elements are only passed to the handler, no Document is constructed and None is returned.
+    include and exclude select the fields of the document to parse: include lists the types of elements to parse
+    (packages, files, snippets, annotations, relationships and extracted_licensing_info, all by default), exclude lists
+    types of elements or the sub-fields license_fields and checksums of packages, files and snippets to skip.
+    """
     if encoding != "utf-8":
         logging.warning(
             "It's recommended to use the UTF-8 encoding for any SPDX file. Consider changing the encoding of the file."
@@ -28,12 +46,12 @@ def parse_file(file_name: str, encoding: str = "utf-8") -> Document:
 
     input_format = file_name_to_format(file_name)
     if input_format == FileFormat.RDF_XML:
-        return rdf_parser.parse_from_file(file_name, encoding)
+        return rdf_parser.parse_from_file(file_name, encoding, handler, build_document, include, exclude)
     elif input_format == FileFormat.TAG_VALUE:
-        return tagvalue_parser.parse_from_file(file_name, encoding)
+        return tagvalue_parser.parse_from_file(file_name, encoding, handler, build_document, include, exclude)
     elif input_format == FileFormat.JSON:
-        return json_parser.parse_from_file(file_name, encoding)
+        return json_parser.parse_from_file(file_name, encoding, handler, build_document, include, exclude)
     elif input_format == FileFormat.XML:
-        return xml_parser.parse_from_file(file_name, encoding)
+        return xml_parser.parse_from_file(file_name, encoding, handler, build_document, include, exclude)
     elif input_format == FileFormat.YAML:
-        return yaml_parser.parse_from_file(file_name, encoding)
+        return yaml_parser.parse_from_file(file_name, encoding, handler, build_document, include, exclude)
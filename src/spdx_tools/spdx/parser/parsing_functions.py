@@ -1,16 +1,22 @@
 # SPDX-FileCopyrightText: 2023 spdx contributors
 #
 # SPDX-License-Identifier: Apache-2.0
-from beartype.typing import Any, Dict
+from beartype.typing import Any, Dict, Tuple
 
 from spdx_tools.common.typing.constructor_type_errors import ConstructorTypeErrors
+from spdx_tools.common.typing.type_checks import check_types, type_checks_disabled
+from spdx_tools.spdx.model import Relationship
 from spdx_tools.spdx.parser.error import SPDXParsingError
 from spdx_tools.spdx.parser.logger import Logger
 
 
 def construct_or_raise_parsing_error(object_to_construct: Any, args_for_construction: Dict) -> Any:
     try:
-        constructed_object = object_to_construct(**args_for_construction)
+        # the values parsed from the input are checked in one pass over the constructed object instead of one
+        # type-checked setter call per field, which dominates the construction time of large documents
+        with type_checks_disabled():
+            constructed_object = object_to_construct(**args_for_construction)
+        check_types(constructed_object)
     except ConstructorTypeErrors as err:
         raise SPDXParsingError([f"Error while constructing {object_to_construct.__name__}: {err.get_messages()}"])
     except TypeError as err:
@@ -24,3 +30,12 @@ def raise_parsing_error_if_logger_has_messages(logger: Logger, parsed_object_nam
             raise SPDXParsingError([f"Error while parsing {parsed_object_name}: {logger.get_messages()}"])
         else:
             raise SPDXParsingError(logger.get_messages())
+
+
+def get_relationship_key(relationship: Relationship) -> Tuple[Any, ...]:
+    # hashable (origin, type, target) key that ignores the comment; SpdxNone and SpdxNoAssertion are not hashable and
+    # are represented by their type
+    related_spdx_element_id = relationship.related_spdx_element_id
+    if not isinstance(related_spdx_element_id, str):
+        related_spdx_element_id = type(related_spdx_element_id)
+    return relationship.spdx_element_id, relationship.relationship_type, related_spdx_element_id
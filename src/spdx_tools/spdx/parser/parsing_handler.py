@@ -0,0 +1,61 @@
+# SPDX-FileCopyrightText: 2026 spdx contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+from beartype.typing import Any, Dict, Optional
+
+from spdx_tools.spdx.model import (
+    Annotation,
+    CreationInfo,
+    ExtractedLicensingInfo,
+    File,
+    Package,
+    Relationship,
+    Snippet,
+)
+
+
+class ParsingHandler:
+    """
+    Base class for handlers that are passed to the parsers to receive the parsed elements of a document one at a time,
+    as soon as each of them has been parsed. Override the hooks of the elements you are interested in; the other hooks
+    do nothing. The hooks are called in the order in which the parser encounters the elements, which depends on the
+    format. If some elements can't be parsed, the hooks are still called for all valid elements and the
+    SPDXParsingError is raised at the end of parsing.
+    """
+
+    def on_creation_info(self, creation_info: CreationInfo) -> None:
+        pass
+
+    def on_package(self, package: Package) -> None:
+        pass
+
+    def on_file(self, file: File) -> None:
+        pass
+
+    def on_snippet(self, snippet: Snippet) -> None:
+        pass
+
+    def on_relationship(self, relationship: Relationship) -> None:
+        pass
+
+    def on_annotation(self, annotation: Annotation) -> None:
+        pass
+
+    def on_extracted_licensing_info(self, extracted_licensing_info: ExtractedLicensingInfo) -> None:
+        pass
+
+
+HOOK_NAMES: Dict[type, str] = {
+    CreationInfo: "on_creation_info",
+    Package: "on_package",
+    File: "on_file",
+    Snippet: "on_snippet",
+    Relationship: "on_relationship",
+    Annotation: "on_annotation",
+    ExtractedLicensingInfo: "on_extracted_licensing_info",
+}
+
+
+def notify_handler(handler: Optional[ParsingHandler], element: Any) -> None:
+    if handler is not None:
+        getattr(handler, HOOK_NAMES[type(element)])(element)
@@ -0,0 +1,33 @@
+# SPDX-FileCopyrightText: 2026 spdx contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+from beartype.typing import Collection, Optional, Set
+
+# the fields of a document that can be included in or excluded from parsing; the creation info is always parsed
+ELEMENT_FIELDS = ["packages", "files", "snippets", "annotations", "relationships", "extracted_licensing_info"]
+
+# the fields of packages, files and snippets that are expensive to parse and can be excluded from parsing
+LICENSE_FIELDS = "license_fields"
+CHECKSUMS = "checksums"
+SUB_FIELDS = [LICENSE_FIELDS, CHECKSUMS]
+
+
+def get_excluded_fields(
+    include: Optional[Collection[str]] = None, exclude: Optional[Collection[str]] = None
+) -> Set[str]:
+    """
+    Returns the names of the fields that are skipped during parsing. include selects the fields from ELEMENT_FIELDS
+    that are parsed (all of them by default), exclude names fields from ELEMENT_FIELDS or SUB_FIELDS that are not
+    parsed. Excluded license fields are None or empty lists in the parsed elements, as are excluded checksums.
+    """
+    include = ELEMENT_FIELDS if include is None else include
+    exclude = [] if exclude is None else exclude
+    unknown_fields = [field for field in include if field not in ELEMENT_FIELDS]
+    unknown_fields += [field for field in exclude if field not in ELEMENT_FIELDS + SUB_FIELDS]
+    if unknown_fields:
+        raise ValueError(
+            f"Unknown fields to include or exclude: {unknown_fields}. Fields to include have to be in "
+            f"{ELEMENT_FIELDS}, fields to exclude in {ELEMENT_FIELDS + SUB_FIELDS}."
+        )
+
+    return {field for field in ELEMENT_FIELDS if field not in include} | set(exclude)
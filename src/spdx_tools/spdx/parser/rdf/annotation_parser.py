@@ -1,6 +1,7 @@
 # SPDX-FileCopyrightText: 2023 spdx contributors
 #
 # SPDX-License-Identifier: Apache-2.0
+from beartype.typing import Optional
 from rdflib import RDFS, BNode, Graph, URIRef
 
 from spdx_tools.spdx.datetime_conversions import datetime_from_str
@@ -12,12 +13,19 @@ from spdx_tools.spdx.parser.parsing_functions import (
     raise_parsing_error_if_logger_has_messages,
 )
 from spdx_tools.spdx.parser.rdf.graph_parsing_functions import parse_enum_value, parse_literal, parse_spdx_id
+from spdx_tools.spdx.parser.spdx_id_pool import SpdxIdPool
 from spdx_tools.spdx.rdfschema.namespace import SPDX_NAMESPACE
 
 
-def parse_annotation(annotation_node: BNode, graph: Graph, parent_node: URIRef, doc_namespace: str) -> Annotation:
+def parse_annotation(
+    annotation_node: BNode,
+    graph: Graph,
+    parent_node: URIRef,
+    doc_namespace: str,
+    spdx_id_pool: Optional[SpdxIdPool] = None,
+) -> Annotation:
     logger = Logger()
-    spdx_id = parse_spdx_id(parent_node, doc_namespace, graph)
+    spdx_id = parse_spdx_id(parent_node, doc_namespace, graph, spdx_id_pool)
     annotator = parse_literal(
         logger, graph, annotation_node, SPDX_NAMESPACE.annotator, parsing_method=ActorParser.parse_actor
     )
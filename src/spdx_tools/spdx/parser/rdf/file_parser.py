@@ -1,7 +1,7 @@
 # SPDX-FileCopyrightText: 2023 spdx contributors
 #
 # SPDX-License-Identifier: Apache-2.0
-from beartype.typing import Union
+from beartype.typing import Optional, Union
 from rdflib import RDFS, BNode, Graph, URIRef
 
 from spdx_tools.spdx.model import File, FileType
@@ -21,12 +21,15 @@ from spdx_tools.spdx.parser.rdf.graph_parsing_functions import (
     parse_spdx_id,
 )
 from spdx_tools.spdx.parser.rdf.license_expression_parser import parse_license_expression
+from spdx_tools.spdx.parser.spdx_id_pool import SpdxIdPool
 from spdx_tools.spdx.rdfschema.namespace import SPDX_NAMESPACE
 
 
-def parse_file(file_node: Union[URIRef, BNode], graph: Graph, doc_namespace: str) -> File:
+def parse_file(
+    file_node: Union[URIRef, BNode], graph: Graph, doc_namespace: str, spdx_id_pool: Optional[SpdxIdPool] = None
+) -> File:
     logger = Logger()
-    spdx_id = parse_spdx_id(file_node, doc_namespace, graph)
+    spdx_id = parse_spdx_id(file_node, doc_namespace, graph, spdx_id_pool)
     name = parse_literal(logger, graph, file_node, SPDX_NAMESPACE.fileName)
     checksums = []
     for _, _, checksum_node in get_correctly_typed_triples(logger, graph, file_node, SPDX_NAMESPACE.checksum):
@@ -6,7 +6,6 @@ from enum import Enum
 from beartype.typing import Any, Callable, Optional, Tuple, Type, Union
 from rdflib import RDF, Graph, URIRef
 from rdflib.exceptions import UniquenessError
-from rdflib.namespace import NamespaceManager
 from rdflib.term import BNode, Literal, Node
 
 from spdx_tools.spdx.casing_tools import camel_case_to_snake_case
@@ -15,6 +14,7 @@ from spdx_tools.spdx.model.spdx_no_assertion import SPDX_NO_ASSERTION_STRING
 from spdx_tools.spdx.model.spdx_none import SPDX_NONE_STRING
 from spdx_tools.spdx.parser.error import SPDXParsingError
 from spdx_tools.spdx.parser.logger import Logger
+from spdx_tools.spdx.parser.spdx_id_pool import SpdxIdPool
 from spdx_tools.spdx.rdfschema.namespace import SPDX_NAMESPACE
 
 
@@ -86,15 +86,21 @@ def parse_enum_value(enum_str: str, enum_class: Type[Enum], prefix: str) -> Enum
         raise SPDXParsingError([f"Invalid value for {enum_class}: {enum_str}"])
 
 
-def parse_spdx_id(resource: Union[URIRef, BNode], doc_namespace: str, graph: Graph) -> Optional[str]:
+def parse_spdx_id(
+    resource: Union[URIRef, BNode], doc_namespace: str, graph: Graph, spdx_id_pool: Optional[SpdxIdPool] = None
+) -> Optional[str]:
     if not resource or isinstance(resource, BNode):
         return None
     if resource.startswith(f"{doc_namespace}#"):
-        return resource.fragment
-    if "#" in resource:
-        namespace_manager = NamespaceManager(graph)
-        return namespace_manager.normalizeUri(resource)
-    return resource.toPython() or None
+        spdx_id = resource.fragment
+    elif "#" in resource:
+        # the namespace manager of the graph is created once and caches the prefixes of the namespaces
+        spdx_id = graph.namespace_manager.normalizeUri(resource)
+    else:
+        spdx_id = resource.toPython() or None
+    if spdx_id_pool is None:
+        return spdx_id
+    return spdx_id_pool.intern(spdx_id)
 
 
 # Python 3.9 introduced the method removeprefix() for strings, but as we are also supporting Python 3.7 and 3.8 we need
@@ -0,0 +1,83 @@
+# SPDX-FileCopyrightText: 2026 spdx contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+from beartype.typing import Any, Dict, List, Optional
+from rdflib import Graph
+from rdflib.exceptions import UniquenessError
+from rdflib.term import Node, URIRef
+
+
+class IndexedGraph(Graph):
+    """
+    View of a Graph that shares its store and namespace manager and answers the queries for the objects of a subject
+    and predicate, which make up almost all queries of the RDF parser, with dict lookups instead of store queries.
+    The index maps each subject to its predicates and their objects and is built in one pass over the graph when it
+    is first used. Changes made through the IndexedGraph discard the index, changes to the underlying graph are not
+    noticed, so it must not be changed while the IndexedGraph is used.
+    """
+
+    _index: Optional[Dict[Node, Dict[Node, List[Node]]]]
+
+    def __init__(self, graph: Graph):
+        super().__init__(store=graph.store, identifier=graph.identifier, namespace_manager=graph.namespace_manager)
+        self._index = None
+
+    def get_objects(self, subject: Node, predicate: Node) -> List[Node]:
+        if self._index is None:
+            self._index = self._build_index()
+        predicates = self._index.get(subject)
+        if predicates is None:
+            return []
+        return predicates.get(predicate, [])
+
+    def _build_index(self) -> Dict[Node, Dict[Node, List[Node]]]:
+        index = dict()
+        for subject, predicate, _object in super().triples((None, None, None)):
+            index.setdefault(subject, {}).setdefault(predicate, []).append(_object)
+        # the store returns all triples in arbitrary order, but the objects of a subject and predicate in the order in
+        # which they were added, which is the order in the file; this order is restored for the few predicates with
+        # multiple objects
+        for subject, predicates in index.items():
+            for predicate, objects in predicates.items():
+                if len(objects) > 1:
+                    predicates[predicate] = [
+                        _object for _, _, _object in Graph.triples(self, (subject, predicate, None))
+                    ]
+        return index
+
+    def triples(self, triple):
+        subject, predicate, _object = triple
+        if subject is None or _object is not None or not isinstance(predicate, URIRef):
+            yield from super().triples(triple)
+            return
+        for _object in self.get_objects(subject, predicate):
+            yield subject, predicate, _object
+
+    def value(
+        self,
+        subject: Optional[Node] = None,
+        predicate: Optional[Node] = None,
+        object: Optional[Node] = None,
+        default: Optional[Node] = None,
+        any: bool = True,
+    ) -> Any:
+        if subject is None or object is not None or not isinstance(predicate, URIRef):
+            return super().value(subject, predicate, object, default, any)
+        objects = self.get_objects(subject, predicate)
+        if not objects:
+            return default
+        if not any and len(objects) > 1:
+            raise UniquenessError(objects)
+        return objects[0]
+
+    def add(self, triple):
+        self._index = None
+        return super().add(triple)
+
+    def addN(self, quads):  # noqa: N802
+        self._index = None
+        return super().addN(quads)
+
+    def remove(self, triple):
+        self._index = None
+        return super().remove(triple)
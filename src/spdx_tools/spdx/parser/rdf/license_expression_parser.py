@@ -6,7 +6,7 @@ from license_expression import LicenseExpression
 from rdflib import RDF, Graph
 from rdflib.term import BNode, Identifier, Node, URIRef
 
-from spdx_tools.common.spdx_licensing import spdx_licensing
+from spdx_tools.common.spdx_licensing import parse_license_expression_str
 from spdx_tools.spdx.parser.logger import Logger
 from spdx_tools.spdx.parser.rdf.graph_parsing_functions import get_value_from_graph, remove_prefix
 from spdx_tools.spdx.rdfschema.namespace import LICENSE_NAMESPACE, SPDX_NAMESPACE
@@ -24,10 +24,10 @@ def parse_license_expression(
     expression = ""
     if license_expression_node.startswith(LICENSE_NAMESPACE):
         expression = remove_prefix(license_expression_node, LICENSE_NAMESPACE)
-        return spdx_licensing.parse(expression)
+        return parse_license_expression_str(expression)
     if license_expression_node.startswith(doc_namespace):
         expression = license_expression_node.fragment
-        return spdx_licensing.parse(expression)
+        return parse_license_expression_str(expression)
 
     node_type = graph.value(license_expression_node, RDF.type)
     if node_type == SPDX_NAMESPACE.ConjunctiveLicenseSet:
@@ -51,7 +51,7 @@ def parse_license_expression(
         )
         expression = f"{license_expression} WITH {exception}"
 
-    return spdx_licensing.parse(expression)
+    return parse_license_expression_str(expression)
 
 
 def parse_license_exception(exception_node: Identifier, graph: Graph, logger) -> str:
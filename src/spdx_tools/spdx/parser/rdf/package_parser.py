@@ -30,12 +30,15 @@ from spdx_tools.spdx.parser.rdf.graph_parsing_functions import (
     parse_spdx_id,
 )
 from spdx_tools.spdx.parser.rdf.license_expression_parser import parse_license_expression
+from spdx_tools.spdx.parser.spdx_id_pool import SpdxIdPool
 from spdx_tools.spdx.rdfschema.namespace import REFERENCE_NAMESPACE, SPDX_NAMESPACE
 
 
-def parse_package(package_node: Union[URIRef, BNode], graph: Graph, doc_namespace: str) -> Package:
+def parse_package(
+    package_node: Union[URIRef, BNode], graph: Graph, doc_namespace: str, spdx_id_pool: Optional[SpdxIdPool] = None
+) -> Package:
     logger = Logger()
-    spdx_id = parse_spdx_id(package_node, doc_namespace, graph)
+    spdx_id = parse_spdx_id(package_node, doc_namespace, graph, spdx_id_pool)
     name = parse_literal(logger, graph, package_node, SPDX_NAMESPACE.name)
     download_location = parse_literal_or_no_assertion_or_none(
         logger, graph, package_node, SPDX_NAMESPACE.downloadLocation
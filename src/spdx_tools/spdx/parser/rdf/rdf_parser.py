@@ -1,7 +1,7 @@
 # SPDX-FileCopyrightText: 2023 spdx contributors
 #
 # SPDX-License-Identifier: Apache-2.0
-from beartype.typing import Any, Dict
+from beartype.typing import Any, Collection, Dict, Optional, Set
 from rdflib import RDF, Graph
 
 from spdx_tools.spdx.model import Document, RelationshipType
@@ -9,44 +9,125 @@ from spdx_tools.spdx.parser.error import SPDXParsingError
 from spdx_tools.spdx.parser.logger import Logger
 from spdx_tools.spdx.parser.parsing_functions import (
     construct_or_raise_parsing_error,
+    get_relationship_key,
     raise_parsing_error_if_logger_has_messages,
 )
+from spdx_tools.spdx.parser.parsing_handler import ParsingHandler, notify_handler
+from spdx_tools.spdx.parser.projection import CHECKSUMS, LICENSE_FIELDS, get_excluded_fields
 from spdx_tools.spdx.parser.rdf.annotation_parser import parse_annotation
 from spdx_tools.spdx.parser.rdf.creation_info_parser import parse_creation_info
 from spdx_tools.spdx.parser.rdf.extracted_licensing_info_parser import parse_extracted_licensing_info
 from spdx_tools.spdx.parser.rdf.file_parser import parse_file
 from spdx_tools.spdx.parser.rdf.graph_parsing_functions import get_correctly_typed_triples
+from spdx_tools.spdx.parser.rdf.indexed_graph import IndexedGraph
 from spdx_tools.spdx.parser.rdf.package_parser import parse_package
+from spdx_tools.spdx.parser.rdf.rdf_xml_reader import RdfXmlReader, UnsupportedRdfXmlError
 from spdx_tools.spdx.parser.rdf.relationship_parser import parse_implicit_relationship, parse_relationship
 from spdx_tools.spdx.parser.rdf.snippet_parser import parse_snippet
+from spdx_tools.spdx.parser.spdx_id_pool import SpdxIdPool
 from spdx_tools.spdx.rdfschema.namespace import SPDX_NAMESPACE
 
+# the predicates of the sub-fields of packages, files and snippets that can be excluded from parsing
+EXCLUDABLE_PREDICATES = {
+    LICENSE_FIELDS: [
+        SPDX_NAMESPACE.licenseConcluded,
+        SPDX_NAMESPACE.licenseDeclared,
+        SPDX_NAMESPACE.licenseInfoFromFiles,
+        SPDX_NAMESPACE.licenseInfoInFile,
+        SPDX_NAMESPACE.licenseInfoInSnippet,
+    ],
+    CHECKSUMS: [SPDX_NAMESPACE.checksum],
+}
 
-def parse_from_file(file_name: str, encoding: str = "utf-8") -> Document:
+# the readers of RDF/XML files that can be selected with the backend argument of parse_from_file(); expat reads the
+# RDF/XML constructs used by SPDX documents faster than rdflib and leaves all other files to rdflib
+BACKENDS = ["rdflib", "expat"]
+
+
+def parse_from_file(
+    file_name: str,
+    encoding: str = "utf-8",
+    handler: Optional[ParsingHandler] = None,
+    build_document: bool = True,
+    include: Optional[Collection[str]] = None,
+    exclude: Optional[Collection[str]] = None,
+    backend: str = "rdflib",
+) -> Optional[Document]:
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend: {backend}. Available backends are {BACKENDS}.")
+    excluded_fields = get_excluded_fields(include, exclude)
     graph = Graph()
     with open(file_name, encoding=encoding) as file:
-        graph.parse(file, format="xml")
+        if backend == "expat":
+            try:
+                RdfXmlReader(graph).read(file)
+            except UnsupportedRdfXmlError:
+                graph = Graph()
+                file.seek(0)
+                graph.parse(file, format="xml")
+        else:
+            graph.parse(file, format="xml")
+    remove_excluded_sub_fields(graph, excluded_fields)
 
-    document: Document = translate_graph_to_document(graph)
+    document: Optional[Document] = translate_graph_to_document(graph, handler, build_document, include, exclude)
     return document
 
 
-def translate_graph_to_document(graph: Graph) -> Document:
+def remove_excluded_sub_fields(graph: Graph, excluded_fields: Set[str]) -> None:
+    # removes the triples of the excluded sub-fields of packages, files and snippets from the graph, so that they are
+    # not parsed
+    excluded_predicates = [
+        predicate
+        for sub_field, predicates in EXCLUDABLE_PREDICATES.items()
+        if sub_field in excluded_fields
+        for predicate in predicates
+    ]
+    for element_type in [SPDX_NAMESPACE.Package, SPDX_NAMESPACE.File, SPDX_NAMESPACE.Snippet]:
+        for element_node in list(graph.subjects(RDF.type, element_type)):
+            for predicate in excluded_predicates:
+                graph.remove((element_node, predicate, None))
+
+
+def translate_graph_to_document(
+    graph: Graph,
+    handler: Optional[ParsingHandler] = None,
+    build_document: bool = True,
+    include: Optional[Collection[str]] = None,
+    exclude: Optional[Collection[str]] = None,
+) -> Optional[Document]:
+    # if a handler is given, each element is passed to it as soon as it has been parsed; with build_document=False,
+    # the elements are not kept and None is returned
+    # include and exclude select the types of elements to parse, the sub-fields of elements are only excluded by
+    # parse_from_file()
+    excluded_fields = get_excluded_fields(include, exclude)
     parsed_fields: Dict[str, Any] = dict()
     logger = Logger()
+    # the values of the elements are looked up in an index of the graph instead of querying the store for each field
+    graph = IndexedGraph(graph)
     creation_info, doc_node = parse_creation_info(graph)
+    notify_handler(handler, creation_info)
 
     parsed_fields["creation_info"] = creation_info
+    # all parsed SPDX ids are interned, so that equal ids in the document share one object
+    spdx_id_pool = SpdxIdPool()
+    spdx_id_pool.intern(creation_info.spdx_id)
+    # the keys of all parsed relationships, to skip implicit relationships that duplicate explicit ones
+    relationship_keys = set()
 
     for element, triple, parsing_method in [
         ("packages", (None, RDF.type, SPDX_NAMESPACE.Package), parse_package),
         ("files", (None, RDF.type, SPDX_NAMESPACE.File), parse_file),
         ("snippets", (None, RDF.type, SPDX_NAMESPACE.Snippet), parse_snippet),
     ]:
+        if element in excluded_fields:
+            continue
         elements = []
         for element_node, _, _ in get_correctly_typed_triples(logger, graph, *triple):
             try:
-                elements.append(parsing_method(element_node, graph, creation_info.document_namespace))
+                parsed_element = parsing_method(element_node, graph, creation_info.document_namespace, spdx_id_pool)
+                notify_handler(handler, parsed_element)
+                if build_document:
+                    elements.append(parsed_element)
             except SPDXParsingError as err:
                 logger.extend(err.get_messages())
         parsed_fields[element] = elements
@@ -55,10 +136,19 @@ def translate_graph_to_document(graph: Graph) -> Document:
         ("annotations", (None, SPDX_NAMESPACE.annotation, None), parse_annotation),
         ("relationships", (None, SPDX_NAMESPACE.relationship, None), parse_relationship),
     ]:
+        if element in excluded_fields:
+            continue
         elements = []
         for parent_node, _, element_node in graph.triples(triple):
             try:
-                elements.append(parsing_method(element_node, graph, parent_node, creation_info.document_namespace))
+                parsed_element = parsing_method(
+                    element_node, graph, parent_node, creation_info.document_namespace, spdx_id_pool
+                )
+                notify_handler(handler, parsed_element)
+                if element == "relationships":
+                    relationship_keys.add(get_relationship_key(parsed_element))
+                if build_document:
+                    elements.append(parsed_element)
             except SPDXParsingError as err:
                 logger.extend(err.get_messages())
         parsed_fields[element] = elements
@@ -67,30 +157,42 @@ def translate_graph_to_document(graph: Graph) -> Document:
         ((None, SPDX_NAMESPACE.hasFile, None), RelationshipType.CONTAINS),
         ((None, SPDX_NAMESPACE.describesPackage, None), RelationshipType.DESCRIBES),
     ]:
+        if "relationships" in excluded_fields:
+            continue
         for parent_node, _, element_node in get_correctly_typed_triples(logger, graph, *triple):
             try:
                 relationship = parse_implicit_relationship(
-                    parent_node, relationship_type, element_node, graph, creation_info.document_namespace
+                    parent_node, relationship_type, element_node, graph, creation_info.document_namespace, spdx_id_pool
                 )
-                if relationship not in parsed_fields["relationships"]:
-                    parsed_fields["relationships"].append(relationship)
+                relationship_key = get_relationship_key(relationship)
+                if relationship_key not in relationship_keys:
+                    relationship_keys.add(relationship_key)
+                    if build_document:
+                        parsed_fields["relationships"].append(relationship)
+                    notify_handler(handler, relationship)
 
             except SPDXParsingError as err:
                 logger.extend(err.get_messages())
 
-    extracted_licensing_infos = []
-    for _, _, extracted_licensing_info_node in get_correctly_typed_triples(
-        logger, graph, None, SPDX_NAMESPACE.hasExtractedLicensingInfo
-    ):
-        try:
-            extracted_licensing_infos.append(
-                parse_extracted_licensing_info(extracted_licensing_info_node, graph, creation_info.document_namespace)
-            )
-        except SPDXParsingError as err:
-            logger.extend(err.get_messages())
-    parsed_fields["extracted_licensing_info"] = extracted_licensing_infos
+    if "extracted_licensing_info" not in excluded_fields:
+        extracted_licensing_infos = []
+        for _, _, extracted_licensing_info_node in get_correctly_typed_triples(
+            logger, graph, None, SPDX_NAMESPACE.hasExtractedLicensingInfo
+        ):
+            try:
+                extracted_licensing_info = parse_extracted_licensing_info(
+                    extracted_licensing_info_node, graph, creation_info.document_namespace
+                )
+                notify_handler(handler, extracted_licensing_info)
+                if build_document:
+                    extracted_licensing_infos.append(extracted_licensing_info)
+            except SPDXParsingError as err:
+                logger.extend(err.get_messages())
+        parsed_fields["extracted_licensing_info"] = extracted_licensing_infos
 
     raise_parsing_error_if_logger_has_messages(logger)
+    if not build_document:
+        return None
     document = construct_or_raise_parsing_error(Document, parsed_fields)
 
     return document
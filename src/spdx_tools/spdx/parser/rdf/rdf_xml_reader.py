@@ -0,0 +1,179 @@
+# SPDX-FileCopyrightText: 2026 spdx contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+import re
+from xml.parsers import expat
+
+from beartype.typing import Dict, List, Optional, TextIO
+from rdflib import RDF, Graph
+from rdflib.term import BNode, Literal, URIRef
+
+CHUNK_SIZE = 1 << 16
+
+XML_NAMESPACE = "http://www.w3.org/XML/1998/namespace"
+XML_BASE = XML_NAMESPACE + "base"
+XML_LANG = XML_NAMESPACE + "lang"
+RDF_NAMESPACE = str(RDF)
+RDF_ABOUT = RDF_NAMESPACE + "about"
+RDF_DATATYPE = RDF_NAMESPACE + "datatype"
+RDF_DESCRIPTION = RDF_NAMESPACE + "Description"
+RDF_NODE_ID = RDF_NAMESPACE + "nodeID"
+RDF_RESOURCE = RDF_NAMESPACE + "resource"
+RDF_ROOT = RDF_NAMESPACE + "RDF"
+RDF_TYPE = RDF_NAMESPACE + "type"
+# the names from the RDF namespace that can't be used as properties or are not supported by the reader, like rdf:li
+RDF_SYNTAX_NAMES = {
+    RDF_NAMESPACE + name
+    for name in ["RDF", "Description", "ID", "about", "parseType", "resource", "nodeID", "datatype", "li", "bagID"]
+}
+
+# URIs with a scheme are not resolved against the base URI
+ABSOLUTE_URI_PATTERN = re.compile(r"[A-Za-z][A-Za-z0-9+.\-]*:")
+
+ROOT, NODE, PROPERTY = range(3)
+
+
+class UnsupportedRdfXmlError(Exception):
+    """
+    Raised by the RdfXmlReader for RDF/XML constructs it doesn't support, and for invalid XML, so that the file can be
+    parsed by rdflib instead.
+    """
+
+
+class RdfXmlReader:
+    """
+    Reads the subset of RDF/XML that SPDX documents use with expat into an rdflib Graph, which takes less than half
+    of the time of the RDF/XML parser of rdflib. The file is read in chunks, and each triple is added to the graph as
+    soon as it is complete. Node elements with rdf:about, rdf:nodeID or without identifier, property elements with
+    rdf:resource, rdf:nodeID, rdf:datatype, a literal or a nested node element, and property attributes of node
+    elements are supported. Everything else, like rdf:parseType, rdf:li, rdf:ID, xml:base or relative URIs, raises an
+    UnsupportedRdfXmlError.
+    """
+
+    graph: Graph
+    # the open elements; node elements are [NODE, language, subject], property elements are
+    # [PROPERTY, language, predicate, object, datatype, texts]
+    stack: List[list]
+    blank_nodes: Dict[str, BNode]
+
+    def __init__(self, graph: Graph):
+        self.graph = graph
+        self.stack = []
+        self.blank_nodes = dict()
+
+    def read(self, file: TextIO) -> None:
+        parser = expat.ParserCreate("utf-8", namespace_separator="")
+        parser.buffer_text = True
+        parser.StartElementHandler = self.start_element
+        parser.EndElementHandler = self.end_element
+        parser.CharacterDataHandler = self.characters
+        parser.StartNamespaceDeclHandler = self.start_namespace_declaration
+        parser.EntityDeclHandler = self.unsupported
+        try:
+            while True:
+                chunk = file.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+                parser.Parse(chunk, False)
+            parser.Parse("", True)
+        except expat.ExpatError as err:
+            raise UnsupportedRdfXmlError(f"Invalid XML: {err}")
+
+    def start_namespace_declaration(self, prefix: Optional[str], uri: Optional[str]) -> None:
+        # the prefixes are bound like in rdflib, they are used to abbreviate the ids of external elements
+        self.graph.bind(prefix, uri or "", override=False)
+
+    def start_element(self, name: str, attributes: Dict[str, str]) -> None:
+        stack = self.stack
+        if XML_BASE in attributes:
+            self.unsupported(XML_BASE)
+        if not stack:
+            if name != RDF_ROOT:
+                self.unsupported(name)
+            stack.append([ROOT, attributes.get(XML_LANG)])
+            return
+
+        parent = stack[-1]
+        language = attributes.get(XML_LANG, parent[1])
+        if parent[0] == NODE:
+            stack.append(self.start_property_element(name, attributes, language))
+        else:
+            subject = self.start_node_element(name, attributes, language)
+            if parent[0] == PROPERTY:
+                if parent[3] is not None:
+                    self.unsupported(name)
+                parent[3] = subject
+            stack.append([NODE, language, subject])
+
+    def start_node_element(self, name: str, attributes: Dict[str, str], language: Optional[str]):
+        add = self.graph.add
+        subject = None
+        property_attributes = []
+        for key, value in attributes.items():
+            if subject is None and key == RDF_ABOUT:
+                subject = self.create_uri(value)
+            elif subject is None and key == RDF_NODE_ID:
+                subject = self.get_blank_node(value)
+            elif key == RDF_TYPE:
+                property_attributes.append((RDF.type, self.create_uri(value)))
+            elif key.startswith(RDF_NAMESPACE) or not ABSOLUTE_URI_PATTERN.match(key):
+                self.unsupported(key)
+            elif not key.startswith(XML_NAMESPACE):
+                property_attributes.append((URIRef(key), Literal(value, language)))
+        if subject is None:
+            subject = BNode()
+
+        if name != RDF_DESCRIPTION:
+            if name.startswith(RDF_NAMESPACE) or not ABSOLUTE_URI_PATTERN.match(name):
+                self.unsupported(name)
+            add((subject, RDF.type, URIRef(name)))
+        for predicate, _object in property_attributes:
+            add((subject, predicate, _object))
+        return subject
+
+    def start_property_element(self, name: str, attributes: Dict[str, str], language: Optional[str]) -> list:
+        if name in RDF_SYNTAX_NAMES or not ABSOLUTE_URI_PATTERN.match(name):
+            self.unsupported(name)
+        _object = None
+        datatype = None
+        for key, value in attributes.items():
+            if _object is None and key == RDF_RESOURCE:
+                _object = self.create_uri(value)
+            elif _object is None and key == RDF_NODE_ID:
+                _object = self.get_blank_node(value)
+            elif key == RDF_DATATYPE:
+                datatype = self.create_uri(value)
+            elif not key.startswith(XML_NAMESPACE):
+                self.unsupported(key)
+        return [PROPERTY, language, URIRef(name), _object, datatype, []]
+
+    def end_element(self, name: str) -> None:
+        element = self.stack.pop()
+        if element[0] != PROPERTY:
+            return
+        _, language, predicate, _object, datatype, texts = element
+        if _object is None:
+            _object = Literal("".join(texts), None if datatype else language, datatype)
+        self.graph.add((self.stack[-1][2], predicate, _object))
+
+    def characters(self, data: str) -> None:
+        element = self.stack[-1]
+        if element[0] == PROPERTY:
+            element[5].append(data)
+
+    def create_uri(self, value: str) -> URIRef:
+        # relative URIs would have to be resolved against the base URI like rdflib does
+        if not ABSOLUTE_URI_PATTERN.match(value):
+            self.unsupported(value)
+        return URIRef(value)
+
+    def get_blank_node(self, node_id: str) -> BNode:
+        # like in rdflib, the node ids of the file are not used as ids of the blank nodes
+        blank_node = self.blank_nodes.get(node_id)
+        if blank_node is None:
+            blank_node = self.blank_nodes[node_id] = BNode()
+        return blank_node
+
+    @staticmethod
+    def unsupported(*args) -> None:
+        raise UnsupportedRdfXmlError(f"Unsupported RDF/XML: {args[0]}")
@@ -1,6 +1,7 @@
 # SPDX-FileCopyrightText: 2023 spdx contributors
 #
 # SPDX-License-Identifier: Apache-2.0
+from beartype.typing import Optional
 from rdflib import RDFS, Graph, URIRef
 from rdflib.term import Node
 
@@ -16,12 +17,19 @@ from spdx_tools.spdx.parser.rdf.graph_parsing_functions import (
     parse_literal_or_no_assertion_or_none,
     parse_spdx_id,
 )
+from spdx_tools.spdx.parser.spdx_id_pool import SpdxIdPool
 from spdx_tools.spdx.rdfschema.namespace import SPDX_NAMESPACE
 
 
-def parse_relationship(relationship_node: Node, graph: Graph, parent_node: URIRef, doc_namespace: str) -> Relationship:
+def parse_relationship(
+    relationship_node: Node,
+    graph: Graph,
+    parent_node: URIRef,
+    doc_namespace: str,
+    spdx_id_pool: Optional[SpdxIdPool] = None,
+) -> Relationship:
     logger = Logger()
-    spdx_element_id = parse_spdx_id(parent_node, doc_namespace, graph)
+    spdx_element_id = parse_spdx_id(parent_node, doc_namespace, graph, spdx_id_pool)
 
     relationship_type = parse_literal(
         logger,
@@ -35,7 +43,7 @@ def parse_relationship(relationship_node: Node, graph: Graph, parent_node: URIRe
         graph,
         relationship_node,
         SPDX_NAMESPACE.relatedSpdxElement,
-        parsing_method=lambda x: parse_spdx_id(x, doc_namespace, graph),
+        parsing_method=lambda x: parse_spdx_id(x, doc_namespace, graph, spdx_id_pool),
     )
 
     comment = parse_literal(logger, graph, relationship_node, RDFS.comment)
@@ -59,9 +67,10 @@ def parse_implicit_relationship(
     related_spdx_element_node: URIRef,
     graph: Graph,
     doc_namespace: str,
+    spdx_id_pool: Optional[SpdxIdPool] = None,
 ) -> Relationship:
-    spdx_element_id = parse_spdx_id(spdx_element_node, doc_namespace, graph)
-    related_spdx_element_id = parse_spdx_id(related_spdx_element_node, doc_namespace, graph)
+    spdx_element_id = parse_spdx_id(spdx_element_node, doc_namespace, graph, spdx_id_pool)
+    related_spdx_element_id = parse_spdx_id(related_spdx_element_node, doc_namespace, graph, spdx_id_pool)
     relationship = construct_or_raise_parsing_error(
         Relationship,
         dict(
@@ -23,16 +23,19 @@ from spdx_tools.spdx.parser.rdf.graph_parsing_functions import (
     parse_spdx_id,
 )
 from spdx_tools.spdx.parser.rdf.license_expression_parser import parse_license_expression
+from spdx_tools.spdx.parser.spdx_id_pool import SpdxIdPool
 from spdx_tools.spdx.rdfschema.namespace import POINTER_NAMESPACE, SPDX_NAMESPACE
 
 
-def parse_snippet(snippet_node: Union[URIRef, BNode], graph: Graph, doc_namespace: str) -> Snippet:
+def parse_snippet(
+    snippet_node: Union[URIRef, BNode], graph: Graph, doc_namespace: str, spdx_id_pool: Optional[SpdxIdPool] = None
+) -> Snippet:
     logger = Logger()
-    spdx_id = parse_spdx_id(snippet_node, doc_namespace, graph)
+    spdx_id = parse_spdx_id(snippet_node, doc_namespace, graph, spdx_id_pool)
     file_spdx_id_uri = get_value_from_graph(
         logger, graph, subject=snippet_node, predicate=SPDX_NAMESPACE.snippetFromFile
     )
-    file_spdx_id = parse_spdx_id(file_spdx_id_uri, doc_namespace, graph)
+    file_spdx_id = parse_spdx_id(file_spdx_id_uri, doc_namespace, graph, spdx_id_pool)
     byte_range = None
     line_range = None
     for _, _, start_end_pointer in graph.triples((snippet_node, SPDX_NAMESPACE.range, None)):
@@ -0,0 +1,30 @@
+# SPDX-FileCopyrightText: 2026 spdx contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+from beartype.typing import Any, Dict
+
+
+class SpdxIdPool:
+    """
+    Intern table for the SPDX ids of a single document. Every parsed id is passed through intern(), so that all
+    occurrences of an id (as the id of an element as well as in the relationships, annotations and snippets that
+    reference it) share one string object instead of one copy per occurrence. This saves memory in documents with
+    many relationships and lets dictionary lookups and comparisons of ids succeed on the identity check.
+    """
+
+    spdx_ids: Dict[str, str]
+
+    def __init__(self):
+        self.spdx_ids = {}
+
+    def intern(self, spdx_id: Any) -> Any:
+        # values that are not strings (None, SpdxNone, SpdxNoAssertion or invalid input) are returned unchanged
+        if not isinstance(spdx_id, str):
+            return spdx_id
+        return self.spdx_ids.setdefault(spdx_id, spdx_id)
+
+    def clear(self):
+        self.spdx_ids.clear()
+
+    def __len__(self) -> int:
+        return len(self.spdx_ids)
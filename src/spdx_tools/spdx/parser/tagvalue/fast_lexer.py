@@ -0,0 +1,98 @@
+# SPDX-FileCopyrightText: 2026 spdx contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+import re
+
+from beartype.typing import Iterator, Optional
+from ply.lex import LexToken
+
+from spdx_tools.spdx.parser.tagvalue.lexer import SPDXLexer
+
+# the rules of SPDXLexer for the values after a colon, in the order in which the ply lexer tries them
+VALUE_RULES = ["CHECKSUM", "TOOL_VALUE", "ORGANIZATION_VALUE", "PERSON_VALUE", "ISO8601_DATE", "LINE_OR_KEYWORD_VALUE"]
+# whitespace and a comment or a tag, which is optionally followed by the start of a text block or by a value
+LINE_PATTERN = re.compile(
+    r"[ \t]*(?:\#.*|(?P<TAG>[a-zA-Z]+)[ \t]*(?:(?P<TEXT>"
+    + SPDXLexer.t_text.regex
+    + ")|"
+    + "|".join(f"(?P<{rule}>{getattr(SPDXLexer, 't_' + rule).regex})" for rule in VALUE_RULES)
+    + "|)|)",
+    re.UNICODE,
+)
+TEXT_END_PATTERN = re.compile(SPDXLexer.t_text_end.regex, re.UNICODE)
+
+
+class FastSPDXLexer(SPDXLexer):
+    """
+    Line based alternative to the ply lexer of SPDXLexer that produces the same token stream. The common lines of a
+    tag-value document, a tag followed by a colon and a value that ends at the end of the line or a <text> block, are
+    tokenized with one regular expression for the tag and one for the value, and the type of the tag is looked up in
+    the reserved keywords. Everything else, like invalid characters or values that continue in the next line, is passed
+    to the ply lexer, which is positioned at the same place, for the next token.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.tokens_iterator: Optional[Iterator[LexToken]] = None
+
+    def input(self, data):
+        super().input(data)
+        self.tokens_iterator = self.generate_tokens(data)
+
+    def next_token(self) -> Optional[LexToken]:
+        # the tokens are generated lazily, so that the lexer runs interleaved with the parser like the ply lexer
+        return next(self.tokens_iterator, None)
+
+    def generate_tokens(self, data: str) -> Iterator[LexToken]:
+        position = 0
+        lineno = 1
+        length = len(data)
+        reserved = self.reserved
+        while position < length:
+            if data[position] == "\n":
+                lineno += 1
+                position += 1
+                continue
+            match = LINE_PATTERN.match(data, position)
+            position = match.end()
+            rule = match.lastgroup
+            if rule is not None:
+                tag = match["TAG"]
+                yield create_token(reserved.get(tag, "UNKNOWN_TAG"), tag, lineno, match.start("TAG"))
+                if rule == "TEXT":
+                    text_end_match = TEXT_END_PATTERN.search(data, position)
+                    if text_end_match is None:
+                        # the ply lexer drops an unterminated text block
+                        return
+                    text = data[match.end() - len("<text>") : text_end_match.end()]
+                    yield create_token("TEXT", text.strip(), lineno, text_end_match.start())
+                    lineno += text.count("\n")
+                    position = text_end_match.end()
+                    continue
+                if rule != "TAG":
+                    value = match[rule][1:].strip()
+                    lexpos = match.start(rule)
+                    if rule == "LINE_OR_KEYWORD_VALUE":
+                        rule = reserved.get(value, "LINE")
+                    yield create_token(rule, value, lineno, lexpos)
+            if position == length or data[position] == "\n":
+                continue
+
+            # the next token is produced by the ply lexer, which continues at the current position
+            self.lexer.lexpos = position
+            self.lexer.lineno = lineno
+            token = self.lexer.token()
+            if token is None:
+                return
+            position = self.lexer.lexpos
+            lineno = self.lexer.lineno
+            yield token
+
+
+def create_token(token_type: str, value: str, lineno: int, lexpos: int) -> LexToken:
+    token = LexToken()
+    token.type = token_type
+    token.value = value
+    token.lineno = lineno
+    token.lexpos = lexpos
+    return token
@@ -113,8 +113,13 @@ class SPDXLexer:
         "CHECKSUM",
     ] + list(reserved.values())
 
+    # the tokens that can hold the value of a tag
+    value_tokens = ["TEXT", "LINE", "CHECKSUM", "NO_ASSERTION", "NONE"]
+
     def __init__(self):
         self.lexer = None
+        # the tokens of tags that are skipped together with their values, so that these values are not parsed
+        self.skipped_tags = set()
 
     @TOKEN(r":\s*<text>")
     def t_text(self, t):
@@ -196,9 +201,20 @@ class SPDXLexer:
         self.lexer = lex.lex(module=self, **kwargs)
 
     def token(self):
+        token = self.next_token()
+        while token is not None and token.type in self.skipped_tags:
+            token = self.next_token()
+            if token is not None and token.type in self.value_tokens:
+                token = self.next_token()
+        return token
+
+    def next_token(self):
         return self.lexer.token()
 
     def input(self, data):
+        # the position is reset, so that the lexer can be reused for several inputs
+        self.lexer.lineno = 1
+        self.lexer.begin("INITIAL")
         self.lexer.input(data)
 
     def t_error(self, t):
@@ -11,13 +11,19 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import hashlib
+import logging
+import os
+import pickle
 import re
+from functools import lru_cache
 
-from beartype.typing import Any, Dict, List
-from license_expression import ExpressionError, get_spdx_licensing
+from beartype.typing import Any, Collection, Dict, List, Optional, Set, Tuple
+from license_expression import ExpressionError
 from ply import yacc
 from ply.yacc import LRParser
 
+from spdx_tools.common.spdx_licensing import parse_license_expression_str
 from spdx_tools.spdx.datetime_conversions import datetime_from_str
 from spdx_tools.spdx.model import (
     Annotation,
@@ -45,8 +51,13 @@ from spdx_tools.spdx.parser.error import SPDXParsingError
 from spdx_tools.spdx.parser.logger import Logger
 from spdx_tools.spdx.parser.parsing_functions import (
     construct_or_raise_parsing_error,
+    get_relationship_key,
     raise_parsing_error_if_logger_has_messages,
 )
+from spdx_tools.spdx.parser.parsing_handler import ParsingHandler, notify_handler
+from spdx_tools.spdx.parser.projection import CHECKSUMS, LICENSE_FIELDS, get_excluded_fields
+from spdx_tools.spdx.parser.spdx_id_pool import SpdxIdPool
+from spdx_tools.spdx.parser.tagvalue.fast_lexer import FastSPDXLexer
 from spdx_tools.spdx.parser.tagvalue.helper_methods import (
     TAG_DATA_MODEL_FIELD,
     grammar_rule,
@@ -72,6 +83,23 @@ ELEMENT_EXPECTED_START_TAG = dict(
     Package="PackageName",
     ExtractedLicensingInfo="LicenseID",
 )
+# the arguments of the element classes that hold SPDX ids, which are interned before the element is constructed
+SPDX_ID_ARGUMENTS = ["spdx_id", "file_spdx_id", "spdx_element_id", "related_spdx_element_id"]
+# the elements that are needed to build the implicit contains relationships of files and are therefore also kept if
+# no document is built
+ELEMENTS_KEPT_WITHOUT_DOCUMENT = [Package]
+# the tags of the sub-fields of packages, files and snippets that can be excluded from parsing; if a whole element
+# type is excluded, its tags are skipped as well
+EXCLUDABLE_TAGS = {
+    "packages": {
+        LICENSE_FIELDS: ["PKG_LICENSE_DECLARED", "PKG_LICENSE_CONCLUDED", "PKG_LICENSE_INFO"],
+        CHECKSUMS: ["PKG_CHECKSUM"],
+    },
+    "files": {LICENSE_FIELDS: ["FILE_LICENSE_CONCLUDED", "FILE_LICENSE_INFO"], CHECKSUMS: ["FILE_CHECKSUM"]},
+    "snippets": {LICENSE_FIELDS: ["SNIPPET_LICENSE_CONCLUDED", "SNIPPET_LICENSE_INFO"]},
+}
+# the lexers that can be selected with the lexer argument of the parser; both produce the same tokens
+LEXERS = {"ply": SPDXLexer, "fast": FastSPDXLexer}
 
 
 class Parser:
@@ -82,16 +110,73 @@ class Parser:
     elements_built: Dict[str, Any]
     lex: SPDXLexer
     yacc: LRParser
-
-    def __init__(self, **kwargs):
+    spdx_id_pool: SpdxIdPool
+    handler: Optional[ParsingHandler]
+    build_document: bool
+    excluded_fields: Set[str]
+    relationship_keys: Set[Tuple[Any, ...]]
+
+    def __init__(
+        self,
+        handler: Optional[ParsingHandler] = None,
+        include: Optional[Collection[str]] = None,
+        exclude: Optional[Collection[str]] = None,
+        lexer: str = "ply",
+        **kwargs,
+    ):
+        if lexer not in LEXERS:
+            raise ValueError(f"Unknown lexer: {lexer}. Available lexers are {list(LEXERS)}.")
         self.tokens = SPDXLexer.tokens
+        self.handler = handler
+        self.build_document = True
+        self.excluded_fields = get_excluded_fields(include, exclude)
+        self.spdx_id_pool = SpdxIdPool()
+        self.reset()
+        self.lex = LEXERS[lexer]()
+        self.lex.build(reflags=re.UNICODE)
+        self.lex.skipped_tags = {
+            tag
+            for element_field, tags_by_sub_field in EXCLUDABLE_TAGS.items()
+            for sub_field, tags in tags_by_sub_field.items()
+            if element_field in self.excluded_fields or sub_field in self.excluded_fields
+            for tag in tags
+        }
+        self.yacc = self.build_yacc(**kwargs)
+
+    def reset(self):
+        # the parsing state is reset before each call of parse(), so that a parser can be reused for several documents
         self.logger = Logger()
+        self.spdx_id_pool.clear()
         self.current_element = {"logger": Logger()}
         self.creation_info = {"logger": Logger()}
         self.elements_built = dict()
-        self.lex = SPDXLexer()
-        self.lex.build(reflags=re.UNICODE)
-        self.yacc = yacc.yacc(module=self, **kwargs)
+        # the (origin, type, target) keys of the relationships built so far, to check for existing relationships
+        # before a contains relationship is added for a file
+        self.relationship_keys = set()
+
+    def build_yacc(self, **kwargs) -> LRParser:
+        table_file = get_table_cache_file()
+        if kwargs or table_file is None:
+            return yacc.yacc(module=self, **kwargs)
+        if os.path.exists(table_file):
+            try:
+                return yacc.yacc(module=self, debug=False, picklefile=table_file)
+            except (OSError, EOFError, pickle.UnpicklingError, TypeError, ValueError) as err:
+                # the cached tables can't be read, so they are generated and written again
+                logging.warning(f"The cached parsing tables in {table_file} can't be read and are replaced: {err}")
+        # the tables are written to a temporary file that is then moved to the cache, so that parsers in other
+        # processes never read an incomplete file
+        temporary_file = f"{table_file}.{os.getpid()}.tmp"
+        parser = yacc.yacc(module=self, debug=False, picklefile=temporary_file)
+        try:
+            os.replace(temporary_file, table_file)
+        except OSError as err:
+            logging.warning(f"The parsing tables can't be cached in {table_file}: {err}")
+            try:
+                os.remove(temporary_file)
+            except OSError:
+                pass
+        return parser
 
     @grammar_rule("start : start attrib ")
     def p_start_start_attrib(self, p):
@@ -237,7 +322,7 @@ class Parser:
     @grammar_rule("license_or_no_assertion_or_none : LINE")
     def p_license(self, p):
         try:
-            p[0] = get_spdx_licensing().parse(p[1])
+            p[0] = parse_license_expression_str(p[1])
         except ExpressionError as err:
             error_message = f"Error while parsing license expression: {p[1]}"
             if err.args:
@@ -256,7 +341,7 @@ class Parser:
         if "spdx_id" in self.creation_info:
             self.current_element["spdx_id"] = p[2]
         else:
-            self.creation_info["spdx_id"] = p[2]
+            self.creation_info["spdx_id"] = self.spdx_id_pool.intern(p[2])
 
     # parsing methods for creation info / document level
 
@@ -535,8 +620,19 @@ class Parser:
     def p_error(self, p):
         pass
 
-    def parse(self, text):
-        # entry point for the tag-value parser
+    def parse(self, text, build_document: bool = True) -> Optional[Document]:
+        # entry point for the tag-value parser; if the parser has a handler, each element is passed to it as soon as
+        # it has been constructed, and with build_document=False, no document is built and None is returned
+        self.reset()
+        try:
+            return self._parse(text, build_document)
+        finally:
+            # the state of the document is dropped, so that a parser that is kept for reuse doesn't keep it alive
+            self.reset()
+            self.lex.input("")
+
+    def _parse(self, text, build_document: bool) -> Optional[Document]:
+        self.build_document = build_document
         self.yacc.parse(text, lexer=self.lex)
         # this constructs the last remaining element; all other elements are constructed at the start of
         # their subsequent element
@@ -552,7 +648,12 @@ class Parser:
 
         raise_parsing_error_if_logger_has_messages(self.logger)
         creation_info = construct_or_raise_parsing_error(CreationInfo, self.creation_info)
+        notify_handler(self.handler, creation_info)
+        if not build_document:
+            return None
         self.elements_built["creation_info"] = creation_info
+        for excluded_field in self.excluded_fields:
+            self.elements_built.pop(excluded_field, None)
         document = construct_or_raise_parsing_error(Document, self.elements_built)
         return document
 
@@ -577,12 +678,31 @@ class Parser:
             return
 
         clazz = self.current_element.pop("class")
+        field_name = CLASS_MAPPING[clazz.__name__]
+        build_contains_relationship = clazz == File and "relationships" not in self.excluded_fields
+        for argument_name in SPDX_ID_ARGUMENTS:
+            if argument_name in self.current_element:
+                self.current_element[argument_name] = self.spdx_id_pool.intern(self.current_element[argument_name])
+        if field_name in self.excluded_fields and (clazz != Package or "relationships" in self.excluded_fields):
+            # excluded elements are not constructed, except for packages that are needed for the contains
+            # relationships of the files that follow them
+            if build_contains_relationship and "spdx_id" in self.current_element:
+                self.check_for_preceding_package_and_build_contains_relationship()
+            self.current_element = {"logger": Logger()}
+            return
+        if clazz == File and CHECKSUMS in self.excluded_fields:
+            self.current_element.setdefault("checksums", [])
         try:
             raise_parsing_error_if_logger_has_messages(self.current_element.pop("logger"), clazz.__name__)
-            self.elements_built.setdefault(CLASS_MAPPING[clazz.__name__], []).append(
-                construct_or_raise_parsing_error(clazz, self.current_element)
-            )
-            if clazz == File:
+            elements = self.elements_built.setdefault(field_name, [])
+            element = construct_or_raise_parsing_error(clazz, self.current_element)
+            if field_name not in self.excluded_fields:
+                notify_handler(self.handler, element)
+            if self.build_document or clazz in ELEMENTS_KEPT_WITHOUT_DOCUMENT:
+                elements.append(element)
+            if clazz == Relationship:
+                self.relationship_keys.add(get_relationship_key(element))
+            if build_contains_relationship:
                 self.check_for_preceding_package_and_build_contains_relationship()
         except SPDXParsingError as err:
             self.logger.extend(err.get_messages())
@@ -604,5 +724,31 @@ class Parser:
             return
         package_spdx_id = self.elements_built["packages"][-1].spdx_id
         relationship = Relationship(package_spdx_id, RelationshipType.CONTAINS, file_spdx_id)
-        if relationship not in self.elements_built.setdefault("relationships", []):
-            self.elements_built["relationships"].append(relationship)
+        relationship_key = get_relationship_key(relationship)
+        if relationship_key in self.relationship_keys:
+            return
+        self.relationship_keys.add(relationship_key)
+        if self.build_document:
+            self.elements_built.setdefault("relationships", []).append(relationship)
+        notify_handler(self.handler, relationship)
+
+
+@lru_cache(maxsize=None)
+def get_table_cache_file() -> Optional[str]:
+    """
+    Returns the path of the file in the user's cache directory in which the parsing tables that ply generates from
+    the grammar are cached, so that they are only generated once and not for every Parser. The file name contains a
+    hash of the grammar, so that changes to the grammar use a new file; ply additionally checks the signature of the
+    grammar when it reads the file. Returns None if the cache directory can't be created.
+    """
+    grammar = [getattr(Parser, name).__doc__ or "" for name in sorted(dir(Parser)) if name.startswith("p_")]
+    grammar += SPDXLexer.tokens + [str(yacc.__tabversion__)]
+    grammar_hash = hashlib.sha256("\n".join(grammar).encode("utf-8")).hexdigest()[:16]
+    cache_directory = os.path.join(
+        os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"), "spdx-tools"
+    )
+    try:
+        os.makedirs(cache_directory, exist_ok=True)
+    except OSError:
+        return None
+    return os.path.join(cache_directory, f"tagvalue_parsetab_{grammar_hash}.pickle")
@@ -1,13 +1,37 @@
 # SPDX-FileCopyrightText: 2023 spdx contributors
 #
 # SPDX-License-Identifier: Apache-2.0
+import threading
+
+from beartype.typing import Collection, Optional
+
 from spdx_tools.spdx.model import Document
+from spdx_tools.spdx.parser.parsing_handler import ParsingHandler
 from spdx_tools.spdx.parser.tagvalue.parser import Parser
 
+# parsers without a handler or projection are reused for all files that are parsed in the same thread
+_default_parsers = threading.local()
+
 
-def parse_from_file(file_name: str, encoding: str = "utf-8") -> Document:
-    parser = Parser()
+def parse_from_file(
+    file_name: str,
+    encoding: str = "utf-8",
+    handler: Optional[ParsingHandler] = None,
+    build_document: bool = True,
+    include: Optional[Collection[str]] = None,
+    exclude: Optional[Collection[str]] = None,
+) -> Optional[Document]:
+    if handler is None and include is None and exclude is None:
+        parser = get_default_parser()
+    else:
+        parser = Parser(handler=handler, include=include, exclude=exclude)
     with open(file_name, encoding=encoding) as file:
         data = file.read()
-    document: Document = parser.parse(data)
+    document: Optional[Document] = parser.parse(data, build_document)
     return document
+
+
+def get_default_parser() -> Parser:
+    if not hasattr(_default_parsers, "parser"):
+        _default_parsers.parser = Parser()
+    return _default_parsers.parser
@@ -1,12 +1,19 @@
 # SPDX-FileCopyrightText: 2023 spdx contributors
 #
 # SPDX-License-Identifier: Apache-2.0
-import xmltodict
-from beartype.typing import Any, Dict
+from xml.parsers import expat
 
-from spdx_tools.spdx.model import Document
+from beartype.typing import Any, Collection, Dict, Iterator, List, Optional, TextIO, Tuple, Union
+
+from spdx_tools.spdx.model import Document, File, Package, Relationship, Snippet
 from spdx_tools.spdx.parser.error import SPDXParsingError
+from spdx_tools.spdx.parser.jsonlikedict.file_parser import FileParser
 from spdx_tools.spdx.parser.jsonlikedict.json_like_dict_parser import JsonLikeDictParser
+from spdx_tools.spdx.parser.jsonlikedict.package_parser import PackageParser
+from spdx_tools.spdx.parser.jsonlikedict.relationship_parser import RelationshipParser
+from spdx_tools.spdx.parser.jsonlikedict.snippet_parser import SnippetParser
+from spdx_tools.spdx.parser.parsing_handler import ParsingHandler
+from spdx_tools.spdx.parser.spdx_id_pool import SpdxIdPool
 
 LIST_LIKE_FIELDS = [
     "creators",
@@ -34,38 +41,156 @@ LIST_LIKE_FIELDS = [
     "packageVerificationCodeExcludedFiles",
     "attributionTexts",
 ]
+LIST_LIKE_FIELD_NAMES = frozenset(LIST_LIKE_FIELDS)
+CHUNK_SIZE = 1 << 16
 
 
-def parse_from_file(file_name: str, encoding: str = "utf-8") -> Document:
+def parse_from_file(
+    file_name: str,
+    encoding: str = "utf-8",
+    handler: Optional[ParsingHandler] = None,
+    build_document: bool = True,
+    include: Optional[Collection[str]] = None,
+    exclude: Optional[Collection[str]] = None,
+    workers: int = 1,
+    lazy: bool = False,
+    cache_size: Optional[int] = None,
+) -> Optional[Document]:
     with open(file_name, encoding=encoding) as file:
-        parsed_xml: Dict = xmltodict.parse(file.read(), encoding="utf-8")
+        parsed_xml: Dict = parse_xml_to_dict(file)
 
-    input_doc_as_dict: Dict = _fix_list_like_fields(parsed_xml).get("Document")
+    input_doc_as_dict: Dict = parsed_xml.get("Document")
 
     if not input_doc_as_dict:
         raise SPDXParsingError(['Did not find the XML top level tag "Document".'])
 
-    return JsonLikeDictParser().parse(input_doc_as_dict)
+    return JsonLikeDictParser(handler, include, exclude, workers, lazy, cache_size).parse(
+        input_doc_as_dict, build_document
+    )
 
 
-def _fix_list_like_fields(data: Any) -> Any:
+def iter_elements(file_name: str, encoding: str = "utf-8") -> Iterator[Union[Package, File, Snippet, Relationship]]:
+    """
+    Yields the packages, files, snippets and relationships of an XML document one at a time, in the order in which
+    they appear in the file. Like iter_elements of the JSON parser, the file is read in chunks and each element is
+    parsed as soon as its closing tag has been read, so that only the elements of the current chunk are kept in memory.
+    All other fields of the document are skipped, which includes the relationships that are implied by
+    documentDescribes and hasFiles. Raises an SPDXParsingError for the first element that can't be parsed.
     """
-    XML files do not contain lists. Thus, single fields that should be a list in SPDX have to be manually cast.
-    This method takes a parsed dictionary and converts all values with key from LIST_LIKE_FIELDS to lists.
+    spdx_id_pool = SpdxIdPool()
+    parse_functions = {
+        "packages": PackageParser(spdx_id_pool).parse_package,
+        "files": FileParser(spdx_id_pool).parse_file,
+        "snippets": SnippetParser(spdx_id_pool).parse_snippet,
+        "relationships": RelationshipParser(spdx_id_pool).parse_relationship,
+    }
+    builder = XmlDictBuilder(streamed_field_names=parse_functions)
+    with open(file_name, encoding=encoding) as file:
+        for _ in _feed_chunks(file, builder):
+            for key, value in builder.streamed_items:
+                yield parse_functions[key](value)
+            builder.streamed_items.clear()
+
+
+def parse_xml_to_dict(file: TextIO) -> Dict:
     """
-    if isinstance(data, dict):
-        new_data = {}
-        for key, value in data.items():
-            if key in LIST_LIKE_FIELDS and not isinstance(value, list):
-                new_data[key] = [_fix_list_like_fields(value)] if value else []
+    Parses an XML file into the same dictionary that a JSON file with the same content would be parsed into. The file
+    is passed to expat in chunks, so that the whole file is never held in memory as a string.
+    """
+    builder = XmlDictBuilder()
+    for _ in _feed_chunks(file, builder):
+        pass
+    return builder.item
+
+
+def _feed_chunks(file: TextIO, builder: "XmlDictBuilder") -> Iterator[None]:
+    # feeds the file to expat chunk by chunk and yields after each chunk, so that the caller can process the elements
+    # that have been completed so far
+    parser = expat.ParserCreate("utf-8")
+    parser.ordered_attributes = True
+    parser.buffer_text = True
+    parser.StartElementHandler = builder.start_element
+    parser.EndElementHandler = builder.end_element
+    parser.CharacterDataHandler = builder.characters
+    parser.EntityDeclHandler = builder.forbid_entities
+    while True:
+        chunk = file.read(CHUNK_SIZE)
+        if not chunk:
+            break
+        try:
+            parser.Parse(chunk, False)
+        except expat.ExpatError as err:
+            raise SPDXParsingError([f"Invalid XML: {err}"])
+        yield
+    try:
+        parser.Parse("", True)
+    except expat.ExpatError as err:
+        raise SPDXParsingError([f"Invalid XML: {err}"])
+    yield
+
+
+class XmlDictBuilder:
+    """
+    Expat handler that builds a dictionary from XML elements in the format of xmltodict: attributes are stored with an
+    "@" prefix, text next to child elements as "#text" and repeated elements as lists. XML files do not contain lists,
+    thus the fields from LIST_LIKE_FIELDS are converted to lists while they are added to the dictionary, also if they
+    occur only once, and empty elements of these fields are empty lists. The direct children of the top level element
+    whose names are in streamed_field_names are not added to the dictionary but collected in streamed_items as
+    (name, value) tuples.
+    """
+
+    item: Any
+    texts: List[str]
+    stack: List[Tuple[Any, List[str]]]
+    streamed_field_names: Collection[str]
+    streamed_items: List[Tuple[str, Any]]
+
+    def __init__(self, streamed_field_names: Collection[str] = ()):
+        self.item = None
+        self.texts = []
+        self.stack = []
+        self.streamed_field_names = streamed_field_names
+        self.streamed_items = []
+
+    def start_element(self, name: str, attributes: List[str]):
+        self.stack.append((self.item, self.texts))
+        self.texts = []
+        if attributes:
+            self.item = {f"@{attributes[i]}": attributes[i + 1] for i in range(0, len(attributes), 2)}
+        else:
+            self.item = None
+
+    def end_element(self, name: str):
+        item = self.item
+        data = "".join(self.texts).strip()
+        if item is None:
+            item = data or None
+        elif data:
+            item["#text"] = data
+
+        parent, self.texts = self.stack.pop()
+        if parent is None:
+            parent = {}
+        self.item = parent
+        if len(self.stack) == 1 and name in self.streamed_field_names:
+            if item is not None:
+                self.streamed_items.append((name, item))
+        elif name in LIST_LIKE_FIELD_NAMES:
+            if item is None:
+                parent.setdefault(name, [])
             else:
-                new_data[key] = _fix_list_like_fields(value)
-        return new_data
+                parent.setdefault(name, []).append(item)
+        elif name not in parent:
+            parent[name] = item
+        elif isinstance(parent[name], list):
+            parent[name].append(item)
+        else:
+            parent[name] = [parent[name], item]
 
-    if isinstance(data, list):
-        new_data = []
-        for element in data:
-            new_data.append(_fix_list_like_fields(element))
-        return new_data
+    def characters(self, data: str):
+        self.texts.append(data)
 
-    return data
+    @staticmethod
+    def forbid_entities(*args):
+        # entity declarations are rejected like in xmltodict to prevent entity expansion attacks
+        raise SPDXParsingError(["Entity declarations are not allowed in XML documents."])
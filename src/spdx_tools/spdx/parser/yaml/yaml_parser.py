@@ -2,14 +2,27 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 import yaml
-from beartype.typing import Dict
+from beartype.typing import Collection, Dict, Optional
 
 from spdx_tools.spdx.model import Document
 from spdx_tools.spdx.parser.jsonlikedict.json_like_dict_parser import JsonLikeDictParser
+from spdx_tools.spdx.parser.parsing_handler import ParsingHandler
 
 
-def parse_from_file(file_name: str, encoding: str = "utf-8") -> Document:
+def parse_from_file(
+    file_name: str,
+    encoding: str = "utf-8",
+    handler: Optional[ParsingHandler] = None,
+    build_document: bool = True,
+    include: Optional[Collection[str]] = None,
+    exclude: Optional[Collection[str]] = None,
+    workers: int = 1,
+    lazy: bool = False,
+    cache_size: Optional[int] = None,
+) -> Optional[Document]:
     with open(file_name, encoding=encoding) as file:
         input_doc_as_dict: Dict = yaml.safe_load(file)
 
-    return JsonLikeDictParser().parse(input_doc_as_dict)
+    return JsonLikeDictParser(handler, include, exclude, workers, lazy, cache_size).parse(
+        input_doc_as_dict, build_document
+    )
@@ -1,32 +1,65 @@
 # SPDX-FileCopyrightText: 2022 spdx contributors
 #
 # SPDX-License-Identifier: Apache-2.0
-from beartype.typing import List
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
 
+from beartype.typing import Callable, Dict, Iterator, List, Optional
+
+from spdx_tools.common.parallel import get_chunk_ranges
+from spdx_tools.spdx.document_index import DocumentIndex
 from spdx_tools.spdx.model import Document, RelationshipType
-from spdx_tools.spdx.model.relationship_filters import filter_by_type_and_origin, filter_by_type_and_target
-from spdx_tools.spdx.validation.annotation_validator import validate_annotations
+from spdx_tools.spdx.validation.annotation_validator import validate_annotation, validate_annotations
 from spdx_tools.spdx.validation.creation_info_validator import validate_creation_info
-from spdx_tools.spdx.validation.extracted_licensing_info_validator import validate_extracted_licensing_infos
-from spdx_tools.spdx.validation.file_validator import validate_files
-from spdx_tools.spdx.validation.package_validator import validate_packages
-from spdx_tools.spdx.validation.relationship_validator import validate_relationships
-from spdx_tools.spdx.validation.snippet_validator import validate_snippets
+from spdx_tools.spdx.validation.extracted_licensing_info_validator import validate_extracted_licensing_info
+from spdx_tools.spdx.validation.file_validator import validate_file_within_document, validate_files
+from spdx_tools.spdx.validation.package_validator import validate_package_within_document, validate_packages
+from spdx_tools.spdx.validation.relationship_validator import validate_relationship, validate_relationships
+from spdx_tools.spdx.validation.snippet_validator import validate_snippet_within_document, validate_snippets
 from spdx_tools.spdx.validation.spdx_id_validators import get_list_of_all_spdx_ids
 from spdx_tools.spdx.validation.validation_message import SpdxElementType, ValidationContext, ValidationMessage
 
 
-def validate_full_spdx_document(document: Document, spdx_version: str | None = None) -> List[ValidationMessage]:
-    validation_messages: List[ValidationMessage] = []
+def validate_full_spdx_document(
+    document: Document,
+    spdx_version: str | None = None,
+    workers: int = 1,
+    max_messages: Optional[int] = None,
+    fail_fast: bool = False,
+) -> List[ValidationMessage]:
+    """
+    Validates the document and all of its elements. The sets of SPDX ids, external document reference ids and
+    extracted license ids as well as the relationships grouped by origin and target are computed once in a
+    DocumentIndex and shared by all validators. Every element, annotation and relationship is thus validated with a
+    constant number of lookups, so the total cost is O(elements + annotations + relationships) (plus the cost of
+    parsing each license expression), independent of how many references the elements have to each other.
+    If workers is greater than 1, the packages, files, snippets and relationships are validated in chunks on a pool
+    of that many processes. The messages are returned in the same order as in the serial case, but the elements
+    referenced by their contexts are copies of the document's elements.
+    If max_messages is provided, the validation stops as soon as that many messages have been found, and only these
+    are returned. fail_fast is a shorthand for max_messages=1 if only the validity of the document is of interest.
+    """
+    if fail_fast:
+        max_messages = 1
+    return list(islice(iter_validation_messages(document, spdx_version, workers), max_messages))
+
 
+def iter_validation_messages(
+    document: Document, spdx_version: str | None = None, workers: int = 1
+) -> Iterator[ValidationMessage]:
+    """
+    Yields the messages of validate_full_spdx_document() in the same order, each as soon as it has been found.
+    The remaining validation is skipped if the caller stops consuming the generator early.
+    """
     # SPDX version validation has to happen here because subsequent validators rely on it
     document_version: str = document.creation_info.spdx_version
     context = ValidationContext(spdx_id=document.creation_info.spdx_id, element_type=SpdxElementType.DOCUMENT)
     if not spdx_version:
         spdx_version = document_version
 
+    version_validation_messages: List[ValidationMessage] = []
     if document_version not in ["SPDX-2.2", "SPDX-2.3"]:
-        validation_messages.append(
+        version_validation_messages.append(
             ValidationMessage(
                 f'only SPDX versions "SPDX-2.2" and "SPDX-2.3" are supported, but the document\'s spdx_version is: '
                 f"{document_version}",
@@ -34,7 +67,7 @@ def validate_full_spdx_document(document: Document, spdx_version: str | None = N
             )
         )
     elif spdx_version != document_version:
-        validation_messages.append(
+        version_validation_messages.append(
             ValidationMessage(
                 f"provided SPDX version {spdx_version} does not match "
                 f"the document's SPDX version {document_version}",
@@ -42,41 +75,50 @@ def validate_full_spdx_document(document: Document, spdx_version: str | None = N
             )
         )
 
-    if validation_messages:
-        validation_messages.append(
-            ValidationMessage(
-                "There are issues concerning the SPDX version of the document. "
-                "As subsequent validation relies on the correct version, "
-                "the validation process has been cancelled.",
-                context,
-            )
+    if version_validation_messages:
+        yield from version_validation_messages
+        yield ValidationMessage(
+            "There are issues concerning the SPDX version of the document. "
+            "As subsequent validation relies on the correct version, "
+            "the validation process has been cancelled.",
+            context,
         )
-        return validation_messages
+        return
+
+    # all lookups of ids and relationships in the subsequent validators go through this index
+    document_index = DocumentIndex(document)
 
-    validation_messages.extend(validate_creation_info(document.creation_info, spdx_version))
-    validation_messages.extend(validate_packages(document.packages, spdx_version, document))
-    validation_messages.extend(validate_files(document.files, spdx_version, document))
-    validation_messages.extend(validate_snippets(document.snippets, spdx_version, document))
-    validation_messages.extend(validate_annotations(document.annotations, document))
-    validation_messages.extend(validate_relationships(document.relationships, spdx_version, document))
-    validation_messages.extend(validate_extracted_licensing_infos(document.extracted_licensing_info))
+    yield from validate_creation_info(document.creation_info, spdx_version)
+    if workers > 1:
+        yield from _iter_elements_validated_in_parallel(document, spdx_version, document_index, workers)
+    else:
+        for package in document.packages:
+            yield from validate_package_within_document(package, spdx_version, document, document_index)
+        for file in document.files:
+            yield from validate_file_within_document(file, spdx_version, document, document_index)
+        for snippet in document.snippets:
+            yield from validate_snippet_within_document(snippet, spdx_version, document, document_index)
+        for annotation in document.annotations:
+            yield from validate_annotation(annotation, document, document_index)
+        for relationship in document.relationships:
+            yield from validate_relationship(relationship, spdx_version, document, document_index)
+    for extracted_licensing_info in document.extracted_licensing_info:
+        yield from validate_extracted_licensing_info(extracted_licensing_info)
 
     document_id = document.creation_info.spdx_id
-    document_describes_relationships = filter_by_type_and_origin(
-        document.relationships, RelationshipType.DESCRIBES, document_id
+    document_describes_relationships = document_index.filter_by_type_and_origin(
+        RelationshipType.DESCRIBES, document_id
     )
-    described_by_document_relationships = filter_by_type_and_target(
-        document.relationships, RelationshipType.DESCRIBED_BY, document_id
+    described_by_document_relationships = document_index.filter_by_type_and_target(
+        RelationshipType.DESCRIBED_BY, document_id
     )
 
     only_a_single_package = len(document.packages) == 1 and not document.files and not document.snippets
     if not only_a_single_package and not document_describes_relationships + described_by_document_relationships:
-        validation_messages.append(
-            ValidationMessage(
-                f'there must be at least one relationship "{document_id} DESCRIBES ..." or "... DESCRIBED_BY '
-                f'{document_id}" when there is not only a single package present',
-                ValidationContext(spdx_id=document_id, element_type=SpdxElementType.DOCUMENT),
-            )
+        yield ValidationMessage(
+            f'there must be at least one relationship "{document_id} DESCRIBES ..." or "... DESCRIBED_BY '
+            f'{document_id}" when there is not only a single package present',
+            ValidationContext(spdx_id=document_id, element_type=SpdxElementType.DOCUMENT),
         )
 
     all_spdx_ids: List[str] = get_list_of_all_spdx_ids(document)
@@ -86,12 +128,59 @@ def validate_full_spdx_document(document: Document, spdx_version: str | None = N
     )
 
     if duplicated_spdx_ids:
-        validation_messages.append(
-            ValidationMessage(
-                f"every spdx_id must be unique within the document, but found the following duplicates: "
-                f"{sorted(duplicated_spdx_ids)}",
-                context,
-            )
+        yield ValidationMessage(
+            f"every spdx_id must be unique within the document, but found the following duplicates: "
+            f"{sorted(duplicated_spdx_ids)}",
+            context,
         )
 
-    return validation_messages
+
+# validators of the element lists that are split into chunks when validating in parallel, by name of the list
+PARALLEL_VALIDATORS: Dict[str, Callable] = {
+    "packages": validate_packages,
+    "files": validate_files,
+    "snippets": validate_snippets,
+    "relationships": validate_relationships,
+}
+
+# each worker process receives the document and builds its index once, so that tasks only need to specify a range
+_worker_document: Optional[Document] = None
+_worker_document_index: Optional[DocumentIndex] = None
+
+
+def _initialize_validation_worker(document: Document) -> None:
+    global _worker_document, _worker_document_index
+    _worker_document = document
+    _worker_document_index = DocumentIndex(document)
+
+
+def _validate_chunk(list_name: str, spdx_version: str, start: int, end: int) -> List[ValidationMessage]:
+    elements = getattr(_worker_document, list_name)[start:end]
+    return PARALLEL_VALIDATORS[list_name](elements, spdx_version, _worker_document, _worker_document_index)
+
+
+def _iter_elements_validated_in_parallel(
+    document: Document, spdx_version: str, document_index: DocumentIndex, workers: int
+) -> Iterator[ValidationMessage]:
+    executor = ProcessPoolExecutor(
+        max_workers=workers, initializer=_initialize_validation_worker, initargs=(document,)
+    )
+    try:
+        futures_by_list_name: Dict[str, List[Future]] = {
+            list_name: [
+                executor.submit(_validate_chunk, list_name, spdx_version, start, end)
+                for start, end in get_chunk_ranges(len(getattr(document, list_name)), workers)
+            ]
+            for list_name in PARALLEL_VALIDATORS
+        }
+
+        # the results are collected in the order of the serial validation, independent of completion order
+        for list_name in ["packages", "files", "snippets"]:
+            for future in futures_by_list_name[list_name]:
+                yield from future.result()
+        yield from validate_annotations(document.annotations, document, document_index)
+        for future in futures_by_list_name["relationships"]:
+            yield from future.result()
+    finally:
+        # chunks that have not been started are dropped if the caller stops consuming the messages early
+        executor.shutdown(cancel_futures=True)
@@ -4,6 +4,7 @@
 
 from beartype.typing import List, Optional
 
+from spdx_tools.spdx.document_index import DocumentIndex
 from spdx_tools.spdx.model import ChecksumAlgorithm, Document, File
 from spdx_tools.spdx.validation.checksum_validator import validate_checksums
 from spdx_tools.spdx.validation.license_expression_validator import (
@@ -15,12 +16,17 @@ from spdx_tools.spdx.validation.validation_message import SpdxElementType, Valid
 
 
 def validate_files(
-    files: List[File], spdx_version: str, document: Optional[Document] = None
+    files: List[File],
+    spdx_version: str,
+    document: Optional[Document] = None,
+    document_index: Optional[DocumentIndex] = None,
 ) -> List[ValidationMessage]:
     validation_messages = []
     if document:
+        if not document_index:
+            document_index = DocumentIndex(document)
         for file in files:
-            validation_messages.extend(validate_file_within_document(file, spdx_version, document))
+            validation_messages.extend(validate_file_within_document(file, spdx_version, document, document_index))
     else:
         for file in files:
             validation_messages.extend(validate_file(file, spdx_version))
@@ -28,7 +34,9 @@ def validate_files(
     return validation_messages
 
 
-def validate_file_within_document(file: File, spdx_version: str, document: Document) -> List[ValidationMessage]:
+def validate_file_within_document(
+    file: File, spdx_version: str, document: Document, document_index: Optional[DocumentIndex] = None
+) -> List[ValidationMessage]:
     validation_messages: List[ValidationMessage] = []
     context = ValidationContext(
         spdx_id=file.spdx_id,
@@ -37,12 +45,16 @@ def validate_file_within_document(file: File, spdx_version: str, document: Docum
         full_element=file,
     )
 
-    for message in validate_spdx_id(file.spdx_id, document):
+    for message in validate_spdx_id(file.spdx_id, document, document_index=document_index):
         validation_messages.append(ValidationMessage(message, context))
 
-    validation_messages.extend(validate_license_expression(file.license_concluded, document, file.spdx_id))
+    validation_messages.extend(
+        validate_license_expression(file.license_concluded, document, file.spdx_id, document_index=document_index)
+    )
 
-    validation_messages.extend(validate_license_expressions(file.license_info_in_file, document, file.spdx_id))
+    validation_messages.extend(
+        validate_license_expressions(file.license_info_in_file, document, file.spdx_id, document_index)
+    )
 
     validation_messages.extend(validate_file(file, spdx_version, context))
 
@@ -2,17 +2,41 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
-from beartype.typing import List, Optional, Union
+from functools import lru_cache
+
+from beartype.typing import List, Optional, Set, Tuple, Union
 from license_expression import ExpressionError, ExpressionParseError, LicenseExpression
 
-from spdx_tools.common.spdx_licensing import spdx_licensing
+from spdx_tools.common.spdx_licensing import (
+    LICENSE_EXPRESSION_CACHE_SIZE,
+    parse_license_expression_str,
+    spdx_licensing,
+)
+from spdx_tools.spdx.document_index import DocumentIndex
 from spdx_tools.spdx.model import Document, SpdxNoAssertion, SpdxNone
-from spdx_tools.spdx.validation.spdx_id_validators import is_external_doc_ref_present_in_document
 from spdx_tools.spdx.validation.validation_message import SpdxElementType, ValidationContext, ValidationMessage
 
 
+@lru_cache(maxsize=LICENSE_EXPRESSION_CACHE_SIZE)
+def get_invalid_symbols_and_parse_error(license_expression_str: str) -> Tuple[Tuple[str, ...], Optional[str]]:
+    """
+    Returns the document-independent part of the license expression validation, i.e. the invalid symbols reported by
+    spdx_licensing.validate() and the error raised by a strict parse of the expression. Both only depend on the string
+    representation of the expression, so they are kept in an LRU cache and identical expressions used across many
+    packages, files and snippets are only validated once. The document-specific checks of the invalid symbols against
+    the extracted licensing infos and external document references are evaluated for every expression.
+    """
+    return (
+        tuple(spdx_licensing.validate(parse_license_expression_str(license_expression_str)).invalid_symbols),
+        _get_strict_parse_error(license_expression_str),
+    )
+
+
 def validate_license_expressions(
-    license_expressions: List[Union[LicenseExpression, SpdxNoAssertion, SpdxNone]], document: Document, parent_id: str
+    license_expressions: List[Union[LicenseExpression, SpdxNoAssertion, SpdxNone]],
+    document: Document,
+    parent_id: str,
+    document_index: Optional[DocumentIndex] = None,
 ) -> List[ValidationMessage]:
     context = ValidationContext(
         parent_id=parent_id, element_type=SpdxElementType.LICENSE_EXPRESSION, full_element=license_expressions
@@ -20,7 +44,9 @@ def validate_license_expressions(
     validation_messages = []
 
     for license_expression in license_expressions:
-        validation_messages.extend(validate_license_expression(license_expression, document, parent_id, context))
+        validation_messages.extend(
+            validate_license_expression(license_expression, document, parent_id, context, document_index)
+        )
 
     return validation_messages
 
@@ -30,6 +56,7 @@ def validate_license_expression(
     document: Document,
     parent_id: str,
     context: ValidationContext | None = None,
+    document_index: Optional[DocumentIndex] = None,
 ) -> List[ValidationMessage]:
     if license_expression in [SpdxNoAssertion(), SpdxNone(), None]:
         return []
@@ -40,9 +67,18 @@ def validate_license_expression(
         )
 
     validation_messages = []
-    license_ref_ids: List[str] = [license_ref.license_id for license_ref in document.extracted_licensing_info]
+    if document_index:
+        license_ref_ids: Set[str] = document_index.extracted_license_ids
+        external_doc_ref_ids: Set[str] = document_index.external_document_ref_ids
+    else:
+        license_ref_ids: Set[str] = {license_ref.license_id for license_ref in document.extracted_licensing_info}
+        external_doc_ref_ids: Set[str] = {
+            external_doc_ref.document_ref_id for external_doc_ref in document.creation_info.external_document_refs
+        }
+
+    invalid_symbols, parse_error = get_invalid_symbols_and_parse_error(str(license_expression))
 
-    for non_spdx_token in spdx_licensing.validate(license_expression).invalid_symbols:
+    for non_spdx_token in invalid_symbols:
         if ":" in non_spdx_token:
             split_token: List[str] = non_spdx_token.split(":")
             if len(split_token) != 2:
@@ -63,7 +99,7 @@ def validate_license_expression(
                             context,
                         )
                     )
-                if not is_external_doc_ref_present_in_document(split_token[0], document):
+                if split_token[0] not in external_doc_ref_ids:
                     validation_messages.append(
                         ValidationMessage(
                             f'Did not find the external document reference "{split_token[0]}" in the SPDX document. '
@@ -81,16 +117,24 @@ def validate_license_expression(
                 )
             )
 
+    if parse_error:
+        validation_messages.append(
+            ValidationMessage(f"{parse_error}. for license_expression: {license_expression}", context)
+        )
+
+    return validation_messages
+
+
+def _get_strict_parse_error(license_expression: str) -> Optional[str]:
     try:
-        spdx_licensing.parse(str(license_expression), validate=True, strict=True)
+        spdx_licensing.parse(license_expression, validate=True, strict=True)
     except ExpressionParseError as err:
         # This error is raised when an exception symbol is used as a license symbol and vice versa.
         # So far, it only catches the first such error in the provided string.
-        validation_messages.append(ValidationMessage(f"{err}. for license_expression: {license_expression}", context))
+        return str(err)
     except ExpressionError:
         # This error is raised for invalid symbols within the license_expression, but it provides only a string of
         # these. On the other hand, spdx_licensing.validate() gives an actual list of invalid symbols, so this is
-        # handled above.
+        # handled separately.
         pass
-
-    return validation_messages
+    return None
@@ -4,9 +4,8 @@
 
 from beartype.typing import List, Optional
 
+from spdx_tools.spdx.document_index import DocumentIndex
 from spdx_tools.spdx.model import Document, File, Package, Relationship, RelationshipType
-from spdx_tools.spdx.model.relationship_filters import filter_by_type_and_origin, filter_by_type_and_target
-from spdx_tools.spdx.spdx_element_utils import get_element_type_from_spdx_id
 from spdx_tools.spdx.validation.checksum_validator import validate_checksums
 from spdx_tools.spdx.validation.external_package_ref_validator import validate_external_package_refs
 from spdx_tools.spdx.validation.license_expression_validator import (
@@ -20,12 +19,19 @@ from spdx_tools.spdx.validation.validation_message import SpdxElementType, Valid
 
 
 def validate_packages(
-    packages: List[Package], spdx_version: str, document: Optional[Document] = None
+    packages: List[Package],
+    spdx_version: str,
+    document: Optional[Document] = None,
+    document_index: Optional[DocumentIndex] = None,
 ) -> List[ValidationMessage]:
     validation_messages: List[ValidationMessage] = []
     if document:
+        if not document_index:
+            document_index = DocumentIndex(document)
         for package in packages:
-            validation_messages.extend(validate_package_within_document(package, spdx_version, document))
+            validation_messages.extend(
+                validate_package_within_document(package, spdx_version, document, document_index)
+            )
     else:
         for package in packages:
             validation_messages.extend(validate_package(package, spdx_version))
@@ -34,7 +40,7 @@ def validate_packages(
 
 
 def validate_package_within_document(
-    package: Package, spdx_version: str, document: Document
+    package: Package, spdx_version: str, document: Document, document_index: Optional[DocumentIndex] = None
 ) -> List[ValidationMessage]:
     validation_messages: List[ValidationMessage] = []
     context = ValidationContext(
@@ -44,26 +50,28 @@ def validate_package_within_document(
         full_element=package,
     )
 
-    for message in validate_spdx_id(package.spdx_id, document):
+    for message in validate_spdx_id(package.spdx_id, document, document_index=document_index):
         validation_messages.append(ValidationMessage(message, context))
 
     if not package.files_analyzed:
-        package_contains_relationships = filter_by_type_and_origin(
-            document.relationships, RelationshipType.CONTAINS, package.spdx_id
+        if not document_index:
+            document_index = DocumentIndex(document)
+        package_contains_relationships = document_index.filter_by_type_and_origin(
+            RelationshipType.CONTAINS, package.spdx_id
         )
         package_contains_file_relationships = [
             relationship
             for relationship in package_contains_relationships
-            if get_element_type_from_spdx_id(relationship.related_spdx_element_id, document) == File
+            if document_index.get_element_type(relationship.related_spdx_element_id) == File
         ]
 
-        contained_in_package_relationships = filter_by_type_and_target(
-            document.relationships, RelationshipType.CONTAINED_BY, package.spdx_id
+        contained_in_package_relationships = document_index.filter_by_type_and_target(
+            RelationshipType.CONTAINED_BY, package.spdx_id
         )
         file_contained_in_package_relationships = [
             relationship
             for relationship in contained_in_package_relationships
-            if get_element_type_from_spdx_id(relationship.spdx_element_id, document) == File
+            if document_index.get_element_type(relationship.spdx_element_id) == File
         ]
 
         combined_relationships: List[Relationship] = (
@@ -78,7 +86,11 @@ def validate_package_within_document(
                 )
             )
 
-    validation_messages.extend(validate_license_expression(package.license_concluded, document, package.spdx_id))
+    validation_messages.extend(
+        validate_license_expression(
+            package.license_concluded, document, package.spdx_id, document_index=document_index
+        )
+    )
 
     license_info_from_files = package.license_info_from_files
     if license_info_from_files:
@@ -92,10 +104,12 @@ def validate_package_within_document(
             )
         else:
             validation_messages.extend(
-                validate_license_expressions(license_info_from_files, document, package.spdx_id)
+                validate_license_expressions(license_info_from_files, document, package.spdx_id, document_index)
             )
 
-    validation_messages.extend(validate_license_expression(package.license_declared, document, package.spdx_id))
+    validation_messages.extend(
+        validate_license_expression(package.license_declared, document, package.spdx_id, document_index=document_index)
+    )
 
     validation_messages.extend(validate_package(package, spdx_version, context))
 
@@ -4,6 +4,7 @@
 
 from beartype.typing import List, Optional
 
+from spdx_tools.spdx.document_index import DocumentIndex
 from spdx_tools.spdx.model import Document, Snippet
 from spdx_tools.spdx.validation.license_expression_validator import (
     validate_license_expression,
@@ -14,12 +15,19 @@ from spdx_tools.spdx.validation.validation_message import SpdxElementType, Valid
 
 
 def validate_snippets(
-    snippets: List[Snippet], spdx_version: str, document: Optional[Document] = None
+    snippets: List[Snippet],
+    spdx_version: str,
+    document: Optional[Document] = None,
+    document_index: Optional[DocumentIndex] = None,
 ) -> List[ValidationMessage]:
     validation_messages = []
     if document:
+        if not document_index:
+            document_index = DocumentIndex(document)
         for snippet in snippets:
-            validation_messages.extend(validate_snippet_within_document(snippet, spdx_version, document))
+            validation_messages.extend(
+                validate_snippet_within_document(snippet, spdx_version, document, document_index)
+            )
     else:
         for snippet in snippets:
             validation_messages.extend(validate_snippet(snippet, spdx_version))
@@ -28,7 +36,7 @@ def validate_snippets(
 
 
 def validate_snippet_within_document(
-    snippet: Snippet, spdx_version: str, document: Document
+    snippet: Snippet, spdx_version: str, document: Document, document_index: Optional[DocumentIndex] = None
 ) -> List[ValidationMessage]:
     validation_messages: List[ValidationMessage] = []
     context = ValidationContext(
@@ -38,18 +46,24 @@ def validate_snippet_within_document(
         full_element=snippet,
     )
 
-    messages: List[str] = validate_spdx_id(snippet.spdx_id, document)
+    messages: List[str] = validate_spdx_id(snippet.spdx_id, document, document_index=document_index)
     for message in messages:
         validation_messages.append(ValidationMessage(message, context))
 
-    messages: List[str] = validate_spdx_id(snippet.file_spdx_id, document, check_files=True)
+    messages: List[str] = validate_spdx_id(
+        snippet.file_spdx_id, document, check_files=True, document_index=document_index
+    )
     for message in messages:
         validation_messages.append(ValidationMessage(message, context))
 
-    validation_messages.extend(validate_license_expression(snippet.license_concluded, document, snippet.spdx_id))
+    validation_messages.extend(
+        validate_license_expression(
+            snippet.license_concluded, document, snippet.spdx_id, document_index=document_index
+        )
+    )
 
     validation_messages.extend(
-        validate_license_expressions(snippet.license_info_in_snippet, document, snippet.spdx_id)
+        validate_license_expressions(snippet.license_info_in_snippet, document, snippet.spdx_id, document_index)
     )
 
     validation_messages.extend(validate_snippet(snippet, spdx_version, context))
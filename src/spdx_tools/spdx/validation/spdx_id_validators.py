@@ -4,8 +4,9 @@
 
 import re
 
-from beartype.typing import List
+from beartype.typing import List, Optional
 
+from spdx_tools.spdx.document_index import DocumentIndex
 from spdx_tools.spdx.document_utils import get_contained_spdx_element_ids
 from spdx_tools.spdx.model import Document, File
 
@@ -44,11 +45,16 @@ def is_external_doc_ref_present_in_document(external_ref_id: str, document: Docu
 
 
 def validate_spdx_id(
-    spdx_id: str, document: Document, check_document: bool = False, check_files: bool = False
+    spdx_id: str,
+    document: Document,
+    check_document: bool = False,
+    check_files: bool = False,
+    document_index: Optional[DocumentIndex] = None,
 ) -> List[str]:
     """Test that the given spdx_id (and a potential DocumentRef to an external document) is valid
     and, if it is a reference, actually exists in the document. Optionally checks files or the whole document
-    for the existence of the spdx_id (i.e. if it is used as a reference). Returns a list of validation messages."""
+    for the existence of the spdx_id (i.e. if it is used as a reference). If a DocumentIndex of the document is
+    provided, the existence checks are constant time lookups. Returns a list of validation messages."""
 
     validation_messages: List[str] = []
     split_id: List[str] = spdx_id.split(":")
@@ -72,7 +78,11 @@ def validate_spdx_id(
                 f'the internal SPDX id part of spdx_id must only contain letters, numbers, "." and "-" and must begin '
                 f'with "SPDXRef-", but is: {split_id[1]}'
             )
-        if not is_external_doc_ref_present_in_document(split_id[0], document):
+        if document_index:
+            external_doc_ref_present = document_index.contains_external_document_ref_id(split_id[0])
+        else:
+            external_doc_ref_present = is_external_doc_ref_present_in_document(split_id[0], document)
+        if not external_doc_ref_present:
             validation_messages.append(
                 f'did not find the external document reference "{split_id[0]}" in the SPDX document'
             )
@@ -87,11 +97,19 @@ def validate_spdx_id(
         )
 
     if check_document:
-        if not is_spdx_id_present_in_document(spdx_id, document):
+        if document_index:
+            spdx_id_present = document_index.contains_spdx_id(spdx_id)
+        else:
+            spdx_id_present = is_spdx_id_present_in_document(spdx_id, document)
+        if not spdx_id_present:
             validation_messages.append(f'did not find the referenced spdx_id "{spdx_id}" in the SPDX document')
 
     if check_files:
-        if not is_spdx_id_present_in_files(spdx_id, document.files):
+        if document_index:
+            file_spdx_id_present = document_index.contains_file_spdx_id(spdx_id)
+        else:
+            file_spdx_id_present = is_spdx_id_present_in_files(spdx_id, document.files)
+        if not file_spdx_id_present:
             validation_messages.append(
                 f'did not find the referenced spdx_id "{spdx_id}" in the SPDX document\'s files'
             )
@@ -44,10 +44,10 @@ def write_document(document: Document, text_output: TextIO):
         document.relationships, document.packages, document.files
     )
     file_ids_with_contained_snippets = get_file_ids_with_contained_snippets(document.snippets, document.files)
-    packaged_file_ids = [file.spdx_id for files_list in contained_files_by_package_id.values() for file in files_list]
-    filed_snippet_ids = [
+    packaged_file_ids = {file.spdx_id for files_list in contained_files_by_package_id.values() for file in files_list}
+    filed_snippet_ids = {
         snippet.spdx_id for snippets_list in file_ids_with_contained_snippets.values() for snippet in snippets_list
-    ]
+    }
 
     text_output.write("## Document Information\n")
     write_creation_info(document.creation_info, text_output)
@@ -67,7 +67,7 @@ def write_document(document: Document, text_output: TextIO):
                     file_ids_with_contained_snippets[file.spdx_id], write_snippet, text_output, with_separator=True
                 )
 
-    already_written_file_ids = []  # a file can belong to multiple packages but must appear only once
+    already_written_file_ids = set()  # a file can belong to multiple packages but must appear only once
     for package in document.packages:
         write_package(package, text_output)
         write_separator(text_output)
@@ -87,7 +87,7 @@ def write_document(document: Document, text_output: TextIO):
                             text_output,
                             with_separator=True,
                         )
-                    already_written_file_ids.append(file.spdx_id)
+                    already_written_file_ids.add(file.spdx_id)
 
     write_optional_heading(document.extracted_licensing_info, "## License Information\n", text_output)
     write_list_of_elements(
@@ -9,7 +9,7 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
-from beartype.typing import Any, Callable, Dict, List, Optional, TextIO, Tuple, Union
+from beartype.typing import Any, Callable, Dict, List, Optional, Set, TextIO, Tuple, Union
 from license_expression import LicenseExpression
 
 from spdx_tools.spdx.model import (
@@ -81,14 +81,14 @@ def scan_relationships(
     contained_files_by_package_id = dict()
     relationships_to_write = []
     files_by_spdx_id = {file.spdx_id: file for file in files}
-    packages_spdx_ids = [package.spdx_id for package in packages]
+    packages_spdx_ids = {package.spdx_id for package in packages}
     for relationship in relationships:
         if relationship.related_spdx_element_id in [SpdxNoAssertion(), SpdxNone()]:
             relationships_to_write.append(relationship)
         elif (
             relationship.relationship_type == RelationshipType.CONTAINS
             and relationship.spdx_element_id in packages_spdx_ids
-            and relationship.related_spdx_element_id in files_by_spdx_id.keys()
+            and relationship.related_spdx_element_id in files_by_spdx_id
         ):
             contained_files_by_package_id.setdefault(relationship.spdx_element_id, []).append(
                 files_by_spdx_id[relationship.related_spdx_element_id]
@@ -113,7 +113,7 @@ def scan_relationships(
 
 def get_file_ids_with_contained_snippets(snippets: List[Snippet], files: List[File]) -> Dict:
     file_ids_with_contained_snippets = dict()
-    file_spdx_ids: List[str] = [file.spdx_id for file in files]
+    file_spdx_ids: Set[str] = {file.spdx_id for file in files}
     for snippet in snippets:
         if snippet.file_spdx_id in file_spdx_ids:
             file_ids_with_contained_snippets.setdefault(snippet.file_spdx_id, []).append(snippet)
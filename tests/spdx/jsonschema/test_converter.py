@@ -8,6 +8,7 @@ import pytest
 
 from spdx_tools.common.typing.dataclass_with_properties import dataclass_with_properties
 from spdx_tools.common.typing.type_checks import check_types_and_set_values
+from spdx_tools.spdx.document_index import DocumentIndex
 from spdx_tools.spdx.jsonschema.converter import TypedConverter
 from spdx_tools.spdx.jsonschema.json_property import JsonProperty
 from spdx_tools.spdx.model import Checksum, ChecksumAlgorithm, Document
@@ -36,7 +37,11 @@ class TestConverter(TypedConverter):
             return "jsonSecondName"
 
     def _get_property_value(
-        self, instance: TestDataModelType, test_property: TestPropertyType, _document: Document = None
+        self,
+        instance: TestDataModelType,
+        test_property: TestPropertyType,
+        _document: Document = None,
+        _document_index: DocumentIndex = None,
     ) -> Any:
         if test_property == TestPropertyType.FIRST_NAME:
             return instance.first_property
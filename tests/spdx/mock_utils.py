@@ -1,8 +1,13 @@
 # SPDX-FileCopyrightText: 2022 spdx contributors
 #
 # SPDX-License-Identifier: Apache-2.0
+from unittest import mock
 from unittest.mock import NonCallableMagicMock
 
+from beartype.typing import Any, Callable
+
+from spdx_tools.spdx.model import Relationship
+
 
 def assert_mock_method_called_with_arguments(mock_object: NonCallableMagicMock, method_name: str, *args):
     assert len(mock_object.method_calls) == len(args)
@@ -14,3 +19,11 @@ def assert_mock_method_called_with_arguments(mock_object: NonCallableMagicMock,
 
 def assert_no_mock_methods_called(mock_object: NonCallableMagicMock):
     assert len(mock_object.method_calls) == 0
+
+
+def count_relationship_comparisons(function: Callable[[], Any]) -> int:
+    # the number of comparisons of relationships grows quadratically if each relationship is checked against a list of
+    # all others, which is deterministic unlike the running time
+    with mock.patch.object(Relationship, "__eq__", autospec=True, side_effect=Relationship.__eq__) as compare:
+        function()
+    return compare.call_count
@@ -0,0 +1,124 @@
+# SPDX-FileCopyrightText: 2026 spdx contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+import pickle
+
+import pytest
+
+from spdx_tools.spdx.model import Document, LazyElementList, Package, SpdxNoAssertion
+from tests.spdx.fixtures import creation_info_fixture
+
+
+def build_package(name: str) -> Package:
+    return Package(f"SPDXRef-{name}", name, SpdxNoAssertion())
+
+
+@pytest.fixture
+def names():
+    return ["first", "second", "third", "fourth"]
+
+
+def test_list_behaves_like_a_list(names):
+    packages = [build_package(name) for name in names]
+    lazy_list = LazyElementList(names, build_package)
+
+    assert len(lazy_list) == 4
+    assert lazy_list == packages
+    assert packages == lazy_list
+    assert lazy_list[1] == packages[1]
+    assert lazy_list[-1] == packages[-1]
+    assert lazy_list[1:3] == packages[1:3]
+    assert packages[2] in lazy_list
+    assert lazy_list + packages[:1] == packages + packages[:1]
+    assert packages[:1] + lazy_list == packages[:1] + packages
+    assert pickle.loads(pickle.dumps(lazy_list)) == packages
+    with pytest.raises(IndexError):
+        lazy_list[4]
+
+
+def test_elements_are_built_on_first_access(names):
+    built_names = []
+
+    def build_and_record(name: str) -> Package:
+        built_names.append(name)
+        return build_package(name)
+
+    lazy_list = LazyElementList(names, build_and_record)
+    assert lazy_list.number_of_built_elements() == 0
+
+    lazy_list[2].comment = "comment"
+
+    assert lazy_list[2].comment == "comment"
+    assert lazy_list[-2] is lazy_list[2]
+    assert built_names == ["third"]
+    assert lazy_list.number_of_built_elements() == 1
+
+
+def test_cache_keeps_the_most_recently_accessed_elements(names):
+    lazy_list = LazyElementList(names, build_package, cache_size=2)
+    first_package = lazy_list[0]
+    second_package = lazy_list[1]
+
+    assert lazy_list[0] is first_package
+    lazy_list[2]
+
+    assert lazy_list.number_of_built_elements() == 2
+    assert lazy_list[0] is first_package
+    assert lazy_list[1] is not second_package
+    assert lazy_list == [build_package(name) for name in names]
+
+
+def test_list_modifications(names):
+    lazy_list = LazyElementList(names, build_package, cache_size=1)
+    new_package = build_package("new")
+
+    lazy_list.insert(0, new_package)
+    del lazy_list[2]
+    lazy_list[-1] = new_package
+    lazy_list.append(new_package)
+    lazy_list.remove(new_package)
+
+    assert lazy_list == [build_package("first"), build_package("third"), new_package, new_package]
+    assert lazy_list[2] is lazy_list[3] is new_package
+
+
+def test_list_slice_modifications(names):
+    lazy_list = LazyElementList(names, build_package, cache_size=1)
+    new_package = build_package("new")
+
+    del lazy_list[0:2]
+    lazy_list[0:1] = [new_package, new_package]
+    del lazy_list[::3]
+
+    assert lazy_list == [new_package, build_package("fourth")]
+    assert lazy_list[0] is new_package
+    with pytest.raises(ValueError):
+        lazy_list[::2] = []
+    assert lazy_list == [new_package, build_package("fourth")]
+
+
+def test_rows_with_the_same_raw_value_are_built_separately():
+    lazy_list = LazyElementList(["same", "same"], build_package)
+
+    lazy_list[0].comment = "comment"
+
+    assert lazy_list[0] is not lazy_list[1]
+    assert lazy_list[1].comment is None
+    assert lazy_list[0].comment == "comment"
+    assert lazy_list.number_of_built_elements() == 2
+
+
+def test_errors_are_raised_on_access():
+    lazy_list = LazyElementList([1, "second"], build_package)
+
+    assert lazy_list[1] == build_package("second")
+    with pytest.raises(TypeError):
+        lazy_list[0]
+
+
+def test_document_with_lazy_element_lists(names):
+    packages = [build_package(name) for name in names]
+
+    document = Document(creation_info_fixture(), packages=LazyElementList(names, build_package))
+
+    assert document == Document(creation_info_fixture(), packages=packages)
@@ -0,0 +1,184 @@
+# SPDX-FileCopyrightText: 2026 spdx contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+import pickle
+import tracemalloc
+from copy import copy
+
+import pytest
+
+from spdx_tools.spdx.model import Relationship, RelationshipTable, RelationshipType, SpdxNoAssertion, SpdxNone
+from spdx_tools.spdx.model.relationship_filters import filter_by_type_and_origin, filter_by_type_and_target
+from tests.spdx.fixtures import document_fixture
+
+
+@pytest.fixture
+def relationships():
+    return [
+        Relationship("SPDXRef-DOCUMENT", RelationshipType.DESCRIBES, "SPDXRef-Package"),
+        Relationship("SPDXRef-Package", RelationshipType.CONTAINS, "SPDXRef-File", "comment"),
+        Relationship("SPDXRef-File", RelationshipType.CONTAINED_BY, "SPDXRef-Package"),
+        Relationship("SPDXRef-Package", RelationshipType.DEPENDS_ON, SpdxNone()),
+        Relationship("SPDXRef-Package", RelationshipType.CONTAINS, SpdxNoAssertion()),
+        Relationship("SPDXRef-Package", RelationshipType.CONTAINS, "SPDXRef-Snippet"),
+    ]
+
+
+def test_table_behaves_like_a_list(relationships):
+    table = RelationshipTable(relationships)
+
+    assert len(table) == 6
+    assert table == relationships
+    assert relationships == table
+    assert list(table) == relationships
+    assert table[1] == relationships[1]
+    assert table[-1] == relationships[-1]
+    assert table[1:3] == relationships[1:3]
+    assert relationships[2] in table
+    assert pickle.loads(pickle.dumps(table)) == relationships
+    with pytest.raises(IndexError):
+        table[6]
+
+
+def test_table_modifications(relationships):
+    table = RelationshipTable(relationships)
+    new_relationship = Relationship("SPDXRef-Snippet", RelationshipType.OTHER, "SPDXRef-File", "other comment")
+
+    table.insert(0, new_relationship)
+    del table[2]
+    table[-1] = new_relationship
+    table.append(relationships[0])
+    table = table + [relationships[1]]
+
+    assert table == [new_relationship, relationships[0]] + relationships[2:5] + [
+        new_relationship,
+        relationships[0],
+        relationships[1],
+    ]
+    with pytest.raises(TypeError):
+        table.append("SPDXRef-Package")
+
+
+def test_table_slice_modifications(relationships):
+    table = RelationshipTable(relationships)
+    new_relationship = Relationship("SPDXRef-Snippet", RelationshipType.OTHER, "SPDXRef-File", "other comment")
+
+    del table[0:2]
+    table[1:2] = [new_relationship, relationships[0]]
+    del table[::3]
+
+    expected_relationships = relationships[2:]
+    expected_relationships[1:2] = [new_relationship, relationships[0]]
+    del expected_relationships[::3]
+    assert table == expected_relationships
+    assert table.filter_by_type_and_origin(RelationshipType.OTHER, "SPDXRef-Snippet") == [new_relationship]
+    with pytest.raises(ValueError):
+        table[::2] = [new_relationship]
+    with pytest.raises(TypeError):
+        table[0:1] = ["SPDXRef-Package"]
+    assert table == expected_relationships
+
+
+def test_changes_to_read_relationships_are_written_back(relationships):
+    table = RelationshipTable(relationships)
+
+    table[0].comment = "new comment"
+    relationship = table[-1]
+    relationship.relationship_type = RelationshipType.OTHER
+    relationship.related_spdx_element_id = SpdxNone()
+    for relationship in table.filter_by_type_and_origin(RelationshipType.CONTAINS, "SPDXRef-Package"):
+        relationship.spdx_element_id = "SPDXRef-Other"
+
+    assert table[0] == Relationship("SPDXRef-DOCUMENT", RelationshipType.DESCRIBES, "SPDXRef-Package", "new comment")
+    assert table[-1] == Relationship("SPDXRef-Package", RelationshipType.OTHER, SpdxNone())
+    assert table.filter_by_type_and_origin(RelationshipType.CONTAINS, "SPDXRef-Other") == [
+        Relationship("SPDXRef-Other", RelationshipType.CONTAINS, "SPDXRef-File", "comment"),
+        Relationship("SPDXRef-Other", RelationshipType.CONTAINS, SpdxNoAssertion()),
+    ]
+    with pytest.raises(TypeError):
+        table[1].comment = 42
+    assert table[1].comment == "comment"
+    assert repr(table[2]) == repr(relationships[2])
+
+
+def test_relationships_read_before_rows_are_changed_can_not_be_changed(relationships):
+    table = RelationshipTable(relationships)
+    relationship = table[1]
+    copied_relationship = copy(relationship)
+
+    table.insert(0, relationships[0])
+
+    with pytest.raises(ValueError):
+        relationship.comment = "new comment"
+    copied_relationship.comment = "new comment"
+    assert type(copied_relationship) is Relationship
+    assert table == [relationships[0]] + relationships
+
+
+def test_filters(relationships):
+    table = RelationshipTable(relationships)
+
+    assert table.filter_by_type_and_origin(RelationshipType.CONTAINS, "SPDXRef-Package") == [
+        relationships[1],
+        relationships[4],
+        relationships[5],
+    ]
+    assert table.filter_by_type_and_target(RelationshipType.CONTAINED_BY, "SPDXRef-Package") == [relationships[2]]
+    assert table.filter_by_type_and_target(RelationshipType.CONTAINS, "SPDXRef-Unknown") == []
+
+    table.append(Relationship("SPDXRef-Package", RelationshipType.CONTAINS, "SPDXRef-Package2"))
+
+    assert len(table.filter_by_type_and_origin(RelationshipType.CONTAINS, "SPDXRef-Package")) == 4
+
+
+@pytest.mark.parametrize(
+    "relationship_type, spdx_id",
+    [
+        (RelationshipType.CONTAINS, "SPDXRef-Package"),
+        (RelationshipType.CONTAINED_BY, "SPDXRef-Package"),
+        (RelationshipType.DESCRIBES, "SPDXRef-DOCUMENT"),
+        (RelationshipType.DEPENDS_ON, "SPDXRef-File"),
+    ],
+)
+def test_relationship_filters_use_the_table(relationships, relationship_type, spdx_id):
+    table = RelationshipTable(relationships)
+
+    assert filter_by_type_and_origin(table, relationship_type, spdx_id) == filter_by_type_and_origin(
+        relationships, relationship_type, spdx_id
+    )
+    assert filter_by_type_and_target(table, relationship_type, spdx_id) == filter_by_type_and_target(
+        relationships, relationship_type, spdx_id
+    )
+
+
+def test_document_with_relationship_table(relationships):
+    document = document_fixture(relationships=RelationshipTable(relationships))
+
+    assert document == document_fixture(relationships=relationships)
+
+
+def _memory(create_relationships) -> int:
+    tracemalloc.start()
+    relationships = create_relationships()
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del relationships
+    return memory
+
+
+def test_table_uses_less_memory_than_a_list():
+    # each file is contained in one of few packages and has relationships to other elements, so that every id
+    # occurs in several relationships like in real documents
+    file_ids = [f"SPDXRef-File{index}" for index in range(5000)]
+    package_ids = [f"SPDXRef-Package{index}" for index in range(50)]
+
+    def create_relationships():
+        for index, file_id in enumerate(file_ids):
+            yield Relationship(package_ids[index % 50], RelationshipType.CONTAINS, file_id)
+            yield Relationship(file_id, RelationshipType.GENERATED_FROM, file_ids[index - 1])
+            yield Relationship(file_id, RelationshipType.DEPENDS_ON, package_ids[index * 7 % 50])
+
+    # about 72 bytes per relationship in a list and 28 bytes in a table on CPython 3.11
+    assert _memory(lambda: RelationshipTable(create_relationships())) * 2 < _memory(
+        lambda: list(create_relationships())
+    )
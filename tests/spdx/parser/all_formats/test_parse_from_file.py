@@ -8,12 +8,39 @@ import pytest
 
 from spdx_tools.spdx.model import Document
 from spdx_tools.spdx.parser.json import json_parser
+from spdx_tools.spdx.parser.parsing_handler import ParsingHandler
 from spdx_tools.spdx.parser.rdf import rdf_parser
 from spdx_tools.spdx.parser.tagvalue import tagvalue_parser
 from spdx_tools.spdx.parser.xml import xml_parser
 from spdx_tools.spdx.parser.yaml import yaml_parser
 
 
+class CollectingHandler(ParsingHandler):
+    def __init__(self):
+        self.elements = {}
+
+    def on_creation_info(self, creation_info):
+        self.elements.setdefault("creation_info", []).append(creation_info)
+
+    def on_package(self, package):
+        self.elements.setdefault("packages", []).append(package)
+
+    def on_file(self, file):
+        self.elements.setdefault("files", []).append(file)
+
+    def on_snippet(self, snippet):
+        self.elements.setdefault("snippets", []).append(snippet)
+
+    def on_relationship(self, relationship):
+        self.elements.setdefault("relationships", []).append(relationship)
+
+    def on_annotation(self, annotation):
+        self.elements.setdefault("annotations", []).append(annotation)
+
+    def on_extracted_licensing_info(self, extracted_licensing_info):
+        self.elements.setdefault("extracted_licensing_info", []).append(extracted_licensing_info)
+
+
 @pytest.mark.parametrize(
     "parser, format_name, extension",
     [
@@ -68,3 +95,57 @@ class TestParseFromFile:
         assert len(doc.snippets) == 1
         assert len(doc.relationships) == 11
         assert len(doc.extracted_licensing_info) == 5
+
+    @pytest.mark.parametrize("build_document", [True, False])
+    def test_parse_from_file_with_handler(self, parser, format_name, extension, build_document):
+        file_name = os.path.join(
+            os.path.dirname(__file__), f"../../data/SPDX{format_name}Example-v2.3.spdx{extension}"
+        )
+        handler = CollectingHandler()
+
+        doc = parser.parse_from_file(file_name, handler=handler, build_document=build_document)
+
+        expected_doc = parser.parse_from_file(file_name)
+        assert handler.elements["creation_info"] == [expected_doc.creation_info]
+        for field_name in ["packages", "files", "snippets", "annotations", "extracted_licensing_info"]:
+            assert handler.elements[field_name] == getattr(expected_doc, field_name)
+        assert len(handler.elements["relationships"]) == len(expected_doc.relationships)
+        assert all(relationship in expected_doc.relationships for relationship in handler.elements["relationships"])
+        if build_document:
+            assert doc == expected_doc
+        else:
+            assert doc is None
+
+    def test_parse_from_file_with_included_fields(self, parser, format_name, extension):
+        file_name = os.path.join(
+            os.path.dirname(__file__), f"../../data/SPDX{format_name}Example-v2.3.spdx{extension}"
+        )
+
+        doc = parser.parse_from_file(file_name, include=["packages", "relationships"])
+
+        expected_doc = parser.parse_from_file(file_name)
+        assert doc.creation_info == expected_doc.creation_info
+        assert doc.packages == expected_doc.packages
+        assert len(doc.relationships) == len(expected_doc.relationships)
+        assert all(relationship in expected_doc.relationships for relationship in doc.relationships)
+        assert doc.files == doc.snippets == doc.annotations == doc.extracted_licensing_info == []
+
+    def test_parse_from_file_with_excluded_sub_fields(self, parser, format_name, extension):
+        file_name = os.path.join(
+            os.path.dirname(__file__), f"../../data/SPDX{format_name}Example-v2.3.spdx{extension}"
+        )
+
+        doc = parser.parse_from_file(file_name, exclude=["snippets", "license_fields", "checksums"])
+
+        expected_doc = parser.parse_from_file(file_name)
+        assert doc.snippets == []
+        assert [package.spdx_id for package in doc.packages] == [package.spdx_id for package in expected_doc.packages]
+        assert [file.spdx_id for file in doc.files] == [file.spdx_id for file in expected_doc.files]
+        for package in doc.packages:
+            assert package.checksums == package.license_info_from_files == []
+            assert package.license_concluded is package.license_declared is None
+        for file in doc.files:
+            assert file.checksums == file.license_info_in_file == []
+            assert file.license_concluded is None
+        assert doc.relationships == expected_doc.relationships
+        assert doc.extracted_licensing_info == expected_doc.extracted_licensing_info
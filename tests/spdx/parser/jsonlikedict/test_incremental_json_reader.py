@@ -0,0 +1,80 @@
+# SPDX-FileCopyrightText: 2026 spdx contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+import io
+import json
+
+import pytest
+
+from spdx_tools.spdx.parser.error import SPDXParsingError
+from spdx_tools.spdx.parser.json.incremental_json_reader import IncrementalJsonReader
+
+JSON_DOCUMENT = {
+    "spdxVersion": "SPDX-2.3",
+    "number": 1234567890,
+    "float": -12.5e3,
+    "constants": [True, False, None],
+    "nested": {"key": [{"escaped": 'quote " backslash \\ unicode ä 😀'}, [], {}]},
+    "packages": [{"SPDXID": "SPDXRef-1", "size": 12345}, {"SPDXID": "SPDXRef-2"}],
+    "files": [],
+    "relationships": [1234, "string", [1, [2]]],
+}
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 1 << 16])
+@pytest.mark.parametrize("indent", [None, 4])
+def test_iter_top_level_items(chunk_size, indent):
+    file = io.StringIO(json.dumps(JSON_DOCUMENT, indent=indent))
+    reader = IncrementalJsonReader(file, chunk_size=chunk_size)
+
+    items = list(reader.iter_top_level_items(["packages", "files", "relationships"]))
+
+    assert items == [
+        ("spdxVersion", "SPDX-2.3"),
+        ("number", 1234567890),
+        ("float", -12.5e3),
+        ("constants", [True, False, None]),
+        ("nested", JSON_DOCUMENT["nested"]),
+        ("packages", {"SPDXID": "SPDXRef-1", "size": 12345}),
+        ("packages", {"SPDXID": "SPDXRef-2"}),
+        ("relationships", 1234),
+        ("relationships", "string"),
+        ("relationships", [1, [2]]),
+    ]
+
+
+def test_iter_top_level_items_of_empty_object():
+    reader = IncrementalJsonReader(io.StringIO(" { } "))
+
+    assert list(reader.iter_top_level_items(["packages"])) == []
+
+
+@pytest.mark.parametrize(
+    "json_str",
+    [
+        "",
+        "[]",
+        '{"packages": [{"SPDXID": "SPDXRef-1"}',
+        '{"packages": [{"SPDXID": "SPDXRef-1"} {"SPDXID": "SPDXRef-2"}]}',
+        '{"spdxVersion": "SPDX-2.3", }',
+        '{"spdxVersion": "SPDX-2.3"',
+        '{"packages": {}}',
+        '{1: "value"}',
+    ],
+)
+def test_iter_top_level_items_of_invalid_json(json_str):
+    reader = IncrementalJsonReader(io.StringIO(json_str), chunk_size=4)
+
+    with pytest.raises(SPDXParsingError):
+        list(reader.iter_top_level_items(["packages"]))
+
+
+@pytest.mark.parametrize("invalid_value", ["x", '"invalid\\escape"', '{"a" "b"}', "[1 2]", "nul"])
+def test_invalid_value_is_reported_without_reading_the_rest_of_the_file(invalid_value):
+    file = io.StringIO(f'{{"spdxVersion": {invalid_value}, "packages": [{json.dumps("a" * 10000)}]}}')
+    reader = IncrementalJsonReader(file, chunk_size=64)
+
+    with pytest.raises(SPDXParsingError):
+        list(reader.iter_top_level_items(["packages"]))
+
+    assert file.tell() == 64
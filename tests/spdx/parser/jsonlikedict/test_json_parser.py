@@ -1,6 +1,59 @@
+import gc
+import json
 import os
+from concurrent.futures import ProcessPoolExecutor
+from unittest import mock
 
+import pytest
+
+from spdx_tools.spdx.model import File, LazyElementList, Package, Relationship, Snippet
+from spdx_tools.spdx.parser.error import SPDXParsingError
 from spdx_tools.spdx.parser.json import json_parser
+from spdx_tools.spdx.parser.jsonlikedict.json_like_dict_parser import JsonLikeDictParser
+from spdx_tools.spdx.parser.parsing_handler import ParsingHandler
+
+EXECUTOR_CLASS_NAME = "spdx_tools.spdx.parser.jsonlikedict.json_like_dict_parser.ProcessPoolExecutor"
+
+
+class CollectingHandler(ParsingHandler):
+    def __init__(self):
+        self.elements = []
+
+    def on_package(self, package):
+        self.elements.append(package)
+
+    def on_file(self, file):
+        self.elements.append(file)
+
+    def on_snippet(self, snippet):
+        self.elements.append(snippet)
+
+    def on_relationship(self, relationship):
+        self.elements.append(relationship)
+
+
+class LiveElementCountingHandler(ParsingHandler):
+    def __init__(self):
+        self.number_of_elements = 0
+        self.live_elements_on_first_relationship = None
+
+    def on_package(self, package):
+        self.number_of_elements += 1
+
+    def on_file(self, file):
+        self.number_of_elements += 1
+
+    def on_snippet(self, snippet):
+        self.number_of_elements += 1
+
+    def on_relationship(self, relationship):
+        if self.live_elements_on_first_relationship is None:
+            self.live_elements_on_first_relationship = count_live_elements()
+
+
+def count_live_elements() -> int:
+    gc.collect()
+    return sum(isinstance(obj, (Package, File, Snippet)) for obj in gc.get_objects())
 
 
 def test_parse_control_characters():
@@ -9,3 +62,100 @@ def test_parse_control_characters():
     )
     assert doc.creation_info.creators[0].name == "Nisha  K"
     assert doc.extracted_licensing_info[0].extracted_text == 'Golang BSD plus Patents "\\/\n\r\t'
+
+
+def test_iter_elements():
+    file_name = os.path.join(os.path.dirname(__file__), "../../data/SPDXJSONExample-v2.3.spdx.json")
+    document = json_parser.parse_from_file(file_name)
+
+    elements = list(json_parser.iter_elements(file_name))
+
+    assert [element for element in elements if isinstance(element, Package)] == document.packages
+    assert [element for element in elements if isinstance(element, File)] == document.files
+    assert [element for element in elements if isinstance(element, Snippet)] == document.snippets
+    relationships = [element for element in elements if isinstance(element, Relationship)]
+    assert len(relationships) == 7
+    assert all(relationship in document.relationships for relationship in relationships)
+
+
+def test_parse_from_file_in_parallel():
+    file_name = os.path.join(os.path.dirname(__file__), "../../data/SPDXJSONExample-v2.3.spdx.json")
+    handler = CollectingHandler()
+
+    with mock.patch(EXECUTOR_CLASS_NAME, wraps=ProcessPoolExecutor) as executor_class:
+        document = json_parser.parse_from_file(file_name, handler=handler, workers=2)
+
+    assert executor_class.call_args.kwargs["max_workers"] == 2
+    # the workers only receive the chunks of elements they parse, not the whole document
+    assert executor_class.call_args.kwargs["initargs"] == (set(),)
+    assert document == json_parser.parse_from_file(file_name)
+    assert handler.elements == document.packages + document.files + document.snippets + document.relationships
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_parse_without_building_the_document_does_not_keep_the_elements(workers):
+    file_name = os.path.join(os.path.dirname(__file__), "../../data/SPDXJSONExample-v2.3.spdx.json")
+    handler = LiveElementCountingHandler()
+    live_elements_before_parsing = count_live_elements()
+
+    assert json_parser.parse_from_file(file_name, handler=handler, build_document=False, workers=workers) is None
+
+    assert handler.number_of_elements == 10
+    # the relationships are parsed after the packages, files and snippets, which have been dropped by then
+    assert handler.live_elements_on_first_relationship == live_elements_before_parsing
+
+
+def test_parse_from_file_lazily():
+    file_name = os.path.join(os.path.dirname(__file__), "../../data/SPDXJSONExample-v2.3.spdx.json")
+
+    document = json_parser.parse_from_file(file_name, lazy=True, cache_size=2)
+
+    assert isinstance(document.packages, LazyElementList)
+    assert document.packages.number_of_built_elements() == 0
+    assert document.files.number_of_built_elements() == 0
+    assert document.snippets.number_of_built_elements() == 0
+    assert document == json_parser.parse_from_file(file_name)
+    assert document.files.number_of_built_elements() == 2
+
+
+def test_lazy_parsing_raises_errors_on_access():
+    with open(os.path.join(os.path.dirname(__file__), "../../data/SPDXJSONExample-v2.3.spdx.json")) as file:
+        json_like_dict = json.load(file)
+    json_like_dict["packages"][1]["builtDate"] = "invalid"
+
+    document = JsonLikeDictParser(lazy=True).parse(json_like_dict)
+
+    assert document.packages[0].spdx_id == json_like_dict["packages"][0]["SPDXID"]
+    with pytest.raises(SPDXParsingError):
+        document.packages[1]
+
+
+def test_lazy_parsing_with_handler_or_workers_is_rejected():
+    with pytest.raises(ValueError):
+        JsonLikeDictParser(handler=CollectingHandler(), lazy=True)
+    with pytest.raises(ValueError):
+        JsonLikeDictParser(lazy=True, workers=2)
+
+
+def test_parallel_parsing_returns_the_messages_of_the_serial_parsing_in_the_same_order():
+    with open(os.path.join(os.path.dirname(__file__), "../../data/SPDXJSONExample-v2.3.spdx.json")) as file:
+        json_like_dict = json.load(file)
+    for package_dict in json_like_dict["packages"]:
+        package_dict["builtDate"] = "invalid"
+    for relationship_dict in json_like_dict["relationships"]:
+        relationship_dict["relationshipType"] = "INVALID"
+
+    with pytest.raises(SPDXParsingError) as serial_error:
+        JsonLikeDictParser().parse(json_like_dict)
+    with (
+        pytest.raises(SPDXParsingError) as parallel_error,
+        mock.patch(EXECUTOR_CLASS_NAME, wraps=ProcessPoolExecutor) as executor_class,
+    ):
+        JsonLikeDictParser(workers=2).parse(json_like_dict)
+
+    executor_class.assert_called_once()
+
+    assert len(serial_error.value.get_messages()) == len(json_like_dict["packages"]) + len(
+        json_like_dict["relationships"]
+    )
+    assert parallel_error.value.get_messages() == serial_error.value.get_messages()
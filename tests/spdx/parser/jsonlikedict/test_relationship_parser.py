@@ -4,11 +4,13 @@
 from unittest import TestCase
 
 import pytest
+from beartype.typing import Dict
 
 from spdx_tools.spdx.constants import DOCUMENT_SPDX_ID
 from spdx_tools.spdx.model import Relationship, RelationshipType, SpdxNoAssertion
 from spdx_tools.spdx.parser.error import SPDXParsingError
 from spdx_tools.spdx.parser.jsonlikedict.relationship_parser import RelationshipParser
+from tests.spdx.mock_utils import count_relationship_comparisons
 
 
 def test_parse_relationship():
@@ -213,3 +215,33 @@ def test_parse_has_files_without_duplicating_relationships(has_files, existing_r
 
     assert len(relationships) == len(contains_relationships)
     TestCase().assertCountEqual(relationships, contains_relationships)
+
+
+def _document_dict_with_files(number_of_files: int) -> Dict:
+    file_ids = [f"SPDXRef-File{index}" for index in range(number_of_files)]
+    # half of the files already have an explicit relationship, so that the implicit ones are checked against them
+    relationship_dicts = [
+        {"spdxElementId": file_id, "relationshipType": "CONTAINED_BY", "relatedSpdxElement": "SPDXRef-Package"}
+        for file_id in file_ids[::2]
+    ]
+    return {
+        "SPDXID": DOCUMENT_SPDX_ID,
+        "documentDescribes": ["SPDXRef-Package"] + file_ids,
+        "packages": [{"SPDXID": "SPDXRef-Package", "hasFiles": file_ids}],
+        "relationships": relationship_dicts,
+    }
+
+
+def _number_of_comparisons(document_dict: Dict) -> int:
+    return count_relationship_comparisons(lambda: RelationshipParser().parse_all_relationships(document_dict))
+
+
+def test_implicit_relationships_are_not_compared_with_all_existing_relationships():
+    large_document_dict = _document_dict_with_files(400)
+
+    relationships = RelationshipParser().parse_all_relationships(large_document_dict)
+    assert len(relationships) == 200 + 401 + 200
+
+    # 4 times as many relationships must not need more than 4 times as many comparisons, while comparing each
+    # implicit relationship with all existing ones needs about 16 times as many
+    assert _number_of_comparisons(large_document_dict) <= 4 * _number_of_comparisons(_document_dict_with_files(100))
@@ -0,0 +1,53 @@
+# SPDX-FileCopyrightText: 2026 spdx contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+import os
+
+import pytest
+from rdflib import RDF, Graph, Literal, URIRef
+from rdflib.exceptions import UniquenessError
+
+from spdx_tools.spdx.parser.rdf.indexed_graph import IndexedGraph
+from spdx_tools.spdx.rdfschema.namespace import SPDX_NAMESPACE
+
+
+def test_indexed_graph_gives_same_results_as_graph():
+    graph = Graph().parse(os.path.join(os.path.dirname(__file__), "data/file_to_test_rdf_parser.rdf.xml"))
+    indexed_graph = IndexedGraph(graph)
+
+    for subject, predicate in set((subject, predicate) for subject, predicate, _ in graph):
+        assert list(indexed_graph.triples((subject, predicate, None))) == list(
+            graph.triples((subject, predicate, None))
+        )
+        assert indexed_graph.value(subject, predicate) == graph.value(subject, predicate)
+    assert set(indexed_graph.triples((None, RDF.type, SPDX_NAMESPACE.Package))) == set(
+        graph.triples((None, RDF.type, SPDX_NAMESPACE.Package))
+    )
+    assert indexed_graph.value(URIRef("https://some.namespace#unknown"), RDF.type, default="default") == "default"
+
+
+def test_indexed_graph_value_with_multiple_values():
+    graph = Graph()
+    subject = URIRef("https://some.namespace#SPDXRef-File")
+    graph.add((subject, SPDX_NAMESPACE.fileContributor, Literal("first contributor")))
+    graph.add((subject, SPDX_NAMESPACE.fileContributor, Literal("second contributor")))
+    indexed_graph = IndexedGraph(graph)
+
+    assert indexed_graph.value(subject, SPDX_NAMESPACE.fileContributor) == Literal("first contributor")
+    with pytest.raises(UniquenessError):
+        indexed_graph.value(subject, SPDX_NAMESPACE.fileContributor, any=False)
+
+
+def test_indexed_graph_is_updated_after_changes():
+    graph = Graph()
+    subject = URIRef("https://some.namespace#SPDXRef-File")
+    graph.add((subject, SPDX_NAMESPACE.fileName, Literal("./file.c")))
+    indexed_graph = IndexedGraph(graph)
+    assert indexed_graph.value(subject, SPDX_NAMESPACE.comment) is None
+
+    indexed_graph.add((subject, SPDX_NAMESPACE.comment, Literal("comment")))
+    indexed_graph.remove((subject, SPDX_NAMESPACE.fileName, None))
+
+    assert indexed_graph.value(subject, SPDX_NAMESPACE.comment) == Literal("comment")
+    assert indexed_graph.value(subject, SPDX_NAMESPACE.fileName) is None
+    assert graph.value(subject, SPDX_NAMESPACE.comment) == Literal("comment")
@@ -0,0 +1,90 @@
+# SPDX-FileCopyrightText: 2026 spdx contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+import io
+import os
+
+import pytest
+from rdflib import Graph
+from rdflib.compare import isomorphic
+
+from spdx_tools.spdx.parser.rdf import rdf_parser
+from spdx_tools.spdx.parser.rdf.rdf_xml_reader import RdfXmlReader, UnsupportedRdfXmlError
+
+
+@pytest.mark.parametrize(
+    "file_name, encoding",
+    [
+        ("../../data/SPDXRdfExample-v2.3.spdx.rdf.xml", "utf-8"),
+        ("../../data/SPDXRdfExample-v2.2.spdx.rdf.xml", "utf-8"),
+        ("../../data/SPDXRdfExample-UTF-16.spdx.rdf.xml", "utf-16"),
+        ("data/file_to_test_rdf_parser.rdf.xml", "utf-8"),
+    ],
+)
+def test_read_gives_same_graph_as_rdflib(file_name, encoding):
+    file_name = os.path.join(os.path.dirname(__file__), file_name)
+    expected_graph = Graph()
+    with open(file_name, encoding=encoding) as file:
+        expected_graph.parse(file, format="xml")
+
+    graph = Graph()
+    with open(file_name, encoding=encoding) as file:
+        RdfXmlReader(graph).read(file)
+
+    assert isomorphic(graph, expected_graph)
+    assert set(graph.namespaces()) == set(expected_graph.namespaces())
+
+
+@pytest.mark.parametrize(
+    "rdf_xml",
+    [
+        '<rdf:Description rdf:about="http://example.com/a" xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"/>',
+        '<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"><rdf:Description rdf:about="#a"/></rdf:RDF>',
+        '<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#" xmlns:ex="http://example.com/">'
+        '<rdf:Description><ex:p rdf:parseType="Resource"><ex:q>value</ex:q></ex:p></rdf:Description></rdf:RDF>',
+        '<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"><rdf:Bag><rdf:li>a</rdf:li></rdf:Bag>'
+        "</rdf:RDF>",
+        '<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#" xml:base="http://example.com/"></rdf:RDF>',
+        '<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#">',
+    ],
+)
+def test_read_unsupported_rdf_xml(rdf_xml):
+    with pytest.raises(UnsupportedRdfXmlError):
+        RdfXmlReader(Graph()).read(io.StringIO(rdf_xml))
+
+
+def test_parse_from_file_with_expat_backend():
+    file_name = os.path.join(os.path.dirname(__file__), "../../data/SPDXRdfExample-v2.3.spdx.rdf.xml")
+
+    document = rdf_parser.parse_from_file(file_name, backend="expat")
+
+    expected_document = rdf_parser.parse_from_file(file_name)
+    assert document.creation_info == expected_document.creation_info
+    for field in ["packages", "files", "snippets", "annotations", "relationships", "extracted_licensing_info"]:
+        elements = getattr(document, field)
+        expected_elements = getattr(expected_document, field)
+        assert len(elements) == len(expected_elements)
+        assert all(element in expected_elements for element in elements)
+
+
+def test_parse_from_file_with_expat_backend_falls_back_to_rdflib(tmp_path):
+    file_name = os.path.join(os.path.dirname(__file__), "../../data/SPDXRdfExample-v2.3.spdx.rdf.xml")
+    with open(file_name) as file:
+        rdf_xml = file.read()
+    file_with_base_name = str(tmp_path / "with_base.rdf.xml")
+    with open(file_with_base_name, "w") as file:
+        file.write(rdf_xml.replace("<rdf:RDF", '<rdf:RDF xml:base="http://example.com/"', 1))
+
+    document = rdf_parser.parse_from_file(file_with_base_name, backend="expat")
+
+    expected_document = rdf_parser.parse_from_file(file_name)
+    assert document.creation_info == expected_document.creation_info
+    assert len(document.packages) == len(expected_document.packages)
+    assert len(document.relationships) == len(expected_document.relationships)
+
+
+def test_parse_from_file_with_unknown_backend():
+    file_name = os.path.join(os.path.dirname(__file__), "../../data/SPDXRdfExample-v2.3.spdx.rdf.xml")
+
+    with pytest.raises(ValueError):
+        rdf_parser.parse_from_file(file_name, backend="sax")
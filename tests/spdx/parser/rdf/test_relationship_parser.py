@@ -4,12 +4,14 @@
 import os
 
 import pytest
-from rdflib import RDF, Graph, URIRef
+from rdflib import RDF, BNode, Graph, URIRef
 
 from spdx_tools.spdx.constants import DOCUMENT_SPDX_ID
 from spdx_tools.spdx.model import RelationshipType
+from spdx_tools.spdx.parser.rdf.rdf_parser import translate_graph_to_document
 from spdx_tools.spdx.parser.rdf.relationship_parser import parse_implicit_relationship, parse_relationship
 from spdx_tools.spdx.rdfschema.namespace import SPDX_NAMESPACE
+from tests.spdx.mock_utils import count_relationship_comparisons
 
 
 def test_relationship_parser():
@@ -56,3 +58,39 @@ def test_parse_implicit_relationship(
     assert relationship.spdx_element_id == spdx_element_id
     assert relationship.relationship_type == relationship_type
     assert relationship.related_spdx_element_id == related_spdx_element_id
+
+
+def _graph_with_files_in_package(number_of_files: int) -> Graph:
+    # each file is contained in the package both by an explicit relationship and by the hasFile property
+    graph = Graph().parse(os.path.join(os.path.dirname(__file__), "data/file_to_test_rdf_parser.rdf.xml"))
+    package_node = URIRef("https://some.namespace#SPDXRef-Large-Package")
+    for index in range(number_of_files):
+        file_node = URIRef(f"https://some.namespace#SPDXRef-File-{index}")
+        relationship_node = BNode()
+        graph.add((package_node, SPDX_NAMESPACE.hasFile, file_node))
+        graph.add((package_node, SPDX_NAMESPACE.relationship, relationship_node))
+        graph.add((relationship_node, RDF.type, SPDX_NAMESPACE.Relationship))
+        graph.add((relationship_node, SPDX_NAMESPACE.relationshipType, SPDX_NAMESPACE.relationshipType_contains))
+        graph.add((relationship_node, SPDX_NAMESPACE.relatedSpdxElement, file_node))
+    return graph
+
+
+def _number_of_comparisons(graph: Graph) -> int:
+    return count_relationship_comparisons(lambda: translate_graph_to_document(graph, include=["relationships"]))
+
+
+def test_implicit_relationships_are_not_compared_with_all_existing_relationships():
+    small_graph = _graph_with_files_in_package(100)
+    large_graph = _graph_with_files_in_package(400)
+
+    relationships = translate_graph_to_document(large_graph, include=["relationships"]).relationships
+    assert (
+        len(
+            [relationship for relationship in relationships if relationship.spdx_element_id == "SPDXRef-Large-Package"]
+        )
+        == 400
+    )
+
+    # 4 times as many files must not need more than 4 times as many comparisons, while comparing each implicit
+    # relationship with all existing ones needs about 16 times as many
+    assert _number_of_comparisons(large_graph) <= 4 * _number_of_comparisons(small_graph)
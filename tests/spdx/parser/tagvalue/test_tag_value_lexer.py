@@ -2,15 +2,18 @@
 # SPDX-FileCopyrightText: 2023 spdx contributors
 #
 # SPDX-License-Identifier: Apache-2.0
+import os
+
 import pytest
 
 from spdx_tools.spdx.constants import DOCUMENT_SPDX_ID
+from spdx_tools.spdx.parser.tagvalue.fast_lexer import FastSPDXLexer
 from spdx_tools.spdx.parser.tagvalue.lexer import SPDXLexer
 
 
-@pytest.fixture
-def lexer():
-    lexer = SPDXLexer()
+@pytest.fixture(params=[SPDXLexer, FastSPDXLexer])
+def lexer(request):
+    lexer = request.param()
     lexer.build()
     return lexer
 
@@ -319,3 +322,46 @@ def test_tokenization_of_relationship(lexer):
     token_assert_helper(lexer.token(), "LINE", "This is a comment.", 2)
     token_assert_helper(lexer.token(), "RELATIONSHIP", "Relationship", 3)
     token_assert_helper(lexer.token(), "LINE", "DocumentRef-extern:SPDXRef-Package DESCRIBES NONE", 3)
+
+
+def get_tokens(lexer, data):
+    lexer.input(data)
+    tokens = []
+    token = lexer.token()
+    while token is not None:
+        tokens.append((token.type, token.value, token.lineno, token.lexpos))
+        token = lexer.token()
+    return tokens
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        "PackageName: package\r\n\r\nPackageVersion: 1.0\r\n",
+        "  PackageName :package # no comment\n\t# comment\nSPDXID:\n",
+        "FileChecksum: SHA1:\nabc\nFileChecksum: SHA1: ABC SPDXID SHA1 Tag2: value",
+        "Created: 2010-01-29T18:30:22Z trailing\nCreator: Tool: tool\nCreator:\n Person: Jane Doe",
+        "DocumentComment: <text>multi-\nline\n</text>  \n  PackageName: package",
+        "PackageComment:\n\n<text>text</text>PackageName: <text>unterminated",
+        "PackageName: NONE\n1PackageVersion: NOASSERTION\n: value\n\x0cTag",
+    ],
+)
+def test_fast_lexer_produces_same_tokens_for_edge_cases(data):
+    ply_lexer = SPDXLexer()
+    ply_lexer.build()
+    fast_lexer = FastSPDXLexer()
+    fast_lexer.build()
+
+    assert get_tokens(fast_lexer, data) == get_tokens(ply_lexer, data)
+
+
+@pytest.mark.parametrize("file_name", ["SPDXTagExample-v2.2.spdx", "SPDXTagExample-v2.3.spdx", "SPDXLite.spdx"])
+def test_fast_lexer_produces_same_tokens_for_example_files(file_name):
+    with open(os.path.join(os.path.dirname(__file__), "../../data", file_name), encoding="utf-8") as file:
+        data = file.read()
+    ply_lexer = SPDXLexer()
+    ply_lexer.build()
+    fast_lexer = FastSPDXLexer()
+    fast_lexer.build()
+
+    assert get_tokens(fast_lexer, data) == get_tokens(ply_lexer, data)
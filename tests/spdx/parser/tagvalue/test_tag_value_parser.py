@@ -3,12 +3,17 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
+import os
+
 import pytest
 
+from spdx_tools.common.spdx_licensing import spdx_licensing
 from spdx_tools.spdx.constants import DOCUMENT_SPDX_ID
 from spdx_tools.spdx.model import Relationship, RelationshipType, SpdxNoAssertion, SpdxNone
 from spdx_tools.spdx.parser.error import SPDXParsingError
-from spdx_tools.spdx.parser.tagvalue.parser import Parser
+from spdx_tools.spdx.parser.tagvalue import tagvalue_parser
+from spdx_tools.spdx.parser.tagvalue.parser import Parser, get_table_cache_file
+from tests.spdx.mock_utils import count_relationship_comparisons
 from tests.spdx.parser.tagvalue.test_creation_info_parser import DOCUMENT_STR
 
 
@@ -54,6 +59,53 @@ def test_building_contains_relationship():
     ]
 
 
+def test_contains_relationship_is_not_duplicated():
+    parser = Parser()
+    document_str = "\n".join(
+        [
+            DOCUMENT_STR,
+            "PackageName: Package",
+            "SPDXID: SPDXRef-Package",
+            "PackageDownloadLocation: https://download.com",
+            "Relationship: SPDXRef-Package CONTAINS SPDXRef-File",
+            "RelationshipComment: explicit relationship",
+            "FileName: File in package",
+            "SPDXID: SPDXRef-File",
+            "FileChecksum: SHA1: d6a770ba38583ed4bb4525bd96e50461655d2759",
+        ]
+    )
+    document = parser.parse(document_str)
+
+    assert document.relationships == [
+        Relationship("SPDXRef-Package", RelationshipType.CONTAINS, "SPDXRef-File", "explicit relationship")
+    ]
+
+
+def _document_str_with_files(number_of_files: int) -> str:
+    lines = [DOCUMENT_STR, "PackageName: Package", "SPDXID: SPDXRef-Package", "PackageDownloadLocation: NONE"]
+    for index in range(number_of_files):
+        lines += [
+            f"FileName: File{index}",
+            f"SPDXID: SPDXRef-File{index}",
+            "FileChecksum: SHA1: d6a770ba38583ed4bb4525bd96e50461655d2759",
+        ]
+    return "\n".join(lines)
+
+
+def test_contains_relationships_are_not_compared_with_all_existing_relationships():
+    parser = Parser()
+    small_document_str = _document_str_with_files(100)
+    large_document_str = _document_str_with_files(400)
+
+    assert len(parser.parse(large_document_str).relationships) == 400
+    small_document_comparisons = count_relationship_comparisons(lambda: parser.parse(small_document_str))
+    large_document_comparisons = count_relationship_comparisons(lambda: parser.parse(large_document_str))
+
+    # 4 times as many files must not need more than 4 times as many comparisons, while comparing each contains
+    # relationship with all existing ones needs about 16 times as many
+    assert large_document_comparisons <= 4 * small_document_comparisons
+
+
 def test_build_contains_relationship_with_error():
     parser = Parser()
     file_spdx_ids = ["SPDXRef-File-in-Package", "SPDXRef-Second-File-in-Package"]
@@ -138,6 +190,31 @@ def test_faulty_license_expression():
     ]
 
 
+def test_license_expressions_are_parsed_once_per_document():
+    parser = Parser()
+    document_str = "\n".join(
+        [
+            DOCUMENT_STR,
+            "FileName: File",
+            "SPDXID: SPDXRef-File",
+            "FileChecksum: SHA1: d6a770ba38583ed4bb4525bd96e50461655d2759",
+            "LicenseConcluded: MIT OR Apache-2.0",
+            "LicenseInfoInFile: MIT",
+            "PackageName: Package",
+            "SPDXID: SPDXRef-Package",
+            "PackageDownloadLocation: www.download.com",
+            "PackageLicenseConcluded: MIT OR Apache-2.0",
+            "PackageLicenseInfoFromFiles: MIT",
+        ]
+    )
+
+    document = parser.parse(document_str)
+
+    assert document.files[0].license_concluded is document.packages[0].license_concluded
+    assert document.files[0].license_info_in_file[0] is document.packages[0].license_info_from_files[0]
+    assert document.files[0].license_concluded == spdx_licensing.parse("MIT OR Apache-2.0")
+
+
 def test_parse_none_or_no_assertion_as_text():
     parser = Parser()
     document_str = "\n".join(
@@ -162,3 +239,101 @@ def test_parse_none_or_no_assertion_as_text():
     assert package.summary == "NONE"
     assert package.license_concluded == SpdxNone()
     assert package.license_declared == SpdxNoAssertion()
+
+
+def test_parser_can_be_reused():
+    parser = Parser()
+    document_str = "\n".join([DOCUMENT_STR, "Relationship: SPDXRef-DOCUMENT DESCRIBES SPDXRef-File"])
+    invalid_document_str = "\n".join([DOCUMENT_STR, "SnippetSPDXID: SPDXRef-Snippet", "SnippetBadTag: value"])
+
+    document = parser.parse(document_str)
+    with pytest.raises(SPDXParsingError) as first_error:
+        parser.parse(invalid_document_str)
+    with pytest.raises(SPDXParsingError) as second_error:
+        parser.parse(invalid_document_str)
+
+    assert parser.parse(document_str) == document
+    assert document.relationships == [Relationship(DOCUMENT_SPDX_ID, RelationshipType.DESCRIBES, "SPDXRef-File")]
+    assert first_error.value.get_messages() == second_error.value.get_messages()
+
+
+def test_parse_from_file_reuses_parser():
+    file_name = os.path.join(os.path.dirname(__file__), "../../data/SPDXTagExample-v2.3.spdx")
+
+    document = tagvalue_parser.parse_from_file(file_name)
+
+    assert tagvalue_parser.get_default_parser() is tagvalue_parser.get_default_parser()
+    assert tagvalue_parser.parse_from_file(file_name) == document
+
+
+def test_parser_does_not_keep_the_state_of_the_parsed_document():
+    parser = Parser()
+
+    parser.parse(DOCUMENT_STR)
+    with pytest.raises(SPDXParsingError):
+        parser.parse("SPDXVersion: SPDX-2.3\nSPDXID: SPDXRef-DOCUMENT")
+
+    assert parser.elements_built == dict()
+    assert parser.relationship_keys == set()
+    assert list(parser.creation_info) == ["logger"]
+    assert not parser.creation_info["logger"].has_messages()
+    assert parser.lex.lexer.lexdata == ""
+
+
+def test_parse_with_fast_lexer():
+    file_name = os.path.join(os.path.dirname(__file__), "../../data/SPDXTagExample-v2.3.spdx")
+    with open(file_name, encoding="utf-8") as file:
+        data = file.read()
+
+    assert Parser(lexer="fast").parse(data) == Parser().parse(data)
+
+
+def test_parse_with_unknown_lexer():
+    with pytest.raises(ValueError, match="Unknown lexer"):
+        Parser(lexer="unknown")
+
+
+@pytest.fixture
+def table_cache_directory(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    get_table_cache_file.cache_clear()
+    yield tmp_path / "spdx-tools"
+    get_table_cache_file.cache_clear()
+
+
+def test_parsing_tables_are_cached(table_cache_directory):
+    Parser()
+
+    table_files = list(table_cache_directory.iterdir())
+    assert [table_file.name for table_file in table_files] == [os.path.basename(get_table_cache_file())]
+    modification_time = table_files[0].stat().st_mtime_ns
+
+    parser = Parser()
+
+    assert table_files[0].stat().st_mtime_ns == modification_time
+    assert parser.parse(DOCUMENT_STR).creation_info.spdx_id == DOCUMENT_SPDX_ID
+
+
+def test_invalid_cached_parsing_tables_are_replaced(table_cache_directory, caplog):
+    table_cache_directory.mkdir()
+    with open(get_table_cache_file(), "wb") as table_file:
+        table_file.write(b"invalid")
+
+    parser = Parser()
+
+    assert parser.parse(DOCUMENT_STR).creation_info.spdx_id == DOCUMENT_SPDX_ID
+    assert os.path.getsize(get_table_cache_file()) > len(b"invalid")
+    assert "can't be read" in caplog.text
+
+
+def test_temporary_table_file_is_removed_if_it_cant_be_moved(table_cache_directory, monkeypatch, caplog):
+    def fail_to_replace(source, destination):
+        raise OSError("read-only")
+
+    monkeypatch.setattr(os, "replace", fail_to_replace)
+
+    parser = Parser()
+
+    assert parser.parse(DOCUMENT_STR).creation_info.spdx_id == DOCUMENT_SPDX_ID
+    assert list(table_cache_directory.iterdir()) == []
+    assert "can't be cached" in caplog.text
@@ -0,0 +1,37 @@
+# SPDX-FileCopyrightText: 2026 spdx contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+import pytest
+
+from spdx_tools.spdx.parser.projection import get_excluded_fields
+
+
+@pytest.mark.parametrize(
+    "include, exclude, expected_excluded_fields",
+    [
+        (None, None, set()),
+        (None, ["files", "checksums"], {"files", "checksums"}),
+        (
+            ["packages", "relationships"],
+            None,
+            {"files", "snippets", "annotations", "extracted_licensing_info"},
+        ),
+        (
+            ["packages", "relationships"],
+            ["relationships", "license_fields"],
+            {"files", "snippets", "annotations", "relationships", "extracted_licensing_info", "license_fields"},
+        ),
+        ([], None, {"packages", "files", "snippets", "annotations", "relationships", "extracted_licensing_info"}),
+    ],
+)
+def test_get_excluded_fields(include, exclude, expected_excluded_fields):
+    assert get_excluded_fields(include, exclude) == expected_excluded_fields
+
+
+@pytest.mark.parametrize(
+    "include, exclude",
+    [(["packages", "checksums"], None), (["creation_info"], None), (None, ["unknown"]), (None, ["packages", "file"])],
+)
+def test_get_excluded_fields_with_unknown_fields(include, exclude):
+    with pytest.raises(ValueError):
+        get_excluded_fields(include, exclude)
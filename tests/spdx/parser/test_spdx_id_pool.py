@@ -0,0 +1,53 @@
+# SPDX-FileCopyrightText: 2026 spdx contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+import os
+
+import pytest
+
+from spdx_tools.spdx.model import SpdxNoAssertion, SpdxNone
+from spdx_tools.spdx.parser.parse_anything import parse_file
+from spdx_tools.spdx.parser.spdx_id_pool import SpdxIdPool
+
+
+def test_intern():
+    spdx_id_pool = SpdxIdPool()
+    spdx_id = "".join(["SPDXRef-", "Package"])
+    equal_spdx_id = "".join(["SPDXRef-", "Package"])
+
+    assert spdx_id_pool.intern(spdx_id) is spdx_id
+    assert spdx_id_pool.intern(equal_spdx_id) is spdx_id
+    assert spdx_id_pool.intern(None) is None
+    assert spdx_id_pool.intern(SpdxNone()) == SpdxNone()
+    assert spdx_id_pool.intern(SpdxNoAssertion()) == SpdxNoAssertion()
+    assert len(spdx_id_pool) == 1
+
+    spdx_id_pool.clear()
+
+    assert spdx_id_pool.intern(equal_spdx_id) is equal_spdx_id
+
+
+@pytest.mark.parametrize(
+    "file_name",
+    ["SPDXJSONExample-v2.3.spdx.json", "SPDXTagExample-v2.3.spdx", "SPDXRdfExample-v2.3.spdx.rdf.xml"],
+)
+def test_parsers_share_spdx_id_objects(file_name):
+    document = parse_file(os.path.join(os.path.dirname(__file__), "../data", file_name))
+    spdx_ids_by_value = {document.creation_info.spdx_id: document.creation_info.spdx_id}
+    for element in document.packages + document.files + document.snippets:
+        spdx_ids_by_value.setdefault(element.spdx_id, element.spdx_id)
+
+    referencing_spdx_ids = [
+        spdx_id
+        for relationship in document.relationships
+        for spdx_id in [relationship.spdx_element_id, relationship.related_spdx_element_id]
+        if isinstance(spdx_id, str) and spdx_id in spdx_ids_by_value
+    ]
+    referencing_spdx_ids += [
+        annotation.spdx_id for annotation in document.annotations if annotation.spdx_id in spdx_ids_by_value
+    ]
+    referencing_spdx_ids += [snippet.file_spdx_id for snippet in document.snippets]
+
+    assert referencing_spdx_ids
+    for spdx_id in referencing_spdx_ids:
+        assert spdx_id is spdx_ids_by_value[spdx_id]
@@ -0,0 +1,53 @@
+# SPDX-FileCopyrightText: 2026 spdx contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+import io
+import os
+
+import pytest
+
+from spdx_tools.spdx.model import File, Package, Relationship, Snippet
+from spdx_tools.spdx.parser.error import SPDXParsingError
+from spdx_tools.spdx.parser.xml import xml_parser
+
+
+def test_parse_xml_to_dict_converts_list_like_fields():
+    xml = (
+        '<Document><name>doc</name><documentDescribes>SPDXRef-Package</documentDescribes><packages id="1">'
+        "<SPDXID>SPDXRef-Package</SPDXID><checksums/><externalRefs>first</externalRefs><externalRefs/>"
+        "<externalRefs>second</externalRefs></packages><comment>one</comment><comment>two</comment></Document>"
+    )
+
+    parsed_xml = xml_parser.parse_xml_to_dict(io.StringIO(xml))
+
+    assert parsed_xml == {
+        "Document": {
+            "name": "doc",
+            "documentDescribes": ["SPDXRef-Package"],
+            "packages": [
+                {"@id": "1", "SPDXID": "SPDXRef-Package", "checksums": [], "externalRefs": ["first", "second"]}
+            ],
+            "comment": ["one", "two"],
+        }
+    }
+
+
+def test_parse_xml_to_dict_with_entity_declaration():
+    xml = '<?xml version="1.0"?><!DOCTYPE Document [<!ENTITY name "doc">]><Document><name>&name;</name></Document>'
+
+    with pytest.raises(SPDXParsingError):
+        xml_parser.parse_xml_to_dict(io.StringIO(xml))
+
+
+def test_iter_elements():
+    file_name = os.path.join(os.path.dirname(__file__), "../../data/SPDXXMLExample-v2.3.spdx.xml")
+    document = xml_parser.parse_from_file(file_name)
+
+    elements = list(xml_parser.iter_elements(file_name))
+
+    assert [element for element in elements if isinstance(element, Package)] == document.packages
+    assert [element for element in elements if isinstance(element, File)] == document.files
+    assert [element for element in elements if isinstance(element, Snippet)] == document.snippets
+    relationships = [element for element in elements if isinstance(element, Relationship)]
+    assert len(relationships) == 7
+    assert all(relationship in document.relationships for relationship in relationships)
@@ -22,6 +22,8 @@ from spdx_tools.spdx.clitools.pyspdxtools import main
             "SPDX-2.3",
         ),
         ("-i", str(resources.files("tests.spdx.data").joinpath("SPDXJSONExample-v2.3.spdx.json")), "-o", "-"),
+        ("-i", str(resources.files("tests.spdx.data").joinpath("SPDXJSONExample-v2.3.spdx.json")), "--jobs", "2"),
+        ("-i", str(resources.files("tests.spdx.data").joinpath("SPDXJSONExample-v2.3.spdx.json")), "--fail-fast"),
     ],
 )
 def test_cli_with_system_exit_code_0(options):
@@ -44,6 +46,17 @@ def test_cli_with_system_exit_code_0(options):
                 )
             ),
         ),
+        (
+            "-i",
+            str(
+                resources.files("tests.spdx.data.invalid").joinpath(
+                    "spdx-trivy-vmware_log-intelligence-fluentd-"
+                    "sha256_086af034f561f343f633be9d9f9e95f65ae6c61b8ddb2c6755ef5bb25b40f53a.json"
+                )
+            ),
+            "--max-messages",
+            "1",
+        ),
         ("-i", "non_existent_file.spdx"),
     ],
 )
@@ -61,6 +74,13 @@ def test_cli_with_system_exit_code_1(options):
         (),
         ("-i", str(resources.files("tests.spdx.data").joinpath("SPDXJSONExample-v2.3.spdx.json")), "--version"),
         ("-i", str(resources.files("tests.spdx.data").joinpath("SPDXJSONExample-v2.3.spdx.json")), "-o"),
+        ("-i", str(resources.files("tests.spdx.data").joinpath("SPDXJSONExample-v2.3.spdx.json")), "--jobs", "0"),
+        (
+            "-i",
+            str(resources.files("tests.spdx.data").joinpath("SPDXJSONExample-v2.3.spdx.json")),
+            "--max-messages",
+            "0",
+        ),
     ],
 )
 def test_cli_with_system_exit_code_2(options):
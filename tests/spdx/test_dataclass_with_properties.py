@@ -0,0 +1,94 @@
+# SPDX-FileCopyrightText: 2026 spdx contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+import pickle
+import tracemalloc
+from copy import deepcopy
+
+import pytest
+from beartype.typing import Optional, Union
+
+from spdx_tools.common.typing.dataclass_with_properties import dataclass_with_properties
+from spdx_tools.common.typing.type_checks import check_types_and_set_values
+from spdx_tools.spdx.model import (
+    Actor,
+    Checksum,
+    File,
+    Package,
+    Relationship,
+    RelationshipType,
+    Snippet,
+    SpdxNoAssertion,
+    SpdxNone,
+)
+from tests.spdx.fixtures import (
+    actor_fixture,
+    checksum_fixture,
+    file_fixture,
+    package_fixture,
+    relationship_fixture,
+    snippet_fixture,
+)
+
+
+@dataclass_with_properties
+class RelationshipWithDict:
+    # the same fields as Relationship, stored in an instance __dict__
+    spdx_element_id: str
+    relationship_type: RelationshipType
+    related_spdx_element_id: Union[str, SpdxNone, SpdxNoAssertion]
+    comment: Optional[str] = None
+
+    def __init__(
+        self,
+        spdx_element_id: str,
+        relationship_type: RelationshipType,
+        related_spdx_element_id: Union[str, SpdxNone, SpdxNoAssertion],
+        comment: Optional[str] = None,
+    ):
+        check_types_and_set_values(self, locals())
+
+
+@pytest.mark.parametrize(
+    "element, slotted_class",
+    [
+        (actor_fixture(), Actor),
+        (checksum_fixture(), Checksum),
+        (file_fixture(), File),
+        (package_fixture(), Package),
+        (relationship_fixture(), Relationship),
+        (snippet_fixture(), Snippet),
+    ],
+)
+def test_slotted_classes(element, slotted_class):
+    assert isinstance(element, slotted_class)
+    assert not hasattr(element, "__dict__")
+    assert pickle.loads(pickle.dumps(element)) == element
+    assert deepcopy(element) == element
+    with pytest.raises(AttributeError):
+        element.unknown_attribute = "value"
+
+
+def test_slotted_class_properties_are_type_checked():
+    relationship = relationship_fixture()
+
+    relationship.comment = "new comment"
+
+    assert relationship.comment == "new comment"
+    with pytest.raises(TypeError):
+        relationship.comment = 5
+
+
+def _memory_per_instance(relationship_class) -> float:
+    number_of_instances = 10000
+    spdx_ids = [f"SPDXRef-{index}" for index in range(number_of_instances)]
+    tracemalloc.start()
+    relationships = [relationship_class(spdx_id, RelationshipType.CONTAINS, spdx_id) for spdx_id in spdx_ids]
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return memory / len(relationships)
+
+
+def test_slotted_instances_use_less_memory():
+    # about 113 bytes per instance with an instance __dict__ and 73 bytes with slots on CPython 3.11
+    assert _memory_per_instance(Relationship) < 0.8 * _memory_per_instance(RelationshipWithDict)
@@ -0,0 +1,111 @@
+# SPDX-FileCopyrightText: 2026 spdx contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+import pytest
+
+from spdx_tools.spdx.constants import DOCUMENT_SPDX_ID
+from spdx_tools.spdx.document_index import DocumentIndex
+from spdx_tools.spdx.model import File, Package, RelationshipType, Snippet, SpdxNoAssertion, SpdxNone
+from tests.spdx.fixtures import (
+    annotation_fixture,
+    document_fixture,
+    file_fixture,
+    package_fixture,
+    relationship_fixture,
+    snippet_fixture,
+)
+
+
+@pytest.fixture
+def variables():
+    return document_fixture(), package_fixture(), file_fixture(), snippet_fixture()
+
+
+def test_element_lookups(variables):
+    document, package, file, snippet = variables
+    document_index = DocumentIndex(document)
+
+    assert document_index.get_element(package.spdx_id) == package
+    assert document_index.get_element(file.spdx_id) == file
+    assert document_index.get_element(snippet.spdx_id) == snippet
+    assert document_index.get_element("unknown_id") is None
+    assert document_index.get_element(SpdxNone()) is None
+
+    assert document_index.get_element_type(package.spdx_id) == Package
+    assert document_index.get_element_type(file.spdx_id) == File
+    assert document_index.get_element_type(snippet.spdx_id) == Snippet
+    assert document_index.get_element_type("unknown_id") is None
+    assert document_index.get_element_type(SpdxNoAssertion()) is None
+
+
+def test_id_lookups(variables):
+    document, package, file, snippet = variables
+    document_index = DocumentIndex(document)
+
+    assert document_index.spdx_ids == {DOCUMENT_SPDX_ID, package.spdx_id, file.spdx_id, snippet.spdx_id}
+    assert document_index.contains_spdx_id(DOCUMENT_SPDX_ID)
+    assert not document_index.contains_spdx_id("SPDXRef-unknown")
+    assert document_index.contains_file_spdx_id(file.spdx_id)
+    assert not document_index.contains_file_spdx_id(package.spdx_id)
+    assert document_index.contains_external_document_ref_id("DocumentRef-external")
+    assert not document_index.contains_external_document_ref_id("DocumentRef-unknown")
+    assert document_index.contains_extracted_license_id("LicenseRef-1")
+    assert not document_index.contains_extracted_license_id("LicenseRef-unknown")
+
+
+def test_annotation_lookup():
+    first_annotation = annotation_fixture(spdx_id="SPDXRef-File")
+    second_annotation = annotation_fixture(spdx_id="SPDXRef-Package")
+    third_annotation = annotation_fixture(spdx_id="SPDXRef-File")
+    document = document_fixture(annotations=[first_annotation, second_annotation, third_annotation])
+    document_index = DocumentIndex(document)
+
+    assert document_index.get_annotations("SPDXRef-File") == [first_annotation, third_annotation]
+    assert document_index.get_annotations("SPDXRef-Package") == [second_annotation]
+    assert document_index.get_annotations("SPDXRef-unknown") == []
+
+
+def test_relationship_lookups():
+    describes_package = relationship_fixture(related_spdx_element_id="SPDXRef-Package")
+    describes_file = relationship_fixture(related_spdx_element_id="SPDXRef-File")
+    package_contains_file = relationship_fixture(
+        spdx_element_id="SPDXRef-Package", relationship_type=RelationshipType.CONTAINS
+    )
+    file_contained_by_package = relationship_fixture(
+        spdx_element_id="SPDXRef-File",
+        relationship_type=RelationshipType.CONTAINED_BY,
+        related_spdx_element_id="SPDXRef-Package",
+    )
+    package_depends_on_none = relationship_fixture(
+        spdx_element_id="SPDXRef-Package",
+        relationship_type=RelationshipType.DEPENDS_ON,
+        related_spdx_element_id=SpdxNone(),
+    )
+    document = document_fixture(
+        relationships=[
+            describes_package,
+            describes_file,
+            package_contains_file,
+            file_contained_by_package,
+            package_depends_on_none,
+        ]
+    )
+    document_index = DocumentIndex(document)
+
+    assert document_index.filter_by_type_and_origin(RelationshipType.DESCRIBES, DOCUMENT_SPDX_ID) == [
+        describes_package,
+        describes_file,
+    ]
+    assert document_index.filter_by_type_and_origin(RelationshipType.CONTAINS, "SPDXRef-Package") == [
+        package_contains_file
+    ]
+    assert document_index.filter_by_type_and_origin(RelationshipType.CONTAINS, "SPDXRef-File") == []
+    assert document_index.filter_by_type_and_target(RelationshipType.CONTAINED_BY, "SPDXRef-Package") == [
+        file_contained_by_package
+    ]
+    assert document_index.filter_by_type_and_target(RelationshipType.DESCRIBES, "SPDXRef-File") == [describes_file]
+    assert document_index.relationships_by_origin["SPDXRef-Package"] == [
+        package_contains_file,
+        package_depends_on_none,
+    ]
+    assert document_index.relationships_by_type[RelationshipType.DEPENDS_ON] == [package_depends_on_none]
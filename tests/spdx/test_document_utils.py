@@ -12,7 +12,7 @@ from spdx_tools.spdx.document_utils import (
     get_contained_spdx_elements,
     get_element_from_spdx_id,
 )
-from spdx_tools.spdx.model import FileType, SpdxNoAssertion, SpdxNone
+from spdx_tools.spdx.model import FileType, SpdxNoAssertion, SpdxNone, Version
 from tests.spdx.fixtures import (
     actor_fixture,
     checksum_fixture,
@@ -62,6 +62,32 @@ def test_create_list_without_duplicates():
     assert list_without_duplicates == [1, 2, 3, 5, 67, 9]
 
 
+def test_create_list_without_duplicates_of_unhashable_values():
+    list_with_duplicates = [
+        checksum_fixture(),
+        checksum_fixture(value="other value"),
+        checksum_fixture(),
+        SpdxNone(),
+        SpdxNoAssertion(),
+        SpdxNone(),
+        Version(2, 3),
+        Version(2, 3),
+        [actor_fixture()],
+        [actor_fixture()],
+    ]
+
+    list_without_duplicates = create_list_without_duplicates(list_with_duplicates)
+
+    assert list_without_duplicates == [
+        checksum_fixture(),
+        checksum_fixture(value="other value"),
+        SpdxNone(),
+        SpdxNoAssertion(),
+        Version(2, 3),
+        [actor_fixture()],
+    ]
+
+
 def test_create_document_without_duplicates():
     document = document_fixture(
         creation_info=creation_info_fixture(
@@ -123,3 +149,19 @@ def test_create_document_without_duplicates():
     document_without_duplicates = create_document_without_duplicates(document)
 
     assert document_without_duplicates == expected_document
+    assert document.files[0].checksums == [checksum_fixture(), checksum_fixture()]
+
+
+def test_create_document_without_duplicates_shares_elements_without_duplicates():
+    document = document_fixture(
+        packages=[package_fixture(), package_fixture(spdx_id="SPDXRef-Other", attribution_texts=["text", "text"])]
+    )
+
+    document_without_duplicates = create_document_without_duplicates(document)
+
+    assert document_without_duplicates is not document
+    assert document_without_duplicates.creation_info is document.creation_info
+    assert document_without_duplicates.files is document.files
+    assert document_without_duplicates.packages[0] is document.packages[0]
+    assert document_without_duplicates.packages[1].attribution_texts == ["text"]
+    assert document.packages[1].attribution_texts == ["text", "text"]
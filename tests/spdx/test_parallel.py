@@ -0,0 +1,19 @@
+# SPDX-FileCopyrightText: 2026 spdx contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+import pytest
+
+from spdx_tools.common.parallel import get_chunk_ranges
+
+
+@pytest.mark.parametrize(
+    "number_of_elements, workers, expected_ranges",
+    [
+        (0, 2, []),
+        (3, 2, [(0, 1), (1, 2), (2, 3)]),
+        (10, 1, [(0, 3), (3, 6), (6, 9), (9, 10)]),
+        (16, 2, [(0, 2), (2, 4), (4, 6), (6, 8), (8, 10), (10, 12), (12, 14), (14, 16)]),
+    ],
+)
+def test_get_chunk_ranges(number_of_elements, workers, expected_ranges):
+    assert get_chunk_ranges(number_of_elements, workers) == expected_ranges
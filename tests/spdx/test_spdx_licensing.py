@@ -0,0 +1,48 @@
+# SPDX-FileCopyrightText: 2026 spdx contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+import os
+
+import pytest
+from license_expression import ExpressionError
+
+from spdx_tools.common.spdx_licensing import parse_license_expression_str, spdx_licensing
+from spdx_tools.spdx.parser.parse_anything import parse_file
+
+
+def test_license_expression_cache():
+    parse_license_expression_str.cache_clear()
+
+    license_expression = parse_license_expression_str("MIT OR Apache-2.0")
+    assert license_expression == spdx_licensing.parse("MIT OR Apache-2.0")
+    assert parse_license_expression_str("MIT OR Apache-2.0") is license_expression
+    assert parse_license_expression_str("MIT") == spdx_licensing.parse("MIT")
+
+    # expressions that can't be parsed are not cached
+    for _ in range(2):
+        with pytest.raises(ExpressionError):
+            parse_license_expression_str("MIT AND (")
+    cache_info = parse_license_expression_str.cache_info()
+    assert (cache_info.hits, cache_info.misses, cache_info.currsize) == (1, 4, 2)
+
+
+@pytest.mark.parametrize(
+    "file_name",
+    [
+        "SPDXJSONExample-v2.3.spdx.json",
+        "SPDXYAMLExample-v2.3.spdx.yaml",
+        "SPDXXMLExample-v2.3.spdx.xml",
+        "SPDXRdfExample-v2.3.spdx.rdf.xml",
+        "SPDXTagExample-v2.3.spdx",
+    ],
+)
+def test_parsers_share_license_expressions(file_name):
+    file_path = os.path.join(os.path.dirname(__file__), "data", file_name)
+    parse_license_expression_str.cache_clear()
+
+    document = parse_file(file_path)
+    misses = parse_license_expression_str.cache_info().misses
+    other_document = parse_file(file_path)
+
+    assert parse_license_expression_str.cache_info().misses == misses
+    assert other_document.packages[0].license_declared is document.packages[0].license_declared
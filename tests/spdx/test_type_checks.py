@@ -0,0 +1,53 @@
+# SPDX-FileCopyrightText: 2026 spdx contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+import pytest
+
+from spdx_tools.common.typing.constructor_type_errors import ConstructorTypeErrors
+from spdx_tools.common.typing.type_checks import check_types, type_checks_disabled
+from spdx_tools.spdx.model import Checksum, ChecksumAlgorithm, File, Relationship, RelationshipType, SpdxNone
+from tests.spdx.fixtures import file_fixture, package_fixture, snippet_fixture
+
+
+def test_construction_without_type_checks():
+    with type_checks_disabled():
+        file = File(name=5, spdx_id=None, checksums=[Checksum(ChecksumAlgorithm.SHA1, "71c4025dd9897b364f3ebbb42c")])
+
+    assert file.name == 5
+    assert file.spdx_id is None
+    assert file.file_types == []
+
+
+def test_setters_are_type_checked_inside_of_type_checks_disabled():
+    with type_checks_disabled():
+        relationship = Relationship("SPDXRef-File", RelationshipType.CONTAINS, SpdxNone())
+
+        with pytest.raises(TypeError):
+            relationship.comment = 5
+
+
+def test_type_checks_are_enabled_after_type_checks_disabled():
+    with type_checks_disabled():
+        pass
+
+    with pytest.raises(ConstructorTypeErrors):
+        Relationship("SPDXRef-File", RelationshipType.CONTAINS, 5)
+
+
+@pytest.mark.parametrize("element", [file_fixture(), package_fixture(), snippet_fixture()])
+def test_check_types_of_valid_elements(element):
+    check_types(element)
+
+
+def test_check_types_reports_the_errors_of_the_constructor():
+    arguments = dict(name=5, spdx_id="SPDXRef-File", checksums=[], file_types=["SOURCE"], comment=None)
+    with pytest.raises(ConstructorTypeErrors) as constructor_error:
+        File(**arguments)
+    with type_checks_disabled():
+        file = File(**arguments)
+
+    with pytest.raises(ConstructorTypeErrors) as check_types_error:
+        check_types(file)
+
+    assert len(check_types_error.value.get_messages()) == 2
+    assert check_types_error.value.get_messages() == constructor_error.value.get_messages()
@@ -2,14 +2,17 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 import os
-from typing import List, Optional
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
+from unittest import mock
 
 import pytest
 
 from spdx_tools.spdx.constants import DOCUMENT_SPDX_ID
 from spdx_tools.spdx.model import CreationInfo, Document, Relationship, RelationshipType
 from spdx_tools.spdx.parser.parse_anything import parse_file
-from spdx_tools.spdx.validation.document_validator import validate_full_spdx_document
+from spdx_tools.spdx.validation.document_validator import iter_validation_messages, validate_full_spdx_document
+from spdx_tools.spdx.validation.package_validator import validate_package_within_document
 from spdx_tools.spdx.validation.validation_message import SpdxElementType, ValidationContext, ValidationMessage
 from tests.spdx.fixtures import creation_info_fixture, document_fixture, file_fixture, package_fixture, snippet_fixture
 
@@ -150,3 +153,110 @@ def test_duplicated_spdx_ids():
             context,
         )
     ]
+
+
+def _document_with_relationships(number_of_relationships: int) -> Document:
+    number_of_packages = number_of_relationships // 10
+    packages = [package_fixture(spdx_id=f"SPDXRef-Package{index}") for index in range(number_of_packages)]
+    relationships = [
+        Relationship(DOCUMENT_SPDX_ID, RelationshipType.DESCRIBES, f"SPDXRef-Package{index % number_of_packages}")
+        for index in range(number_of_relationships)
+    ]
+    return document_fixture(packages=packages, files=[], snippets=[], annotations=[], relationships=relationships)
+
+
+class ScanCountingList(list):
+    def __init__(self, elements):
+        super().__init__(elements)
+        self.scans = 0
+
+    def __iter__(self):
+        self.scans += 1
+        return super().__iter__()
+
+    def __contains__(self, element):
+        self.scans += 1
+        return super().__contains__(element)
+
+
+def _number_of_scans(number_of_relationships: int) -> Tuple[int, int]:
+    document = _document_with_relationships(number_of_relationships)
+    document.packages = ScanCountingList(document.packages)
+    document.extracted_licensing_info = ScanCountingList(document.extracted_licensing_info)
+
+    assert validate_full_spdx_document(document) == []
+
+    return document.packages.scans, document.extracted_licensing_info.scans
+
+
+def test_validation_scans_the_element_lists_independently_of_the_document_size():
+    # the elements and license expressions are validated against the index of the document, so that the lists of the
+    # document are only scanned a fixed number of times instead of once per element or relationship
+    assert _number_of_scans(1600) == _number_of_scans(100)
+
+
+def test_parallel_validation_returns_the_messages_of_the_serial_validation_in_the_same_order():
+    document = document_fixture(
+        packages=[package_fixture(spdx_id=f"SPDXRef-Package{index}", homepage="invalid") for index in range(10)],
+        files=[file_fixture(spdx_id=f"SPDXRef-File{index}", name=f"/absolute{index}") for index in range(10)],
+        snippets=[snippet_fixture(spdx_id=f"SPDXRef-Snippet{index}", byte_range=(0, 1)) for index in range(10)],
+        relationships=[
+            Relationship(DOCUMENT_SPDX_ID, RelationshipType.DESCRIBES, f"SPDXRef-Unknown{index}")
+            for index in range(10)
+        ],
+    )
+    serial_validation_messages: List[ValidationMessage] = validate_full_spdx_document(document)
+
+    with mock.patch(
+        "spdx_tools.spdx.validation.document_validator.ProcessPoolExecutor", wraps=ProcessPoolExecutor
+    ) as executor_class:
+        parallel_validation_messages: List[ValidationMessage] = validate_full_spdx_document(document, workers=2)
+
+    executor_class.assert_called_once()
+    assert executor_class.call_args.kwargs["max_workers"] == 2
+    assert len(serial_validation_messages) > 40
+    assert parallel_validation_messages == serial_validation_messages
+
+
+def _document_with_invalid_packages(number_of_packages: int) -> Document:
+    return document_fixture(
+        packages=[
+            package_fixture(spdx_id=f"SPDXRef-Package{index}", homepage="invalid")
+            for index in range(number_of_packages)
+        ]
+    )
+
+
+@pytest.mark.parametrize("max_messages", [0, 1, 5, 100])
+def test_validation_stops_after_max_messages(max_messages):
+    document = _document_with_invalid_packages(10)
+    all_validation_messages: List[ValidationMessage] = validate_full_spdx_document(document)
+
+    validation_messages: List[ValidationMessage] = validate_full_spdx_document(document, max_messages=max_messages)
+
+    assert validation_messages == all_validation_messages[:max_messages]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_fail_fast_validation_returns_the_first_message(workers):
+    document = _document_with_invalid_packages(10)
+    all_validation_messages: List[ValidationMessage] = validate_full_spdx_document(document)
+
+    validation_messages: List[ValidationMessage] = validate_full_spdx_document(
+        document, workers=workers, fail_fast=True
+    )
+
+    assert validation_messages == all_validation_messages[:1]
+
+
+def test_iter_validation_messages_skips_the_remaining_validation():
+    document = _document_with_invalid_packages(10)
+
+    with mock.patch(
+        "spdx_tools.spdx.validation.document_validator.validate_package_within_document",
+        wraps=validate_package_within_document,
+    ) as validate_package_mock:
+        first_validation_message = next(iter_validation_messages(document))
+
+    assert first_validation_message.context.spdx_id == "SPDXRef-Package0"
+    validate_package_mock.assert_called_once()
@@ -11,11 +11,17 @@ from license_expression import LicenseExpression
 from spdx_tools.common.spdx_licensing import spdx_licensing
 from spdx_tools.spdx.model import Document, SpdxNoAssertion, SpdxNone
 from spdx_tools.spdx.validation.license_expression_validator import (
+    get_invalid_symbols_and_parse_error,
     validate_license_expression,
     validate_license_expressions,
 )
 from spdx_tools.spdx.validation.validation_message import SpdxElementType, ValidationContext, ValidationMessage
-from tests.spdx.fixtures import document_fixture, external_document_ref_fixture, extracted_licensing_info_fixture
+from tests.spdx.fixtures import (
+    creation_info_fixture,
+    document_fixture,
+    external_document_ref_fixture,
+    extracted_licensing_info_fixture,
+)
 
 FIXTURE_LICENSE_ID = extracted_licensing_info_fixture().license_id
 EXTERNAL_DOCUMENT_ID = external_document_ref_fixture().document_ref_id
@@ -173,3 +179,40 @@ def test_invalid_license_expression_with_external_reference(expression_string, e
     expected_messages = [ValidationMessage(expected_message, context)]
 
     assert validation_messages == expected_messages
+
+
+def test_license_expression_validation_cache():
+    get_invalid_symbols_and_parse_error.cache_clear()
+    unknown_license_ref = spdx_licensing.parse(f"MIT and LicenseRef-unknown and {EXTERNAL_DOCUMENT_ID}:LicenseRef-1")
+
+    assert get_invalid_symbols_and_parse_error(str(spdx_licensing.parse("MIT"))) == ((), None)
+    assert get_invalid_symbols_and_parse_error(str(spdx_licensing.parse("MIT"))) == ((), None)
+    assert get_invalid_symbols_and_parse_error(str(unknown_license_ref)) == (
+        ("LicenseRef-unknown", f"{EXTERNAL_DOCUMENT_ID}:LicenseRef-1"),
+        None,
+    )
+    invalid_symbols, parse_error = get_invalid_symbols_and_parse_error(str(spdx_licensing.parse("MIT with MIT")))
+    assert invalid_symbols == ()
+    assert parse_error.startswith("A plain license symbol cannot be used as an exception")
+    cache_info = get_invalid_symbols_and_parse_error.cache_info()
+    assert (cache_info.hits, cache_info.misses, cache_info.currsize) == (1, 3, 3)
+
+
+def test_cached_validation_checks_document_specific_references():
+    license_expression = spdx_licensing.parse(f"{FIXTURE_LICENSE_ID} or DocumentRef-other:LicenseRef-1")
+    document_with_references: Document = document_fixture(
+        creation_info=creation_info_fixture(
+            external_document_refs=[external_document_ref_fixture(document_ref_id="DocumentRef-other")]
+        )
+    )
+    document_without_references: Document = document_fixture(extracted_licensing_info=[])
+
+    assert validate_license_expression(license_expression, document_with_references, "SPDXRef-File") == []
+    validation_messages = validate_license_expression(license_expression, document_without_references, "SPDXRef-File")
+
+    assert [validation_message.validation_message for validation_message in validation_messages] == [
+        f"Unrecognized license reference: {FIXTURE_LICENSE_ID}. license_expression must only use IDs from the license "
+        f"list or extracted licensing info, but is: {license_expression}",
+        'Did not find the external document reference "DocumentRef-other" in the SPDX document. From the external '
+        "license reference DocumentRef-other:LicenseRef-1.",
+    ]
@@ -32,12 +32,12 @@ def test_write_json(temporary_file_path: str):
     assert written_json == expected_json
 
 
-def test_document_is_validated():
+def test_document_is_validated(temporary_file_path: str):
     document = document_fixture()
     document.creation_info.spdx_id = "InvalidId"
 
     with pytest.raises(ValueError) as error:
-        write_document_to_file(document, "dummy_path")
+        write_document_to_file(document, temporary_file_path)
     assert "Document is not valid" in error.value.args[0]
 
 